@@ -7,6 +7,7 @@ from .common import Object, PolicyRule  # noqa: E402, F401
 from .convert import fromjsonstr, tojsonstr, fromxmlstr, toxmlstr  # noqa: E402, F401
 from .exception import CTERAException  # noqa: E402, F401
 from .object import GlobalAdmin, ServicesPortal, Gateway, Agent  # noqa: E402, F401
+from .object import AsyncGlobalAdmin, AsyncServicesPortal, AsyncGateway  # noqa: E402, F401
 from .core import query  # noqa: E402, F401
 from .edge import types as gateway_types  # noqa: E402, F401
 from .edge import enum as gateway_enum  # noqa: E402, F401
@@ -0,0 +1,9 @@
+__all__ = list(
+    map(
+        str,
+        [
+            'core',
+            'edge'
+        ]
+    )
+)
@@ -0,0 +1,16 @@
+__all__ = list(
+    map(
+        str,
+        [
+            'decorator',
+            'devices',
+            'login',
+            'logs',
+            'portals',
+            'query',
+            'remote',
+            'session',
+            'users'
+        ]
+    )
+)
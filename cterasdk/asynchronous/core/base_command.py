@@ -0,0 +1,8 @@
+class BaseCommand:
+    """ Base class for all asynchronous Portal API classes """
+
+    def __init__(self, portal):
+        self._portal = portal
+
+    def session(self):
+        return self._portal.session()
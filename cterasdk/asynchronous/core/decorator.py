@@ -0,0 +1,23 @@
+import functools
+import logging
+
+
+def update_current_tenant(function):
+
+    @functools.wraps(function)
+    async def call_and_update_current_tenant(self, *args):
+        ret = None
+        path = args[0]
+        if path == '/currentPortal':
+            tenant = args[1]
+            logging.getLogger().debug('Updating current tenant. %s', {'tenant': tenant})
+            session = self.session()
+            if not session.is_local_auth():  # Skip calling the function if using local authentication
+                ret = await function(self, *args)
+            self.session().update_tenant(tenant)
+            logging.getLogger().debug('Updated current tenant. %s', {'tenant': tenant})
+        else:
+            ret = await function(self, *args)
+        return ret
+
+    return call_and_update_current_tenant
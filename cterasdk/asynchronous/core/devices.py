@@ -0,0 +1,67 @@
+from .base_command import BaseCommand
+from . import query, remote
+from ...core.devices import Devices as SyncDevices
+from ...core.query import QueryParamBuilder
+from ...common import union
+from ...lib import Projection
+from ...exception import CTERAException
+
+
+class Devices(BaseCommand):
+    """ Portal Devices APIs """
+
+    async def device(self, device_name, tenant=None, include=None):
+        """
+        Get a Device by its name
+
+        :param str device_name: Name of the device to retrieve
+        :param str,optional tenant: Tenant of the device, defaults to the tenant in the current session
+        :param list[str],optional include: List of fields to retrieve, defaults to ['name', 'portal', 'deviceType']
+
+        :return: Managed Device
+        :rtype: cterasdk.object.AsyncGateway.AsyncGateway or cterasdk.common.object.Object
+        """
+        projection = Projection(include, SyncDevices.default)
+
+        session = self._portal.session()
+        if not tenant:
+            if not session.in_tenant_context():
+                raise CTERAException('You must specify a tenant name or browse the tenant first.')
+            tenant = session.tenant()
+        if session.is_local_auth():
+            url = '/devices/' + device_name
+        else:
+            url = '/portals/%s/devices/%s' % (tenant, device_name)
+
+        dev = projection.enforce(await self._portal.get_multi(url, projection.paths))
+        if dev.name is None:
+            raise CTERAException('Device not found', None, tenant=tenant, device=device_name)
+
+        return remote.remote_command(self._portal, dev)
+
+    async def devices(self, include=None, allPortals=False, filters=None, user=None, prefetch=None, parallel=None):
+        """
+        Get Devices
+
+        :param list[str],optional include: List of fields to retrieve, defaults to ['name', 'portal', 'deviceType']
+        :param bool,optional allPortals: Search in all portals, defaults to False
+        :param list[],optional filters: List of additional filters, defaults to None
+        :param cterasdk.core.types.UserAccount user: User account of the device owner
+        :param int,optional prefetch: Number of pages to fetch ahead, defaults to ``config.iterator['prefetch']``
+        :param int,optional parallel: Number of pages to fetch concurrently, defaults to ``config.iterator['parallel']``
+
+        :return: Asynchronous generator of all matching Devices
+        """
+        include = union(include or [], SyncDevices.default)
+        builder = QueryParamBuilder().include(include).allPortals(allPortals)
+        filters = filters or []
+        for query_filter in filters:
+            builder.addFilter(query_filter)
+        if user:
+            uid = (await self._portal.users.get(user, ['uid'])).uid
+            builder.ownedBy(uid)
+        builder.orFilter((len(filters) > 1))
+        param = builder.build()
+        async with query.iterator(self._portal, '/devices', param, prefetch=prefetch, parallel=parallel) as iterator:
+            async for dev in iterator:
+                yield remote.remote_command(self._portal, dev)
@@ -0,0 +1,36 @@
+from .base_command import BaseCommand
+from ...core import enum
+from ...core.logs import Logs as SyncLogs
+from ...lib import AsyncIterator
+
+
+class Logs(BaseCommand):
+    """
+    Portal Logs APIs
+    """
+
+    def get(self, topic=enum.LogTopic.System, min_severity=enum.Severity.INFO, origin_type=enum.OriginType.Portal, origin=None,
+            before=None, after=None, filters=None, prefetch=None):
+        """
+        Get logs from the Portal
+
+        :param cterasdk.core.enum.LogTopic,optional topic: Log topic to get, defaults to cterasdk.core.enum.LogTopic.System
+        :param cterasdk.core.enum.Severity,optional min_severity:
+         Minimun severity of logs to get, defaults to cterasdk.core.enum.Severity.INFO
+        :param cterasdk.core.enum.OriginType,optional origin_type:
+         Origin type of the logs to get, defaults to cterasdk.core.enum.OriginType.Portal
+        :param str,optional origin: Log origin (e.g. device name, Portal server name), defaults to None
+        :param str,optional before: Get logs before this date (in format "%m/%d/%Y %H:%M:%S"), defaults to None
+        :param str,optional after: Get logs after this date (in format "%m/%d/%Y %H:%M:%S"), defaults to None
+        :param list[cterasdk.core.query.FilterBuilder],optional filters: List of additional filters, defaults to None
+        :param int,optional prefetch: Number of pages to fetch ahead, defaults to ``config.iterator['prefetch']``
+
+        :return: Asynchronous iterator for all matching logs
+        :rtype: cterasdk.lib.iterator.AsyncIterator[cterasdk.object.Object]
+        """
+        param = SyncLogs._query_param(topic, min_severity, origin_type, origin, before, after, filters)  # pylint: disable=protected-access
+        return AsyncIterator(self._query_logs, param, prefetch)
+
+    async def _query_logs(self, param):
+        response = await self._portal.execute('', 'queryLogs', param)
+        return (response.hasMore, response.logs)
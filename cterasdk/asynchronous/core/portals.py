@@ -0,0 +1,37 @@
+from .base_command import BaseCommand
+from ...core.portals import Portals as SyncPortals
+from ...exception import CTERAException
+from ...lib import Projection
+
+
+class Portals(BaseCommand):
+    """
+    Global Admin Portals APIs
+    """
+
+    async def get(self, name, include=None):
+        """
+        Get a tenant
+
+        :param str name: Name of the tenant
+        :param list[str] include: List of fields to retrieve, defaults to ['name']
+        """
+        projection = Projection(include, SyncPortals.default)
+        tenant = projection.enforce(await self._portal.get_multi('/portals/' + name, projection.paths))
+        if tenant.name is None:
+            raise CTERAException('Could not find tenant', None, name=name)
+        return tenant
+
+    async def browse(self, tenant):
+        """
+        Browse a tenant
+
+        :param str tenant: Name of the tenant to browse
+        """
+        await self._portal.put('/currentPortal', tenant)
+
+    async def browse_global_admin(self):
+        """
+        Browse the Global Admin
+        """
+        await self.browse('')
@@ -0,0 +1,25 @@
+import functools
+
+from ...lib import AsyncIterator, AsyncParallelIterator, Projection
+from ...convert import tojsonstr
+from ... import config
+
+
+async def query(CTERAHost, path, param, compact=False):
+    response = await CTERAHost.db(path, 'query', param, compact=compact)
+    include = getattr(param, 'include', None)
+    return (response.hasMore, Projection(include).enforce(response.objects) if include else response.objects)
+
+
+async def show(CTERAHost, path, param):
+    hasMore, objects = await query(CTERAHost, path, param)
+    print(tojsonstr(objects, no_log=False))
+    return hasMore
+
+
+def iterator(CTERAHost, path, param, compact=False, prefetch=None, parallel=None, ordered=None):
+    function = functools.partial(query, CTERAHost, path, compact=compact)
+    parallel = config.iterator['parallel'] if parallel is None else parallel
+    if parallel > 1:
+        return AsyncParallelIterator(function, param, parallel, config.iterator['ordered'] if ordered is None else ordered)
+    return AsyncIterator(function, param, prefetch)
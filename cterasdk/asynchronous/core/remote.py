@@ -0,0 +1,10 @@
+from ...core.enum import DeviceType
+from ...object.AsyncGateway import AsyncGateway
+
+
+def remote_command(Portal, device):
+    if device.deviceType in DeviceType.Gateways:
+        ManagedDevice = AsyncGateway(host=device.name, port=Portal.port(), https=Portal.https(), Portal=Portal)
+        ManagedDevice.__dict__.update(device.__dict__.copy())
+        return ManagedDevice
+    return device
@@ -0,0 +1,16 @@
+from ...core import session
+from ...lib.session_base import SessionStatus, SessionUser
+from ...core.enum import Role
+
+
+class Session(session.Session):
+
+    async def start(self, ctera_host):
+        self.status = SessionStatus.Initializing
+        tenant = await ctera_host.get('/currentPortal') or Session.Administration
+        if self.local_auth:
+            self.user = SessionUser('$admin', tenant=tenant, role=Role.ReadWriteAdmin)
+        else:
+            current_session = await ctera_host.get('/currentSession')
+            self.user = SessionUser(current_session.username, tenant=tenant, role=current_session.role)
+        self.status = SessionStatus.Active
@@ -0,0 +1,10 @@
+__all__ = list(
+    map(
+        str,
+        [
+            'config',
+            'login',
+            'session'
+        ]
+    )
+)
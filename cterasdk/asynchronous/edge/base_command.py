@@ -0,0 +1,8 @@
+class BaseCommand:
+    """ Base class for all asynchronous Gateway API classes """
+
+    def __init__(self, gateway):
+        self._gateway = gateway
+
+    def session(self):
+        return self._gateway.session()
@@ -0,0 +1,43 @@
+import logging
+
+from .base_command import BaseCommand
+
+
+class Config(BaseCommand):
+    """ General gateway configuraion """
+
+    async def get_location(self):
+        """
+        Get the location of the gateway
+
+        :return str: The location of the gateway
+        """
+        return await self._gateway.get('/config/device/location')
+
+    async def set_location(self, location):
+        """
+        Set the location of the gateway
+
+        :param str location: New location to set
+        :return str: The new location
+        """
+        logging.getLogger().info('Configuring device location. %s', {'location': location})
+        return await self._gateway.put('/config/device/location', location)
+
+    async def get_hostname(self):
+        """
+        Get the hostname of the gateway
+
+        :return str: The hostname of the gateway
+        """
+        return await self._gateway.get('/config/device/hostname')
+
+    async def set_hostname(self, hostname):
+        """
+        Set the hostname of the gateway
+
+        :param str hostname: New hostname to set
+        :return str: The new hostname
+        """
+        logging.getLogger().info('Configuring device hostname. %s', {'hostname': hostname})
+        return await self._gateway.put('/config/device/hostname', hostname)
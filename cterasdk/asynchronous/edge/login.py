@@ -0,0 +1,26 @@
+import logging
+
+from ...exception import CTERAException
+from .base_command import BaseCommand
+
+
+class Login(BaseCommand):
+
+    async def info(self):
+        """
+        Get login info
+        """
+        return await self._gateway.get('/nosession/logininfo')
+
+    async def login(self, username, password):
+        host = self._gateway.host()
+        try:
+            await self._gateway.form_data('/login', {'username': username, 'password': password})
+            logging.getLogger().info("User logged in. %s", {'host': host, 'user': username})
+        except CTERAException as error:
+            logging.getLogger().error("Login failed. %s", {'host': host, 'user': username})
+            raise error
+
+    async def logout(self):
+        await self._gateway.form_data('/logout', {'foo': 'bar'})
+        logging.getLogger().info("User logged out. %s", {'host': self._gateway.host()})
@@ -0,0 +1,11 @@
+from ...edge import session
+from ...lib.session_base import SessionStatus
+
+
+class Session(session.Session):
+
+    async def start(self, ctera_host):
+        self.status = SessionStatus.Initializing
+        user = await ctera_host.get('currentuser')
+        self._activate(session.SessionType.Local, user.username)
+        self.status = SessionStatus.Active
@@ -1 +1,3 @@
 from .host import NetworkHost, CTERAHost, authenticated  # noqa: E402, F401
+from .async_host import AsyncCTERAHost  # noqa: E402, F401
+from .ratelimit import RateLimiter, RateLimit  # noqa: E402, F401
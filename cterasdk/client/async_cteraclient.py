@@ -0,0 +1,134 @@
+import functools
+
+from .http import ContentType, geturi
+from .async_http import AsyncHTTPClient, AsyncHTTPException
+from ..convert import XMLStreamDecoder, toxmlstr
+from ..exception import CTERAClientException
+from ..lib import Command
+from ..common import Object
+
+
+class AsyncCTERAClient:  # pylint: disable=too-many-public-methods
+    """
+    Asynchronous counterpart of :class:`cterasdk.client.cteraclient.CTERAClient`.
+    Requests and responses use the same XML wire format, every method is a coroutine.
+    """
+
+    idempotent_db_methods = ['get-multi', 'query']
+    chunk_size = 65536
+
+    def __init__(self, session_id_key):
+        self.http_client = AsyncHTTPClient(session_id_key)
+        self.limiter = None
+
+    async def get(self, baseurl, path, params=None):
+        function = Command(AsyncHTTPClient.get, self.http_client, geturi(baseurl, path), params if params else {})
+        return await self._request('get', path, function)
+
+    async def download(self, baseurl, path, params):
+        function = Command(AsyncHTTPClient.get, self.http_client, geturi(baseurl, path), params, None, True)
+        return await self._request('download', path, function, return_function=AsyncCTERAClient.file_descriptor)
+
+    async def download_zip(self, baseurl, path, form_data):
+        function = Command(AsyncHTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.urlencoded, form_data, True)
+        return await self._request('download_zip', path, function, return_function=AsyncCTERAClient.file_descriptor)
+
+    async def get_multi(self, baseurl, path, paths):
+        return await self.db(baseurl, path, "get-multi", paths)
+
+    async def put(self, baseurl, path, data):
+        function = Command(AsyncHTTPClient.put, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(data))
+        return await self._request('put', path, function)
+
+    async def post(self, baseurl, path, data):
+        function = Command(AsyncHTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(data))
+        return await self._request('post', path, function)
+
+    async def form_data(self, baseurl, path, form_data):
+        function = Command(AsyncHTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.urlencoded, form_data, True)
+        return await self._request('form_data', path, function)
+
+    async def execute(self, baseurl, path, name, param=None):
+        return await self._ctera_exec(baseurl, path, 'user-defined', name, param)
+
+    async def delete(self, baseurl, path):
+        function = Command(AsyncHTTPClient.delete, self.http_client, geturi(baseurl, path))
+        return await self._request('delete', path, function)
+
+    async def mkcol(self, baseurl, path):
+        function = Command(AsyncHTTPClient.mkcol, self.http_client, geturi(baseurl, path))
+        return await self._request('mkcol', path, function)
+
+    async def copy(self, baseurl, src, dest, overwrite):
+        function = Command(AsyncHTTPClient.copy, self.http_client, geturi(baseurl, src), geturi(baseurl, dest), overwrite)
+        return await self._request('copy', src, function)
+
+    async def move(self, baseurl, src, dest, overwrite):
+        function = Command(AsyncHTTPClient.move, self.http_client, geturi(baseurl, src), geturi(baseurl, dest), overwrite)
+        return await self._request('move', src, function)
+
+    async def db(self, baseurl, path, name, param, compact=False):
+        return await self._ctera_exec(baseurl, path, 'db', name, param, compact)
+
+    async def multipart(self, baseurl, path, form_data):
+        function = Command(AsyncHTTPClient.multipart, self.http_client, geturi(baseurl, path), form_data)
+        return await self._request('multipart', path, function)
+
+    async def upload(self, baseurl, path, form_data):
+        function = Command(AsyncHTTPClient.upload, self.http_client, geturi(baseurl, path), form_data)
+        return await self._request('upload', path, function)
+
+    async def _ctera_exec(self, baseurl, path, exec_type, name, param, compact=False):
+        obj = Object()
+        obj.type = exec_type
+        obj.name = name
+        obj.param = param
+        idempotent = exec_type == 'db' and name in AsyncCTERAClient.idempotent_db_methods
+        function = Command(AsyncHTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(obj),
+                           False, idempotent)
+        return_function = functools.partial(AsyncCTERAClient.fromxmlstr, compact=True) if compact else None
+        return await self._request(name, path, function, return_function=return_function)
+
+    async def close(self):
+        await self.http_client.close()
+
+    def circuit_state(self, baseurl):
+        return self.http_client.circuit_state(baseurl)
+
+    def get_session_id(self):
+        return self.http_client.get_session_id()
+
+    def set_session_id(self, session_id):
+        self.http_client.set_session_id(session_id)
+
+    def set_authorization_headers(self, headers):
+        self.http_client.set_custom_headers(headers)
+
+    @staticmethod
+    async def fromxmlstr(_request, response, compact=False):
+        decoder = XMLStreamDecoder(compact)
+        async with response:  # decode the response as it is received
+            async for chunk in response.content.iter_chunked(AsyncCTERAClient.chunk_size):
+                decoder.feed(chunk)
+        return decoder.close()
+
+    @staticmethod
+    async def file_descriptor(_request, response):
+        return response
+
+    async def _request(self, verb, path, function, return_function=None):
+        if self.limiter is None:
+            return await AsyncCTERAClient._execute(function, return_function)
+        async with self.limiter.async_limit(verb, path):
+            return await AsyncCTERAClient._execute(function, return_function)
+
+    @staticmethod
+    async def _execute(function, return_function=None):
+        return_function = return_function or AsyncCTERAClient.fromxmlstr
+        try:
+            request, response = await function()
+            return await return_function(request, response)
+        except AsyncHTTPException as http_error:
+            client_error = CTERAClientException()
+            client_error.__dict__ = http_error.__dict__.copy()
+            raise client_error
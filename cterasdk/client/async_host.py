@@ -0,0 +1,242 @@
+import functools
+import logging
+
+from ..convert import tojsonstr
+from ..lib.projection import Projection
+from ..exception import CTERAException
+from .host import NetworkHost
+from .async_cteraclient import AsyncCTERAClient
+
+
+def authenticated(function):
+    @functools.wraps(function)
+    async def check_authenticated_and_call(self, *args, **kwargs):
+        if self._is_authenticated(function, *args, **kwargs):  # pylint: disable=protected-access
+            return await function(self, *args, **kwargs)
+        logging.getLogger().error('Not logged in.')
+        raise CTERAException('Not logged in')
+
+    return check_authenticated_and_call
+
+
+class AsyncCTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
+    """
+    Asynchronous counterpart of :class:`cterasdk.client.host.CTERAHost`.
+
+    Use as an asynchronous context manager, or call :func:`close` when done, to release the underlying connections.
+    """
+
+    def __init__(self, host, port, https):
+        super().__init__(host, port, https)
+        self._ctera_client = AsyncCTERAClient(self._session_id_key)
+        self._session = None
+
+    @property
+    def _omit_fields(self):
+        return super()._omit_fields + [
+            'login',
+            'logout'
+        ]
+
+    @property
+    def base_api_url(self):
+        raise NotImplementedError("Implementing class must implement the base_api_url property")
+
+    @property
+    def base_file_url(self):
+        raise NotImplementedError("Implementing class must implement the base_api_url property")
+
+    @property
+    def _login_object(self):
+        raise NotImplementedError(
+            "Implementing class must implement the login_object property by returning an object with login and logout methods"
+        )
+
+    @property
+    def _session_id_key(self):
+        raise NotImplementedError("Implementing class must implement the _session_id_key property")
+
+    def _is_authenticated(self, function, *args, **kwargs):
+        raise NotImplementedError("Implementing class must implement the _is_authenticated method")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """ Close the underlying HTTP session """
+        await self._ctera_client.close()
+
+    async def login(self, username, password):
+        """
+        Log in
+
+        :param str username: User name to log in
+        :param str password: User password
+        """
+        await self._login_object.login(username, password)
+        await self._session.start(self)
+
+    async def logout(self):
+        """ Log out """
+        await self._login_object.logout()
+        self._session.terminate()
+
+    def session(self):
+        return self._session
+
+    def register_session(self, session):
+        self._session = session
+
+    async def default_class(self, name):
+        return await self.get('/defaults/' + name)
+
+    @authenticated
+    async def get(self, path, params=None, use_file_url=False, include=None):
+        """
+        Retrieve a schema object as a Python object.
+
+        :param list[str],optional include: Retrieve only these fields of the object, using ``get_multi``, defaults to the entire object
+        """
+        if include:
+            projection = Projection(include)
+            return projection.enforce(await self.get_multi(path, projection.paths, use_file_url=use_file_url))
+        return await self._ctera_client.get(self.base_file_url if use_file_url else self.base_api_url, path, params or {})
+
+    @authenticated
+    async def openfile(self, path, params=None, use_file_url=False):
+        return await self._ctera_client.download(self.base_file_url if use_file_url else self.base_api_url, path, params or {})
+
+    @authenticated
+    async def download_zip(self, path, form_data, use_file_url=False):
+        return await self._ctera_client.download_zip(self.base_file_url if use_file_url else self.base_api_url, path, form_data)
+
+    @authenticated
+    async def get_multi(self, path, paths, use_file_url=False):
+        """ Retrieve one or more schema objects as a Python object. """
+        return await self._ctera_client.get_multi(self.base_file_url if use_file_url else self.base_api_url, path, paths)
+
+    @authenticated
+    async def put(self, path, value, use_file_url=False):
+        """ Update a schema object or attribute. """
+        response = await self._ctera_client.put(self.base_file_url if use_file_url else self.base_api_url, path, value)
+        logging.getLogger().debug('Configuration changed. %s', {'url': path, 'value': tojsonstr(value, pretty_print=False)})
+        return response
+
+    @authenticated
+    async def post(self, path, value, use_file_url=False):
+        response = await self._ctera_client.post(self.base_file_url if use_file_url else self.base_api_url, path, value)
+        logging.getLogger().debug('Added. %s', {'url': path, 'value': tojsonstr(value, pretty_print=False)})
+        return response
+
+    async def form_data(self, path, form_data, use_file_url=False):
+        return await self._ctera_client.form_data(self.base_file_url if use_file_url else self.base_api_url, path, form_data)
+
+    @authenticated
+    async def db(self, path, name, param, use_file_url=False, compact=False):
+        baseurl = self.base_file_url if use_file_url else self.base_api_url
+        response = await self._ctera_client.db(baseurl, path, name, param, compact)
+        logging.getLogger().debug(
+            'Database method executed. %s',
+            {'url': path, 'name': name, 'param': tojsonstr(param, pretty_print=False)}
+        )
+        return response
+
+    @authenticated
+    async def execute(self, path, name, param=None, use_file_url=False):
+        """ Execute a schema object method. """
+        response = await self._ctera_client.execute(self.base_file_url if use_file_url else self.base_api_url, path, name, param)
+        logging.getLogger().debug(
+            'User-defined method executed. %s',
+            {'url': path, 'name': name, 'param': tojsonstr(param, pretty_print=False)}
+        )
+        return response
+
+    @authenticated
+    async def add(self, path, param, use_file_url=False):
+        """ Add a schema object. """
+        return await self.db(path, 'add', param, use_file_url=use_file_url)
+
+    @authenticated
+    async def delete(self, path, use_file_url=False):
+        """ Delete a schema object. """
+        response = await self._ctera_client.delete(self.base_file_url if use_file_url else self.base_api_url, path)
+        logging.getLogger().debug('Deleted. %s', {'url': path})
+        return response
+
+    @authenticated
+    async def mkcol(self, path, use_file_url=False):
+        return await self._ctera_client.mkcol(self.base_file_url if use_file_url else self.base_api_url, path)
+
+    @authenticated
+    async def copy(self, src, dest, overwrite, use_file_url=False):
+        return await self._ctera_client.copy(self.base_file_url if use_file_url else self.base_api_url, src, dest, overwrite)
+
+    @authenticated
+    async def move(self, src, dest, overwrite, use_file_url=False):
+        return await self._ctera_client.move(self.base_file_url if use_file_url else self.base_api_url, src, dest, overwrite)
+
+    @authenticated
+    async def multipart(self, path, form_data, use_file_url=False):
+        return await self._ctera_client.multipart(self.base_file_url if use_file_url else self.base_api_url, path, form_data)
+
+    @authenticated
+    async def upload(self, path, form_data, use_file_url=False):
+        return await self._ctera_client.upload(self.base_file_url if use_file_url else self.base_api_url, path, form_data)
+
+    def set_rate_limiter(self, limiter):
+        """
+        Limit the rate of requests sent to this host.
+        A rate limiter may be shared by several objects, threads and asyncio tasks
+
+        :param cterasdk.client.ratelimit.RateLimiter limiter: Rate limiter, or ``None`` to remove the rate limiter
+        """
+        self._ctera_client.limiter = limiter
+
+    def circuit_state(self):
+        """
+        Get the state of the circuit breaker of this host.
+        Use to skip unreachable hosts without waiting for a request to time out
+
+        :return: Circuit state, failures and the time remaining until the next probe is allowed, in seconds
+        :rtype: cterasdk.common.object.Object
+        """
+        return self._ctera_client.circuit_state(self.base_api_url)
+
+    @authenticated
+    async def get_session_id(self):
+        """
+        Get the id of the current session
+
+        :return str: Current session id
+        """
+        return self._ctera_client.get_session_id()
+
+    async def set_session_id(self, session_id):
+        """
+        Start a session with the session id instead of logging in
+
+        :param str session_id: Session id for the new session
+        """
+        self._ctera_client.set_session_id(session_id)
+        await self._session.start(self)
+
+    async def set_authorization_headers(self, headers):
+        """
+        Start a session using authorization headers id instead of logging in
+
+        :param dict headers: the authorization headers, represented as a key-value str dict
+        """
+        self._ctera_client.set_authorization_headers(headers)
+        self._session.local_auth = True
+        await self._session.start(self)
+
+    def whoami(self):
+        """
+        Return the name of the logged in user.
+
+        :return str: The name of the logged in user
+        """
+        return self._session.whoami()
@@ -0,0 +1,281 @@
+import asyncio
+import urllib.parse
+import logging
+import time
+
+import aiohttp
+
+from ..common import Object, merge
+from ..convert import fromxmlstr
+from .. import config
+from ..exception import SSLException, HostUnreachable, ConnectionTimeout, ExhaustedException
+from ..lib import ask
+from .retry import RetryPolicy
+from .breaker import CircuitBreaker
+from .http import HttpClientRequestGet, HttpClientRequestPost, HttpClientRequestPut, HttpClientRequestDelete, \
+    HttpClientRequestMkcol, HttpClientRequestCopy, HttpClientRequestMove
+
+
+_ConnectionTimeoutError = getattr(aiohttp, 'ConnectionTimeoutError', None)  # aiohttp>=3.10
+
+
+class AsyncHTTPException(Exception):
+
+    def __init__(self, response, text):
+        super().__init__()
+        self.response = Object()
+        self.response.code = response.status
+        self.response.reason = response.reason
+        self.response.body = fromxmlstr(text)
+        if config.http['verbose']:
+            self.response.headers = response.headers
+            self.request = AsyncHTTPException._parse_request(response.request_info)
+
+    @staticmethod
+    def _parse_request(request_info):
+        o = urllib.parse.urlparse(str(request_info.url))
+        target = Object()
+        target.host = Object()
+        target.host.scheme = o.scheme
+        target.host.hostname = o.hostname
+        target.host.port = o.port
+        target.method = request_info.method
+        target.uri = o.path
+        target.headers = request_info.headers
+        return target
+
+
+class AsyncHttpClientBase():
+    """
+    Asynchronous HTTP client, built on an :class:`aiohttp.ClientSession`.
+
+    The underlying session is created on first use, so that it is bound to the running event loop.
+    Call :func:`close` to release its connections.
+    """
+
+    def __init__(self, session_id_key):
+        self.timeout = config.http['timeout']
+        self.retries = config.http['retries']
+        self.retry_policy = RetryPolicy.from_config()
+        self.breaker = CircuitBreaker.from_config()
+        self.ssl_error_handling = config.http['ssl']
+        self.verify = self.ssl_error_handling != 'Trust'
+        self.session = None
+        self._session_id_key = session_id_key
+        self._cookies = {}
+        self._headers = {}
+
+    def _create_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=AsyncHttpClientBase._connector(),
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                timeout=aiohttp.ClientTimeout(sock_connect=self.timeout, sock_read=self.timeout)
+            )
+            if self._cookies:
+                self.session.cookie_jar.update_cookies(self._cookies)
+                self._cookies = {}
+        return self.session
+
+    @staticmethod
+    def _connector():
+        pool = config.http['pool']
+        kwargs = dict(limit=pool['connections'] * pool['maxsize'], limit_per_host=pool['maxsize'])
+        if pool['idle_timeout'] is not None:
+            kwargs['keepalive_timeout'] = pool['idle_timeout']
+        return aiohttp.TCPConnector(**kwargs)
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def dispatch(self, ctera_request):
+        self.breaker.before(ctera_request.url)
+        try:
+            response = await self._dispatch(ctera_request)
+        except (HostUnreachable, ConnectionTimeout):
+            self.breaker.failure(ctera_request.url)
+            raise
+        except AsyncHTTPException as error:
+            if error.response.code in self.breaker.statuses:
+                self.breaker.failure(ctera_request.url)
+            else:
+                self.breaker.success(ctera_request.url)
+            raise
+        except BaseException:
+            self.breaker.release(ctera_request.url)
+            raise
+        self.breaker.success(ctera_request.url)
+        return response
+
+    async def _dispatch(self, ctera_request):
+        attempt = 0
+        start = time.monotonic()
+        while True:
+            try:
+                response = await self._do_dispatch(ctera_request)
+            except aiohttp.ClientSSLError as error:
+                await self.on_ssl_error(error.host, error.port)
+                attempt = -1
+            except aiohttp.ClientConnectorError as error:
+                self._on_unreachable(error, ctera_request.url)
+            except (aiohttp.ServerTimeoutError, asyncio.TimeoutError) as error:
+                self.on_timeout(attempt)
+                safe = self._connect_timeout(error)
+                if not (self.retry_policy.retryable(ctera_request, safe) and await self.retry_policy.async_wait(attempt, start)):
+                    break
+            except aiohttp.ClientError as error:
+                logging.getLogger().warning(error)
+                if not (self.retry_policy.retryable(ctera_request) and await self.retry_policy.async_wait(attempt, start)):
+                    break
+            else:
+                if response.status < 400:
+                    return (response.request_info, response)
+                text = await response.text()
+                response.release()
+                if not await self._retry_status(ctera_request, response, attempt, start):
+                    raise AsyncHTTPException(response, text)
+            attempt = attempt + 1
+        logging.getLogger().error('Reached maximum number of retries. %s', {'retries': attempt + 1, 'timeout': self.timeout})
+        raise ExhaustedException(attempt + 1, self.timeout)
+
+    async def _do_dispatch(self, ctera_request):
+        session = self._create_session()
+        return await session.request(ctera_request.method, ctera_request.url, **self._request_kwargs(ctera_request))
+
+    async def _retry_status(self, ctera_request, response, attempt, start):
+        if not self.retry_policy.retryable_status(ctera_request, response.status):
+            return False
+        logging.getLogger().warning('Service unavailable. %s', {'status': response.status, 'attempt': (attempt + 1)})
+        return await self.retry_policy.async_wait(attempt, start, response.headers.get('Retry-After'))
+
+    def _request_kwargs(self, ctera_request):
+        kwargs = {k: v for k, v in ctera_request.kwargs.items() if k != 'stream' and v is not None}
+        kwargs['headers'] = merge(self._headers, kwargs.get('headers'))
+        if not self.verify:
+            kwargs['ssl'] = False
+        return kwargs
+
+    @staticmethod
+    def _on_unreachable(error, url):
+        parsed_url = urllib.parse.urlparse(url)
+        logging.getLogger().error('Cannot reach target host. %s', {'host': parsed_url.hostname, 'port': parsed_url.port})
+        socket_error = Object()
+        socket_error.message = str(error)
+        raise HostUnreachable(socket_error, parsed_url.hostname, parsed_url.port, parsed_url.scheme.upper())
+
+    @staticmethod
+    def _connect_timeout(error):
+        """
+        Check if a timeout occurred while connecting, before the request was sent.
+
+        :param Exception error: Timeout error
+        :returns: ``True`` if the connection attempt timed out, ``False`` otherwise
+        :rtype: bool
+        """
+        if _ConnectionTimeoutError is not None:
+            return isinstance(error, _ConnectionTimeoutError)
+        return isinstance(error, aiohttp.ServerTimeoutError) and str(error).startswith('Connection timeout')
+
+    @staticmethod
+    def on_timeout(attempt):
+        logging.getLogger().warning('Request timed out. %s', {'attempt': (attempt + 1)})
+
+    async def on_ssl_error(self, host, port):
+        if await self.should_trust(host, port):
+            self.trust(host, port)
+        else:
+            raise SSLException(host, port, 'Cancelled by user')
+
+    async def should_trust(self, host, port):
+        if self.ssl_error_handling == 'Consent':
+            return await asyncio.get_running_loop().run_in_executor(None, ask, 'Proceed to ' + host + ':' + str(port) + '?')
+        raise SSLException(host, port, 'Configuration file requires the use of trusted certificates')
+
+    def trust(self, _host, _port):
+        self.verify = False
+
+    def circuit_state(self, url):
+        """
+        Get the state of the circuit breaker of a URL
+
+        :param str url: URL
+        :return: Circuit state, failures and the time remaining until the next probe is allowed, in seconds
+        :rtype: cterasdk.common.object.Object
+        """
+        return self.breaker.state(url)
+
+    def retry_statistics(self):
+        """
+        Get the retry statistics
+
+        :return: Retry statistics
+        :rtype: cterasdk.common.object.Object
+        """
+        return self.retry_policy.statistics.snapshot()
+
+    def get_session_id(self):
+        if self.session is not None:
+            for cookie in self.session.cookie_jar:
+                if cookie.key == self._session_id_key:
+                    return cookie.value
+            return None
+        return self._cookies.get(self._session_id_key)
+
+    def set_session_id(self, session_id):
+        if self.session is not None and not self.session.closed:
+            self.session.cookie_jar.update_cookies({self._session_id_key: session_id})
+        else:
+            self._cookies[self._session_id_key] = session_id
+
+    def set_custom_headers(self, headers):
+        """
+        Add custom headers that will be included in every http request.
+
+        :param dict headers: the headers, represented as a key-value str dict
+        """
+        self._headers.update(headers)
+
+
+class AsyncHTTPClient(AsyncHttpClientBase):
+
+    async def get(self, url, params=None, headers=None, stream=None):
+        return await self.dispatch(HttpClientRequestGet(url, params=params, headers=headers, stream=stream))
+
+    async def post(self, url, headers=None, data='', urlencode=False, idempotent=False):
+        if urlencode:
+            data = urllib.parse.urlencode(data).encode('utf-8')
+        return await self.dispatch(HttpClientRequestPost(url, headers=headers, data=data, idempotent=idempotent))
+
+    async def put(self, url, headers=None, data=''):
+        return await self.dispatch(HttpClientRequestPut(url, headers=headers, data=data))
+
+    async def delete(self, url, headers=None):
+        return await self.dispatch(HttpClientRequestDelete(url, headers=headers))
+
+    async def mkcol(self, url, headers=None):
+        return await self.dispatch(HttpClientRequestMkcol(url, headers=headers))
+
+    async def copy(self, src, dest, overwrite, headers=None):
+        return await self.dispatch(HttpClientRequestCopy(src, dest, overwrite, headers=headers))
+
+    async def move(self, src, dest, overwrite, headers=None):
+        return await self.dispatch(HttpClientRequestMove(src, dest, overwrite, headers=headers))
+
+    async def multipart(self, url, form_data):
+        return await self.dispatch(HttpClientRequestPost(url, data=AsyncHTTPClient._form_data(form_data)))
+
+    async def upload(self, url, form_data):
+        logging.getLogger().info('Uploading. %s', {'url': url})
+        return await self.multipart(url, form_data)
+
+    @staticmethod
+    def _form_data(form_data):
+        form = aiohttp.FormData()
+        for name, value in form_data.items():
+            if isinstance(value, tuple):
+                filename, fd, content_type = value
+                form.add_field(name, fd, filename=filename, content_type=content_type)
+            else:
+                form.add_field(name, value)
+        return form
@@ -0,0 +1,183 @@
+import logging
+import re
+import threading
+import time
+import urllib.parse
+
+from ..common import Object
+from ..exception import CircuitBreakerOpen
+from .. import config
+
+
+class CircuitState:
+    """
+    Circuit breaker state
+
+    :ivar str Closed: Requests are allowed
+    :ivar str Open: Requests fail fast
+    :ivar str HalfOpen: A limited number of probe requests are allowed
+    """
+    Closed = 'Closed'
+    Open = 'Open'
+    HalfOpen = 'HalfOpen'
+
+
+class Circuit:
+
+    def __init__(self):
+        self.state = CircuitState.Closed
+        self.failures = 0
+        self.opened = None
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Per base URL circuit breaker.
+
+    Devices accessed through the Portal share the Portal's host, so each device has a circuit of its own,
+    keyed by its remote access base URL.
+
+    :param bool enabled: Enable the circuit breaker
+    :param int threshold: Consecutive failures before opening the circuit
+    :param float reset_timeout: Time to wait before probing a host with an open circuit, in seconds
+    :param int probes: Concurrent probe requests allowed while the circuit is half-open
+    :param list[int] statuses: HTTP status codes counted as failures
+    """
+
+    remote_device = re.compile('^/[^/]+/(devicecmdnew/[^/]+/[^/]+|devices/[^/]+)(/|$)')
+
+    def __init__(self, enabled=False, threshold=5, reset_timeout=30, probes=1, statuses=None):
+        self.enabled = enabled
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.probes = probes
+        self.statuses = statuses if statuses is not None else [502, 504]
+        self._lock = threading.Lock()
+        self._circuits = {}
+
+    @staticmethod
+    def from_config():
+        """ Create a circuit breaker from the ``config.http`` settings """
+        return CircuitBreaker(**config.http['breaker'])
+
+    @staticmethod
+    def key(url):
+        """
+        Get the circuit key of a URL
+
+        :param str url: URL
+        :returns: Scheme, host and port, followed by the remote device path if the URL addresses a device via the Portal
+        """
+        o = urllib.parse.urlparse(url)
+        key = '%s://%s' % (o.scheme, o.netloc)
+        match = CircuitBreaker.remote_device.match(o.path)
+        if match:
+            key = key + match.group(0).rstrip('/')
+        return key
+
+    def before(self, url):
+        """
+        Check if a request may be sent
+
+        :param str url: Request URL
+        :raises: cterasdk.exception.CircuitBreakerOpen
+        """
+        if not self.enabled:
+            return
+        key = CircuitBreaker.key(url)
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == CircuitState.Closed:
+                return
+            retry_in = circuit.opened + self.reset_timeout - time.monotonic()
+            if circuit.state == CircuitState.Open and retry_in <= 0:
+                logging.getLogger().debug('Circuit half-open. %s', {'baseurl': key})
+                circuit.state = CircuitState.HalfOpen
+            if circuit.state == CircuitState.HalfOpen and circuit.probes < self.probes:
+                circuit.probes = circuit.probes + 1
+                return
+        o = urllib.parse.urlparse(url)
+        raise CircuitBreakerOpen(o.hostname, o.port, o.scheme.upper(), key, max(0, retry_in))
+
+    def success(self, url):
+        """
+        Record a request that reached the host, and close its circuit
+
+        :param str url: Request URL
+        """
+        if not self.enabled:
+            return
+        key = CircuitBreaker.key(url)
+        with self._lock:
+            circuit = self._circuits.pop(key, None)
+        if circuit is not None and circuit.state != CircuitState.Closed:
+            logging.getLogger().info('Circuit closed. %s', {'baseurl': key})
+
+    def failure(self, url):
+        """
+        Record a request that failed to reach the host
+
+        :param str url: Request URL
+        """
+        if not self.enabled:
+            return
+        key = CircuitBreaker.key(url)
+        with self._lock:
+            circuit = self._circuits.setdefault(key, Circuit())
+            circuit.failures = circuit.failures + 1
+            if circuit.state == CircuitState.HalfOpen:
+                circuit.probes = circuit.probes - 1
+            if circuit.state == CircuitState.HalfOpen or circuit.failures >= self.threshold:
+                if circuit.state != CircuitState.Open:
+                    logging.getLogger().warning('Circuit open. %s', {'baseurl': key, 'failures': circuit.failures})
+                circuit.state = CircuitState.Open
+                circuit.opened = time.monotonic()
+
+    def release(self, url):
+        """
+        Release a probe whose outcome does not indicate the host's availability
+
+        :param str url: Request URL
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            circuit = self._circuits.get(CircuitBreaker.key(url))
+            if circuit is not None and circuit.state == CircuitState.HalfOpen:
+                circuit.probes = circuit.probes - 1
+
+    def state(self, url):
+        """
+        Get the state of the circuit of a URL
+
+        :param str url: URL
+        :returns: Circuit state, failures and the time remaining until the next probe is allowed, in seconds
+        :rtype: cterasdk.common.object.Object
+        """
+        param = Object()
+        param.state = CircuitState.Closed
+        param.failures = 0
+        param.retry_in = 0
+        with self._lock:
+            circuit = self._circuits.get(CircuitBreaker.key(url))
+            if circuit is not None:
+                param.state = circuit.state
+                param.failures = circuit.failures
+                if circuit.state == CircuitState.Open:
+                    param.retry_in = max(0, circuit.opened + self.reset_timeout - time.monotonic())
+                    if param.retry_in == 0:
+                        param.state = CircuitState.HalfOpen
+        return param
+
+    def reset(self, url=None):
+        """
+        Close circuits
+
+        :param str,optional url: URL whose circuit to close, defaults to closing all circuits
+        """
+        with self._lock:
+            if url is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(CircuitBreaker.key(url), None)
@@ -1,5 +1,7 @@
+import functools
+
 from .http import HTTPClient, ContentType, HTTPException, HTTPResponse, geturi
-from ..convert import fromxmlstr, toxmlstr
+from ..convert import fromxmlstr, fromxmlstream, fromdavxml, toxmlstr
 from ..exception import CTERAClientException
 from ..lib import Command
 from ..common import Object
@@ -7,75 +9,95 @@ from ..transcript import transcribe
 from .. import config
 
 
-class CTERAClient:
+class CTERAClient:  # pylint: disable=too-many-public-methods
+
+    idempotent_db_methods = ['get-multi', 'query']
+    chunk_size = 65536
 
     def __init__(self, session_id_key):
         self.http_client = HTTPClient(session_id_key)
+        self.limiter = None
 
     def get(self, baseurl, path, params=None):
         function = Command(HTTPClient.get, self.http_client, geturi(baseurl, path), params if params else {})
-        return self._execute(function)
+        return self._request('get', path, function)
 
-    def download(self, baseurl, path, params):
-        function = Command(HTTPClient.get, self.http_client, geturi(baseurl, path), params, None, True)
-        return self._execute(function, return_function=CTERAClient.file_descriptor)
+    def download(self, baseurl, path, params, headers=None):
+        function = Command(HTTPClient.get, self.http_client, geturi(baseurl, path), params, headers, True)
+        return self._request('download', path, function, return_function=CTERAClient.file_descriptor)
 
     def download_zip(self, baseurl, path, form_data):
         function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.urlencoded, form_data, True)
-        return self._execute(function, return_function=CTERAClient.file_descriptor)
+        return self._request('download_zip', path, function, return_function=CTERAClient.file_descriptor)
 
     def get_multi(self, baseurl, path, paths):
         return self.db(baseurl, path, "get-multi", paths)
 
     def put(self, baseurl, path, data):
         function = Command(HTTPClient.put, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(data))
-        return self._execute(function)
+        return self._request('put', path, function)
 
     def post(self, baseurl, path, data):
         function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(data))
-        return self._execute(function)
+        return self._request('post', path, function)
 
     def form_data(self, baseurl, path, form_data):
         function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.urlencoded, form_data, True)
-        return self._execute(function)
+        return self._request('form_data', path, function)
 
     def execute(self, baseurl, path, name, param=None):
         return self._ctera_exec(baseurl, path, 'user-defined', name, param)
 
     def delete(self, baseurl, path):
         function = Command(HTTPClient.delete, self.http_client, geturi(baseurl, path))
-        return self._execute(function)
+        return self._request('delete', path, function)
 
     def mkcol(self, baseurl, path):
         function = Command(HTTPClient.mkcol, self.http_client, geturi(baseurl, path))
-        return self._execute(function)
+        return self._request('mkcol', path, function)
+
+    def propfind(self, baseurl, path, depth=1):
+        function = Command(HTTPClient.propfind, self.http_client, geturi(baseurl, path), depth)
+        return self._request('propfind', path, function, return_function=CTERAClient.multistatus)
 
     def copy(self, baseurl, src, dest, overwrite):
         function = Command(HTTPClient.copy, self.http_client, geturi(baseurl, src), geturi(baseurl, dest), overwrite)
-        return self._execute(function)
+        return self._request('copy', src, function)
 
     def move(self, baseurl, src, dest, overwrite):
         function = Command(HTTPClient.move, self.http_client, geturi(baseurl, src), geturi(baseurl, dest), overwrite)
-        return self._execute(function)
+        return self._request('move', src, function)
 
-    def db(self, baseurl, path, name, param):
-        return self._ctera_exec(baseurl, path, 'db', name, param)
+    def db(self, baseurl, path, name, param, compact=False):
+        return self._ctera_exec(baseurl, path, 'db', name, param, compact)
 
     def multipart(self, baseurl, path, form_data):
         function = Command(HTTPClient.multipart, self.http_client, geturi(baseurl, path), form_data)
-        return self._execute(function)
+        return self._request('multipart', path, function)
 
     def upload(self, baseurl, path, form_data):
         function = Command(HTTPClient.upload, self.http_client, geturi(baseurl, path), form_data)
-        return self._execute(function)
+        return self._request('upload', path, function)
 
-    def _ctera_exec(self, baseurl, path, exec_type, name, param):
+    def _ctera_exec(self, baseurl, path, exec_type, name, param, compact=False):
         obj = Object()
         obj.type = exec_type
         obj.name = name
         obj.param = param
-        function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(obj))
-        return self._execute(function)
+        idempotent = exec_type == 'db' and name in CTERAClient.idempotent_db_methods
+        function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(obj),
+                           False, idempotent)
+        return_function = functools.partial(CTERAClient.fromxmlstr, compact=True) if compact else None
+        return self._request(name, path, function, return_function=return_function)
+
+    def pool_statistics(self):
+        return self.http_client.pool_statistics()
+
+    def retry_statistics(self):
+        return self.http_client.retry_statistics()
+
+    def circuit_state(self, baseurl):
+        return self.http_client.circuit_state(baseurl)
 
     def get_session_id(self):
         return self.http_client.get_session_id()
@@ -87,11 +109,20 @@ class CTERAClient:
         self.http_client.set_custom_headers(headers)
 
     @staticmethod
-    def fromxmlstr(request, response):
+    def fromxmlstr(request, response, compact=False):
         if not config.transcript['disabled']:
             response = HTTPResponse(response)
             transcribe.transcribe(request, response)
-        return fromxmlstr(response.text)
+            return fromxmlstr(response.text, compact)
+        with response:  # decode the response as it is received
+            return fromxmlstream(response.iter_content(chunk_size=CTERAClient.chunk_size), compact)
+
+    @staticmethod
+    def multistatus(request, response):
+        response = HTTPResponse(response)
+        if not config.transcript['disabled']:
+            transcribe.transcribe(request, response)
+        return fromdavxml(response.text)
 
     @staticmethod
     def file_descriptor(request, response):
@@ -99,6 +130,12 @@ class CTERAClient:
             transcribe.transcribe(request)
         return response
 
+    def _request(self, verb, path, function, return_function=None):
+        if self.limiter is None:
+            return CTERAClient._execute(function, return_function)
+        with self.limiter.limit(verb, path):
+            return CTERAClient._execute(function, return_function)
+
     @staticmethod
     def _execute(function, return_function=None):
         return_function = return_function or CTERAClient.fromxmlstr
@@ -4,6 +4,7 @@ import socket
 
 from ..common import Object
 from ..convert import tojsonstr
+from ..lib.projection import Projection
 from ..exception import HostUnreachable
 from .cteraclient import CTERAClient
 from ..exception import CTERAException
@@ -23,7 +24,7 @@ def authenticated(function):
 class NetworkHost:
     def __init__(self, host, port, https):
         self._host = host
-        self._port = port or 443 if https else 80
+        self._port = port or (443 if https else 80)
         self._https = https
 
     @property
@@ -127,13 +128,20 @@ class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
         return self.get('/defaults/' + name)
 
     @authenticated
-    def get(self, path, params=None, use_file_url=False):
-        """ Retrieve a schema object as a Python object. """
+    def get(self, path, params=None, use_file_url=False, include=None):
+        """
+        Retrieve a schema object as a Python object.
+
+        :param list[str],optional include: Retrieve only these fields of the object, using ``get_multi``, defaults to the entire object
+        """
+        if include:
+            projection = Projection(include)
+            return projection.enforce(self.get_multi(path, projection.paths, use_file_url=use_file_url))
         return self._ctera_client.get(self.base_file_url if use_file_url else self.base_api_url, path, params or {})
 
     @authenticated
-    def openfile(self, path, params=None, use_file_url=False):
-        return self._ctera_client.download(self.base_file_url if use_file_url else self.base_api_url, path, params or {})
+    def openfile(self, path, params=None, use_file_url=False, headers=None):
+        return self._ctera_client.download(self.base_file_url if use_file_url else self.base_api_url, path, params or {}, headers)
 
     @authenticated
     def download_zip(self, path, form_data, use_file_url=False):
@@ -171,8 +179,9 @@ class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
         return self._ctera_client.form_data(self.base_file_url if use_file_url else self.base_api_url, path, form_data)
 
     @authenticated
-    def db(self, path, name, param, use_file_url=False):
-        response = self._ctera_client.db(self.base_file_url if use_file_url else self.base_api_url, path, name, param)
+    def db(self, path, name, param, use_file_url=False, compact=False):
+        baseurl = self.base_file_url if use_file_url else self.base_api_url
+        response = self._ctera_client.db(baseurl, path, name, param, compact)
         logging.getLogger().debug(
             'Database method executed. %s',
             {'url': path, 'name': name, 'param': tojsonstr(param, pretty_print=False)}
@@ -205,6 +214,11 @@ class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
     def mkcol(self, path, use_file_url=False):
         return self._ctera_client.mkcol(self.base_file_url if use_file_url else self.base_api_url, path)
 
+    @authenticated
+    def propfind(self, path, depth=1, use_file_url=False):
+        """ List the properties of a WebDAV resource, and of its members up to ``depth`` """
+        return self._ctera_client.propfind(self.base_file_url if use_file_url else self.base_api_url, path, depth)
+
     @authenticated
     def copy(self, src, dest, overwrite, use_file_url=False):
         return self._ctera_client.copy(self.base_file_url if use_file_url else self.base_api_url, src, dest, overwrite)
@@ -221,6 +235,43 @@ class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
     def upload(self, path, form_data, use_file_url=False):
         return self._ctera_client.upload(self.base_file_url if use_file_url else self.base_api_url, path, form_data)
 
+    def pool_statistics(self):
+        """
+        Get the connection pool statistics of the underlying HTTP client
+
+        :return: Connections created and reused, and the total time spent waiting for a connection
+        :rtype: cterasdk.common.object.Object
+        """
+        return self._ctera_client.pool_statistics()
+
+    def retry_statistics(self):
+        """
+        Get the retry statistics of the underlying HTTP client
+
+        :return: Requests retried and exhausted, and the total time spent waiting between retries
+        :rtype: cterasdk.common.object.Object
+        """
+        return self._ctera_client.retry_statistics()
+
+    def set_rate_limiter(self, limiter):
+        """
+        Limit the rate of requests sent to this host.
+        A rate limiter may be shared by several objects, threads and asyncio tasks
+
+        :param cterasdk.client.ratelimit.RateLimiter limiter: Rate limiter, or ``None`` to remove the rate limiter
+        """
+        self._ctera_client.limiter = limiter
+
+    def circuit_state(self):
+        """
+        Get the state of the circuit breaker of this host.
+        Use to skip unreachable hosts without waiting for a request to time out
+
+        :return: Circuit state, failures and the time remaining until the next probe is allowed, in seconds
+        :rtype: cterasdk.common.object.Object
+        """
+        return self._ctera_client.circuit_state(self.base_api_url)
+
     @authenticated
     def get_session_id(self):
         """
@@ -1,5 +1,6 @@
 import urllib.parse
 import logging
+import time
 
 import requests
 import requests.exceptions as requests_exceptions
@@ -9,8 +10,11 @@ from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
 from ..convert import fromxmlstr
 from ..common import Object, merge
 from .. import config
-from ..exception import SSLException, HostUnreachable, ExhaustedException
+from ..exception import SSLException, HostUnreachable, ConnectionTimeout, ExhaustedException
 from ..lib import ask
+from .pool import PoolStatistics, PooledHTTPAdapter
+from .retry import RetryPolicy
+from .breaker import CircuitBreaker
 
 
 class HTTPException(Exception):
@@ -80,20 +84,49 @@ class HttpClientBase():
     def __init__(self, session_id_key):
         self.timeout = config.http['timeout']
         self.retries = config.http['retries']
+        self.retry_policy = RetryPolicy.from_config()
+        self.breaker = CircuitBreaker.from_config()
         self.ssl_error_handling = config.http['ssl']
         self.session = requests.Session()
         self.session.verify = self.ssl_error_handling != 'Trust'
+        self.statistics = PoolStatistics()
+        for scheme in ['http://', 'https://']:
+            self.session.mount(scheme, PooledHTTPAdapter(self.statistics, **config.http['pool']))
         self._session_id_key = session_id_key
 
     def dispatch(self, ctera_request):
+        self.breaker.before(ctera_request.url)
+        try:
+            response = self._dispatch(ctera_request)
+        except (HostUnreachable, ConnectionTimeout):
+            self.breaker.failure(ctera_request.url)
+            raise
+        except HTTPException as error:
+            if error.response.code in self.breaker.statuses:
+                self.breaker.failure(ctera_request.url)
+            else:
+                self.breaker.success(ctera_request.url)
+            raise
+        except BaseException:
+            self.breaker.release(ctera_request.url)
+            raise
+        self.breaker.success(ctera_request.url)
+        return response
+
+    def _dispatch(self, ctera_request):
         attempt = 0
-        while attempt < self.retries:
+        start = time.monotonic()
+        while True:
             try:
                 return self._do_dispatch(ctera_request)
             except requests_exceptions.HTTPError as error:
-                raise HTTPException(error)
-            except requests_exceptions.Timeout:
+                if not self._retry_status(ctera_request, error.response, attempt, start):
+                    raise HTTPException(error)
+            except requests_exceptions.Timeout as error:
                 self.on_timeout(attempt)
+                safe = isinstance(error, requests_exceptions.ConnectTimeout)
+                if not (self.retry_policy.retryable(ctera_request, safe) and self.retry_policy.wait(attempt, start)):
+                    break
             except requests_exceptions.SSLError as error:
                 self.on_ssl_error(error.request)
                 attempt = -1
@@ -101,12 +134,24 @@ class HttpClientBase():
                 self._on_unreachable(error)
             except requests_exceptions.RequestException as error:
                 logging.getLogger().warning(error)
+                if not (self.retry_policy.retryable(ctera_request) and self.retry_policy.wait(attempt, start)):
+                    break
             attempt = attempt + 1
-        logging.getLogger().error('Reached maximum number of retries. %s', {'retries': self.retries, 'timeout': self.timeout})
-        raise ExhaustedException(self.retries, self.timeout)
+        logging.getLogger().error('Reached maximum number of retries. %s', {'retries': attempt + 1, 'timeout': self.timeout})
+        raise ExhaustedException(attempt + 1, self.timeout)
+
+    def _retry_status(self, ctera_request, response, attempt, start):
+        if not self.retry_policy.retryable_status(ctera_request, response.status_code):
+            return False
+        logging.getLogger().warning('Service unavailable. %s', {'status': response.status_code, 'attempt': (attempt + 1)})
+        if not self.retry_policy.wait(attempt, start, response.headers.get('Retry-After')):
+            return False
+        response.close()
+        return True
 
     def _do_dispatch(self, ctera_request):
-        response = self.session.request(ctera_request.method, ctera_request.url, **ctera_request.kwargs)
+        kwargs = merge(ctera_request.kwargs, {'stream': True})  # responses are decoded as they are received
+        response = self.session.request(ctera_request.method, ctera_request.url, **kwargs)
         response.raise_for_status()
         return (response.request, response)
 
@@ -137,6 +182,34 @@ class HttpClientBase():
     def trust(self, _host, _port):
         self.session.verify = False  # CertificateServices.save_cert_from_server(host, port)
 
+    def pool_statistics(self):
+        """
+        Get the connection pool statistics
+
+        :return: Connection pool statistics
+        :rtype: cterasdk.common.object.Object
+        """
+        return self.statistics.snapshot()
+
+    def circuit_state(self, url):
+        """
+        Get the state of the circuit breaker of a URL
+
+        :param str url: URL
+        :return: Circuit state, failures and the time remaining until the next probe is allowed, in seconds
+        :rtype: cterasdk.common.object.Object
+        """
+        return self.breaker.state(url)
+
+    def retry_statistics(self):
+        """
+        Get the retry statistics
+
+        :return: Retry statistics
+        :rtype: cterasdk.common.object.Object
+        """
+        return self.retry_policy.statistics.snapshot()
+
     def get_session_id(self):
         return self.session.cookies.get(self._session_id_key)
 
@@ -153,9 +226,20 @@ class HttpClientBase():
 
 
 class HttpClientRequest():
-    def __init__(self, method, url, **kwargs):
+    """
+    HTTP request
+
+    :param str method: HTTP method
+    :param str url: URL
+    :param bool idempotent: Whether the request can be safely retried, defaults to the idempotency of the HTTP method
+    """
+
+    idempotent_methods = ['GET', 'HEAD', 'OPTIONS', 'PUT', 'PROPFIND']
+
+    def __init__(self, method, url, idempotent=None, **kwargs):
         self.method = method
         self.url = url
+        self.idempotent = idempotent if idempotent is not None else method in HttpClientRequest.idempotent_methods
         self.kwargs = kwargs
 
 
@@ -165,8 +249,8 @@ class HttpClientRequestGet(HttpClientRequest):
 
 
 class HttpClientRequestPost(HttpClientRequest):
-    def __init__(self, url, headers=None, data=None):
-        super().__init__('POST', url, headers=headers, data=data)
+    def __init__(self, url, headers=None, data=None, idempotent=False):
+        super().__init__('POST', url, idempotent=idempotent, headers=headers, data=data)
 
 
 class HttpClientRequestPut(HttpClientRequest):
@@ -184,6 +268,11 @@ class HttpClientRequestMkcol(HttpClientRequest):
         super().__init__('MKCOL', url, headers=headers)
 
 
+class HttpClientRequestPropfind(HttpClientRequest):
+    def __init__(self, url, depth, headers=None):
+        super().__init__('PROPFIND', url, headers=merge({'Depth': str(depth)}, headers))
+
+
 class HttpClientRequestCopyMove(HttpClientRequest):
     def __init__(self, method, src, dest, overwrite, headers=None):
         headers = merge({
@@ -208,10 +297,10 @@ class HTTPClient(HttpClientBase):
     def get(self, url, params=None, headers=None, stream=None):
         return self.dispatch(HttpClientRequestGet(url, params=params, headers=headers, stream=stream))
 
-    def post(self, url, headers=None, data='', urlencode=False):
+    def post(self, url, headers=None, data='', urlencode=False, idempotent=False):
         if urlencode:
             data = urllib.parse.urlencode(data).encode('utf-8')
-        return self.dispatch(HttpClientRequestPost(url, headers=headers, data=data))
+        return self.dispatch(HttpClientRequestPost(url, headers=headers, data=data, idempotent=idempotent))
 
     def put(self, url, headers=None, data=''):
         return self.dispatch(HttpClientRequestPut(url, headers=headers, data=data))
@@ -222,6 +311,9 @@ class HTTPClient(HttpClientBase):
     def mkcol(self, url, headers=None):
         return self.dispatch(HttpClientRequestMkcol(url, headers=headers))
 
+    def propfind(self, url, depth=1, headers=None):
+        return self.dispatch(HttpClientRequestPropfind(url, depth, headers=headers))
+
     def copy(self, src, dest, overwrite, headers=None):
         return self.dispatch(HttpClientRequestCopy(src, dest, overwrite, headers=headers))
 
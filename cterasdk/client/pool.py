@@ -0,0 +1,165 @@
+import logging
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from ..common import Object
+
+
+class PoolStatistics:
+    """
+    Connection pool statistics, shared by all the pools of an HTTP client
+
+    :ivar int created: Number of connections created
+    :ivar int reused: Number of requests served by a previously used connection
+    :ivar int expired: Number of connections closed after exceeding the idle timeout
+    :ivar int discarded: Number of connections discarded since the pool was full
+    :ivar float wait: Total time spent waiting for a connection, in seconds
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.expired = 0
+        self.discarded = 0
+        self.wait = 0.0
+
+    def increment(self, counter, value=1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + value)
+
+    def reset(self):
+        with self._lock:
+            self.created = self.reused = self.expired = self.discarded = 0
+            self.wait = 0.0
+
+    def snapshot(self):
+        """
+        Get the current statistics
+
+        :return: Connection pool statistics
+        :rtype: cterasdk.common.object.Object
+        """
+        with self._lock:
+            param = Object()
+            param.created = self.created
+            param.reused = self.reused
+            param.expired = self.expired
+            param.discarded = self.discarded
+            param.wait = self.wait
+            return param
+
+
+class StatisticsConnectionPoolMixin:
+    """ Record pool statistics and expire connections that were idle for too long """
+
+    statistics = None
+    idle_timeout = None
+
+    def _new_conn(self):
+        self.statistics.increment('created')
+        return super()._new_conn()
+
+    def _get_conn(self, timeout=None):
+        start = time.monotonic()
+        conn = super()._get_conn(timeout=timeout)
+        self.statistics.increment('wait', time.monotonic() - start)
+        released = getattr(conn, 'cterasdk_released', None)
+        if released is not None:
+            conn.cterasdk_released = None
+            if self.idle_timeout is not None and time.monotonic() - released > self.idle_timeout:
+                logging.getLogger().debug('Closing idle connection. %s', {'host': self.host, 'port': self.port})
+                conn.close()
+                self.statistics.increment('expired')
+                conn = self._new_conn()
+            else:
+                self.statistics.increment('reused')
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn.cterasdk_released = time.monotonic()
+            if self.pool is not None and self.pool.full():
+                self.statistics.increment('discarded')
+        super()._put_conn(conn)
+
+
+class StatisticsHTTPConnectionPool(StatisticsConnectionPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class StatisticsHTTPSConnectionPool(StatisticsConnectionPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class StatisticsPoolManager(PoolManager):
+
+    def __init__(self, statistics, idle_timeout, **kwargs):
+        super().__init__(**kwargs)
+        self.statistics = statistics
+        self.idle_timeout = idle_timeout
+        self.pool_classes_by_scheme = {
+            'http': StatisticsHTTPConnectionPool,
+            'https': StatisticsHTTPSConnectionPool
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        pool.statistics = self.statistics
+        pool.idle_timeout = self.idle_timeout
+        return pool
+
+
+def socket_options(keepalive):
+    """
+    Build the socket options enabling TCP keepalive
+
+    :param int keepalive: Seconds of inactivity before sending keepalive probes, or ``None`` to disable TCP keepalive
+    """
+    options = list(HTTPConnection.default_socket_options)
+    if keepalive is not None:
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, keepalive))
+        if hasattr(socket, 'TCP_KEEPINTVL'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, keepalive))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter with a tunable connection pool
+
+    :param cterasdk.client.pool.PoolStatistics statistics: Statistics object to update
+    :param int connections: Number of connection pools to cache, one per host
+    :param int maxsize: Maximum number of connections to keep in each pool
+    :param bool block: Wait for a free connection when the pool is exhausted, rather than opening a connection that will be discarded
+    :param float idle_timeout: Close pooled connections that were idle for longer than this, in seconds
+    :param int keepalive: Seconds of inactivity before sending TCP keepalive probes
+    """
+
+    def __init__(self, statistics, connections=10, maxsize=10, block=False, idle_timeout=None, keepalive=None):
+        self.statistics = statistics
+        self.idle_timeout = idle_timeout
+        self.keepalive = keepalive
+        super().__init__(pool_connections=connections, pool_maxsize=maxsize, pool_block=block)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        pool_kwargs['socket_options'] = socket_options(self.keepalive)
+        self.poolmanager = StatisticsPoolManager(
+            self.statistics,
+            self.idle_timeout,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs
+        )
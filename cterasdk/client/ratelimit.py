@@ -0,0 +1,231 @@
+import asyncio
+import collections
+import contextlib
+import threading
+import time
+
+
+class ThreadWaiter:
+
+    def __init__(self):
+        self.event = threading.Event()
+
+    def wake(self):
+        self.event.set()
+
+    def wait(self):
+        self.event.wait()
+
+
+class TaskWaiter:
+
+    def __init__(self, limit, loop):
+        self.limit = limit
+        self.loop = loop
+        self.future = loop.create_future()
+
+    def wake(self):
+        try:
+            self.loop.call_soon_threadsafe(self._set_result)
+        except RuntimeError:
+            self.limit.release()  # event loop closed, pass the slot on
+
+    def _set_result(self):
+        if self.future.done():
+            self.limit.release()  # cancelled while waiting, pass the slot on
+        else:
+            self.future.set_result(None)
+
+
+class RateLimit:
+    """
+    Token bucket, with an optional limit on the number of requests in flight.
+    A single instance may be shared by threads and asyncio tasks.
+
+    :param float rate: Requests per second, or ``None`` for no limit
+    :param int,optional burst: Maximum number of requests that may be sent at once, defaults to ``max(1, rate)``
+    :param int,optional concurrency: Maximum number of requests in flight, or ``None`` for no limit
+    """
+
+    def __init__(self, rate=None, burst=None, concurrency=None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, rate or 1)
+        self.concurrency = concurrency
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._timestamp = time.monotonic()
+        self._inflight = 0
+        self._waiters = collections.deque()
+
+    def _reserve(self, tokens=1):
+        """ Reserve tokens, and return the time to wait until they become available """
+        if self.rate is None:
+            return 0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._timestamp) * self.rate)
+            self._timestamp = now
+            self._tokens = self._tokens - tokens
+            return 0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def _enter(self, waiter_factory):
+        """ Enter if below the concurrency limit, otherwise queue and return a waiter """
+        if self.concurrency is None:
+            return None
+        with self._lock:
+            if self._inflight < self.concurrency:
+                self._inflight = self._inflight + 1
+                return None
+            waiter = waiter_factory()
+            self._waiters.append(waiter)
+            return waiter
+
+    def acquire(self, tokens=1):
+        """
+        Wait until a request may be sent
+
+        :param int,optional tokens: Number of tokens to take from the bucket, such as the number of bytes to send, defaults to ``1``
+        """
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        waiter = self._enter(ThreadWaiter)
+        if waiter is not None:
+            waiter.wait()
+
+    async def async_acquire(self, tokens=1):
+        """
+        Asynchronously wait until a request may be sent
+
+        :param int,optional tokens: Number of tokens to take from the bucket, defaults to ``1``
+        """
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        waiter = self._enter(lambda: TaskWaiter(self, asyncio.get_running_loop()))
+        if waiter is not None:
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                if waiter.future.done() and not waiter.future.cancelled():
+                    self.release()  # cancelled after the slot was handed over
+                raise
+
+    def release(self):
+        """ Mark a request as completed, handing its slot to the next waiter """
+        if self.concurrency is None:
+            return
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+            else:
+                self._inflight = self._inflight - 1
+                return
+        waiter.wake()
+
+    @property
+    def inflight(self):
+        """ Number of requests in flight """
+        return self._inflight
+
+
+class RateLimitRule:
+    """
+    Rate limit rule
+
+    :param cterasdk.client.ratelimit.RateLimit limit: Rate limit to apply
+    :param list[str],optional verbs: Verbs to match, defaults to all. Either a client method (``get``, ``put``, ``delete``, ...)
+     or the name of an executed schema method (``add``, ``get-multi``, ``addFolder``, ...)
+    :param str,optional prefix: Path prefix to match, relative to the API base URL, defaults to all paths
+    """
+
+    def __init__(self, limit, verbs=None, prefix=None):
+        self.limit = limit
+        self.verbs = verbs
+        self.prefix = RateLimitRule.normalize(prefix) if prefix is not None else None
+
+    @staticmethod
+    def normalize(path):
+        return path if path.startswith('/') else '/' + path
+
+    def matches(self, verb, path):
+        if self.verbs is not None and verb not in self.verbs:
+            return False
+        return self.prefix is None or RateLimitRule.normalize(path).startswith(self.prefix)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter. Every matching rule is applied, in the order the rules were added.
+
+    :param list[cterasdk.client.ratelimit.RateLimitRule],optional rules: Rate limit rules
+    """
+
+    def __init__(self, rules=None):
+        self.rules = list(rules) if rules else []
+
+    def add(self, limit, verbs=None, prefix=None):
+        """
+        Add a rule
+
+        :param cterasdk.client.ratelimit.RateLimit limit: Rate limit to apply
+        :param list[str],optional verbs: Verbs to match, defaults to all
+        :param str,optional prefix: Path prefix to match, defaults to all paths
+        """
+        self.rules.append(RateLimitRule(limit, verbs, prefix))
+        return self
+
+    def match(self, verb, path):
+        return [rule.limit for rule in self.rules if rule.matches(verb, path)]
+
+    @contextlib.contextmanager
+    def limit(self, verb, path):
+        """
+        Context manager, waiting until a request may be sent
+
+        :param str verb: Verb
+        :param str path: Path
+        """
+        acquired = []
+        try:
+            for limit in self.match(verb, path):
+                limit.acquire()
+                acquired.append(limit)
+            yield
+        finally:
+            for limit in reversed(acquired):
+                limit.release()
+
+    def async_limit(self, verb, path):
+        """
+        Asynchronous context manager, waiting until a request may be sent
+
+        :param str verb: Verb
+        :param str path: Path
+        """
+        return AsyncRateLimiterContext(self.match(verb, path))
+
+
+class AsyncRateLimiterContext:
+
+    def __init__(self, limits):
+        self._limits = limits
+        self._acquired = []
+
+    async def __aenter__(self):
+        try:
+            for limit in self._limits:
+                await limit.async_acquire()
+                self._acquired.append(limit)
+        except BaseException:
+            self._release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._release()
+
+    def _release(self):
+        for limit in reversed(self._acquired):
+            limit.release()
+        self._acquired = []
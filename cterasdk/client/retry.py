@@ -0,0 +1,178 @@
+import asyncio
+import datetime
+import email.utils
+import logging
+import random
+import threading
+import time
+
+from ..common import Object
+from .. import config
+
+
+class RetryStatistics:
+    """
+    Retry statistics, shared by all the requests of an HTTP client
+
+    :ivar int retries: Number of requests that were retried
+    :ivar int exhausted: Number of requests that failed after exhausting the retry policy
+    :ivar float sleep: Total time spent waiting between retries, in seconds
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+        self.sleep = 0.0
+
+    def increment(self, counter, value=1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + value)
+
+    def reset(self):
+        with self._lock:
+            self.retries = self.exhausted = 0
+            self.sleep = 0.0
+
+    def snapshot(self):
+        """
+        Get the current statistics
+
+        :return: Retry statistics
+        :rtype: cterasdk.common.object.Object
+        """
+        with self._lock:
+            param = Object()
+            param.retries = self.retries
+            param.exhausted = self.exhausted
+            param.sleep = self.sleep
+            return param
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+
+    Only idempotent requests are retried unless ``unsafe`` is set, with the exception of connection timeouts
+    and ``429 Too Many Requests`` responses, which guarantee the request was not processed.
+
+    :param int retries: Maximum number of attempts
+    :param float backoff: Base delay, in seconds. The delay before retry ``n`` is drawn uniformly from ``[0, backoff * 2 ** n]``
+    :param float max_backoff: Maximum delay between attempts, in seconds
+    :param float budget: Maximum total time to spend on a request, in seconds, or ``None`` for no limit
+    :param list[int] statuses: HTTP status codes to retry
+    :param bool unsafe: Retry non-idempotent requests as well
+    """
+
+    def __init__(self, retries=3, backoff=0.5, max_backoff=30, budget=None, statuses=None, unsafe=False):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.budget = budget
+        self.statuses = statuses if statuses is not None else [429, 502, 503, 504]
+        self.unsafe = unsafe
+        self.statistics = RetryStatistics()
+
+    @staticmethod
+    def from_config():
+        """ Create a retry policy from the ``config.http`` settings """
+        return RetryPolicy(retries=config.http['retries'], **config.http['retry'])
+
+    def retryable(self, ctera_request, safe=False):
+        """
+        Check if a request may be retried
+
+        :param cterasdk.client.http.HttpClientRequest ctera_request: Request
+        :param bool safe: The failure guarantees the request was not processed
+        """
+        return safe or self.unsafe or ctera_request.idempotent
+
+    def retryable_status(self, ctera_request, status):
+        """
+        Check if a request that failed with an HTTP error status may be retried
+
+        :param cterasdk.client.http.HttpClientRequest ctera_request: Request
+        :param int status: HTTP status code
+        """
+        return status in self.statuses and self.retryable(ctera_request, status == 429)
+
+    def delay(self, attempt, retry_after=None):
+        """
+        Compute the delay before the next attempt
+
+        :param int attempt: Zero-based index of the failed attempt
+        :param str retry_after: Value of the ``Retry-After`` response header, if any, capped at ``max_backoff``
+        """
+        seconds = RetryPolicy.parse_retry_after(retry_after)
+        if seconds is not None:
+            return min(seconds, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+    def next(self, attempt, start, retry_after=None):
+        """
+        Get the delay before the next attempt
+
+        :param int attempt: Zero-based index of the failed attempt
+        :param float start: Time the request was first dispatched, as returned by ``time.monotonic()``
+        :param str retry_after: Value of the ``Retry-After`` response header, if any
+        :returns: Delay in seconds, or ``None`` if the retry policy was exhausted
+        """
+        seconds = self.delay(attempt, retry_after)
+        if attempt + 1 >= self.retries or (self.budget is not None and time.monotonic() - start + seconds > self.budget):
+            self._exhausted(attempt)
+            return None
+        self.statistics.increment('retries')
+        self.statistics.increment('sleep', seconds)
+        logging.getLogger().debug('Retrying request. %s', {'attempt': attempt + 1, 'delay': round(seconds, 3)})
+        return seconds
+
+    def wait(self, attempt, start, retry_after=None):
+        """
+        Wait before the next attempt
+
+        :returns: ``True`` if the request should be retried, ``False`` otherwise
+        """
+        seconds = self.next(attempt, start, retry_after)
+        if seconds is None:
+            return False
+        time.sleep(seconds)
+        return True
+
+    async def async_wait(self, attempt, start, retry_after=None):
+        """
+        Asynchronously wait before the next attempt
+
+        :returns: ``True`` if the request should be retried, ``False`` otherwise
+        """
+        seconds = self.next(attempt, start, retry_after)
+        if seconds is None:
+            return False
+        await asyncio.sleep(seconds)
+        return True
+
+    def _exhausted(self, attempt):
+        logging.getLogger().debug('Retry policy exhausted. %s', {'attempts': attempt + 1, 'budget': self.budget})
+        self.statistics.increment('exhausted')
+
+    @staticmethod
+    def parse_retry_after(retry_after):
+        """
+        Parse a ``Retry-After`` header value, either delay-seconds or an HTTP-date
+
+        :returns: Delay in seconds, or ``None`` if missing or malformed
+        """
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            date = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if date is None:
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
@@ -1,5 +1,5 @@
 from .item import Item  # noqa: E402, F401
-from .object import Object  # noqa: E402, F401
+from .object import Object, Record, record  # noqa: E402, F401
 from .datetime_utils import DateTimeUtils  # noqa: E402, F401
 from .utils import merge, union, parse_base_object_ref, convert_size, df_military_time, DataUnit  # noqa: E402, F401
 from .types import PolicyRule, PolicyRuleConverter, StringCriteriaBuilder, IntegerCriteriaBuilder, DateTimeCriteriaBuilder,  \
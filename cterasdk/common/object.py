@@ -4,3 +4,68 @@ import json
 class Object:  # pylint: disable=too-many-instance-attributes
     def __str__(self):
         return json.dumps(self, default=lambda o: o.__dict__, indent=5)
+
+
+class Record:
+    """
+    Compact alternative to :class:`cterasdk.common.object.Object`, without a per-instance ``__dict__``.
+
+    A record class is generated and cached for every class name and set of attributes, see :func:`record`.
+    The class name is stored once, on the record class. Other attributes are read and assigned as usual,
+    but attributes cannot be added or removed.
+    """
+    __slots__ = ()
+    _fields = ()
+
+    @property
+    def __dict__(self):
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __str__(self):
+        return json.dumps(self, default=lambda o: o.__dict__, indent=5)
+
+    def __reduce__(self):
+        return (record, (self.__dict__,))
+
+
+_record_classes = {}
+
+
+def record_class(classname, fields):
+    """
+    Get the record class for a class name and a set of attributes
+
+    :param str classname: Class name, or ``None``
+    :param tuple[str] fields: Attribute names
+    :returns: Record class, or ``None`` if the attribute names cannot be used as slots
+    """
+    key = (classname, fields)
+    cls = _record_classes.get(key)
+    if cls is None:
+        if all(field.isidentifier() and not field.startswith('__') for field in fields):
+            name = classname if classname and classname.isidentifier() else 'Record'
+            namespace = {'__slots__': tuple(field for field in fields if field != '_classname'), '_fields': fields}
+            if classname is not None:
+                namespace['_classname'] = classname
+            cls = type(name, (Record,), namespace)
+        else:
+            cls = False
+        cls = _record_classes.setdefault(key, cls)
+    return cls or None
+
+
+def record(attributes):
+    """
+    Create a record
+
+    :param dict attributes: Attributes
+    :returns: Record, or ``None`` if the attribute names cannot be used as slots
+    """
+    cls = record_class(attributes.get('_classname'), tuple(attributes))
+    if cls is None:
+        return None
+    instance = cls()
+    for name, value in attributes.items():
+        if name != '_classname':
+            setattr(instance, name, value)
+    return instance
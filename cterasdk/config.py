@@ -71,9 +71,46 @@ logconf = dict(
 
 http = dict(
     timeout=20,  # http client timeout (seconds)
-    retries=3,  # handle connection timeout
+    retries=3,  # maximum number of attempts
+    retry=dict(
+        backoff=0.5,  # base delay between attempts, doubled on each attempt, with full jitter (seconds)
+        max_backoff=30,  # maximum delay between attempts (seconds)
+        budget=None,  # maximum total time to spend on a request, including retries (seconds)
+        statuses=[429, 502, 503, 504],  # http status codes to retry
+        unsafe=False  # retry non-idempotent requests
+    ),
+    breaker=dict(
+        enabled=False,  # fail fast on requests to unreachable hosts
+        threshold=5,  # consecutive failures before opening the circuit
+        reset_timeout=30,  # time to wait before probing a host with an open circuit (seconds)
+        probes=1,  # concurrent probe requests allowed while the circuit is half-open
+        statuses=[502, 504]  # http status codes counted as failures, returned by a proxy to an unreachable host
+    ),
     ssl='Consent',  # ['Consent', 'Trust']
-    verbose=False  # include request info on error
+    verbose=False,  # include request info on error
+    pool=dict(
+        connections=10,  # number of connection pools to cache, one per host
+        maxsize=10,  # maximum number of connections to keep in each pool
+        block=False,  # wait for a free connection when the pool is exhausted
+        idle_timeout=None,  # close pooled connections idle for longer than this (seconds)
+        keepalive=None  # seconds of inactivity before sending tcp keepalive probes
+    )
+)
+
+iterator = dict(
+    prefetch=0,  # pages to fetch ahead on a background thread while iterating over query results
+    parallel=0,  # pages to fetch concurrently when iterating over portal query results, 0 to fetch pages one at a time
+    ordered=True,  # return objects in order when fetching pages concurrently
+    pager=dict(
+        enabled=False,  # adjust the page size to the response latency
+        target=2,  # target response latency (seconds)
+        minimum=10,  # minimum page size
+        maximum=1000  # maximum page size
+    )
+)
+
+projection = dict(
+    warn=False  # warn when reading an attribute that was not retrieved, on objects retrieved using a list of fields
 )
 
 connect = dict(
@@ -81,7 +118,9 @@ connect = dict(
 )
 
 filesystem = dict(
-    dl='~/Downloads'
+    dl='~/Downloads',
+    chunk_size=65536,  # bytes to read at a time when downloading a file
+    retries=3  # times to resume an interrupted download
 )
 
 transcript = dict(
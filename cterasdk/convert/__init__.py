@@ -1,3 +1,3 @@
-from .parse import fromjsonstr, fromxmlstr  # noqa: E402, F401
+from .parse import fromjsonstr, fromxmlstr, fromxmlstream, fromdavxml, XMLStreamDecoder  # noqa: E402, F401
 from .format import tojsonstr, toxmlstr  # noqa: E402, F401
 from .exception import ParseException  # noqa: E402, F401
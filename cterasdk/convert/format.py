@@ -1,10 +1,10 @@
 import queue
 import json
 import copy
-from xml.etree.ElementTree import Element, SubElement, tostring
+from xml.etree.ElementTree import Element, SubElement
 from xml.dom import minidom
 
-from cterasdk.common import Item, Object
+from cterasdk.common import Item, Object, Record
 from cterasdk.convert.xml_types import XMLTypes
 
 
@@ -60,11 +60,88 @@ def toxmlstr(obj, pretty_print=False):
     """
     if obj is None:
         return None
-    xml = toxml(obj)
+    chunks = []
+    _serialize(obj, chunks)
+    xml = ''.join(chunks).encode('us-ascii', 'xmlcharrefreplace')
     if pretty_print:
-        string = minidom.parseString(tostring(xml)).toprettyxml(indent="   ")
+        string = minidom.parseString(xml).toprettyxml(indent="   ")
         return ''.join(string.split('\n', 1)[1:])
-    return tostring(xml)
+    return xml
+
+
+def _escape_cdata(text):
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    return text
+
+
+def _escape_attrib(text):
+    text = _escape_cdata(text)
+    if '"' in text:
+        text = text.replace('"', '&quot;')
+    if '\r' in text:
+        text = text.replace('\r', '&#13;')
+    if '\n' in text:
+        text = text.replace('\n', '&#10;')
+    if '\t' in text:
+        text = text.replace('\t', '&#09;')
+    return text
+
+
+def _serialize(obj, chunks):
+    """
+    Serialize a Python object, appending the XML to a list of chunks.
+    Produces the same output as serializing the element tree built by :func:`toxml`.
+    """
+    if isinstance(obj, (str, int, float, complex, bool)):
+        text = str(obj).lower() if isinstance(obj, bool) else str(obj)
+        chunks.append('<val>%s</val>' % _escape_cdata(text) if text else '<val />')
+    elif isinstance(obj, list):
+        _serialize_list(obj, chunks)
+    elif isinstance(obj, (Object, Record)):
+        _serialize_object(obj, chunks)
+
+
+def _serialize_list(obj, chunks):
+    start = len(chunks)
+    chunks.append('<list>')
+    for member in obj:
+        _serialize(member, chunks)
+    if len(chunks) > start + 1:
+        chunks.append('</list>')
+    else:
+        chunks[start] = '<list />'
+
+
+def _serialize_object(obj, chunks):
+    attributes = obj.__dict__
+    tag = '<obj'
+    classname = attributes.get('_classname')  # Convert { "_classname" : "ShareConfig" }
+    if classname is not None:
+        tag = '%s %s="%s"' % (tag, XMLTypes.CLASS, _escape_attrib(classname))
+    uuid = attributes.get('_uuid')  # Convert { "_uuid" : "6f0e8c79-..." }
+    if uuid is not None:
+        tag = '%s %s="%s"' % (tag, XMLTypes.UUID, _escape_attrib(uuid))
+    start = len(chunks)
+    chunks.append(tag + '>')
+    for attribute_name, value in attributes.items():
+        if attribute_name.startswith('_'):
+            continue
+        att = len(chunks)
+        chunks.append('<att id="%s">' % _escape_attrib(attribute_name))
+        _serialize(value, chunks)
+        if len(chunks) > att + 1:
+            chunks.append('</att>')
+        else:
+            chunks[att] = '<att id="%s" />' % _escape_attrib(attribute_name)
+    if len(chunks) > start + 1:
+        chunks.append('</obj>')
+    else:
+        chunks[start] = tag + ' />'
 
 
 def toxml(obj):
@@ -91,7 +168,7 @@ def toxml(obj):
                 kid.parent = item.node
                 kid.obj = member
                 q.put(kid)
-        elif isinstance(item.obj, Object):
+        elif isinstance(item.obj, (Object, Record)):
             item.node = CreateElement(item.parent, XMLTypes.OBJ)
             classname = item.obj.__dict__.get('_classname')  # Convert { "_classname" : "ShareConfig" }
             if classname is not None:
@@ -1,11 +1,12 @@
 import logging
 import json
-import queue
-from xml.etree.ElementTree import fromstring, ParseError
+from urllib.parse import unquote
+from xml.etree import ElementTree
+from xml.parsers import expat
 
 from cterasdk.convert.xml_types import XMLTypes
 from .exception import ParseException
-from ..common import Item, Object
+from ..common import Object, record
 
 
 def ParseValue(data):
@@ -42,108 +43,247 @@ def SetAppendValue(item, value):
         item.value = value
 
 
+def _object_pairs_hook(pairs):
+    obj = Object()
+    obj.__dict__.update(pairs)
+    return obj
+
+
+_json_decoder = json.JSONDecoder(object_pairs_hook=_object_pairs_hook)
+
+
 def fromjsonstr(fromstr):
+    """
+    Parse a JSON document, converting JSON objects to :class:`cterasdk.common.object.Object`
+
+    :param object fromstr: JSON document, ``str`` or UTF-8, UTF-16 or UTF-32 encoded ``bytes``
+    """
     if not fromstr:
         return fromstr
+    if isinstance(fromstr, (bytes, bytearray)):
+        fromstr = fromstr.decode(json.detect_encoding(fromstr), 'surrogatepass')
+    return _json_decoder.decode(fromstr)
 
-    root = Item()
-    root.node = json.loads(fromstr)
-    root.parent = None
-    root.value = None
-
-    q = queue.Queue()
-    q.put(root)
-    while not q.empty():
-        item = q.get()
-        if item.node is None:
-            SetAppendValue(item, None)
-        elif isinstance(item.node, (int, float, bool, str)):
-            SetAppendValue(item, item.node)
-        elif isinstance(item.node, list):
-            item.value = []
-            SetAppendValue(item, item.value)
-            for kidnode in item.node:
-                kid = Item()
-                kid.parent = item
-                kid.node = kidnode
-                q.put(kid)
-        elif isinstance(item.node, dict):
-            item.value = Object()
-            SetAppendValue(item, item.value)
-            for kidnode, kidvalue in item.node.items():
-                kid = Item()
-                kid.parent = item
-                kid.id = kidnode
-                kid.node = kidvalue
-                q.put(kid)
-
-    return root.value
-
-
-def fromxmlstr(string):  # pylint: disable=too-many-branches,too-many-statements
+
+def fromxmlstr(string, compact=False):
+    """
+    Parse an XML document
+
+    :param str string: XML document, either ``str`` or ``bytes``
+    :param bool,optional compact: Decode objects as compact records, defaults to ``False``
+    :returns: Python object
+    """
     if not string:
         logging.getLogger().debug('Skipping.')
         return string
+    decoder = XMLStreamDecoder(compact)
+    decoder.feed(string)
+    return decoder.close()
 
-    # Do not attempt to parse HTML
-    if string[:15].upper() == '<!DOCTYPE HTML>':
-        logging.getLogger().debug('Skipping. %s', {'type': 'HTML'})
-        return string
 
-    root = Item()
-    root.value = None
-    root.parent = None
+def fromxmlstream(chunks, compact=False):
+    """
+    Parse an XML document received in chunks
 
-    try:
-        root.node = fromstring(string)
-    except ParseError:
-        raise ParseException()
-
-    q = queue.Queue()
-    q.put(root)
-    while not q.empty():
-        item = q.get()
-        if item.node.tag == XMLTypes.VAL:
-            value = ParseValue(item.node.text)
-            SetAppendValue(item, value)
-        elif item.node.tag == XMLTypes.LIST:
-            item.value = []
-            SetAppendValue(item, item.value)
-            for kidnode in item.node:
-                if kidnode.tag in [XMLTypes.OBJ, XMLTypes.VAL]:
-                    kid = Item()
-                    kid.parent = item
-                    kid.node = kidnode
-                    q.put(kid)
-        elif item.node.tag == XMLTypes.OBJ:
-            classname = item.node.attrib.get(XMLTypes.CLASS)
-            uuid = item.node.attrib.get(XMLTypes.UUID)
-
-            item.value = Object()
-            if classname is not None:  # Convert <obj class="ShareConfig"> to { "_classname" : "ShareConfig" }
-                item.value._classname = classname  # pylint: disable=protected-access
-            if uuid is not None:  # Convert <obj uuid="6f0e8c79-..."> to { "_uuid" : "6f0e8c79-..." }
-                item.value._uuid = uuid  # pylint: disable=protected-access
-
-            SetAppendValue(item, item.value)
-
-            for kidnode in item.node:
-                if kidnode.tag == XMLTypes.ATT:
-                    kid = Item()
-                    kid.id = kidnode.attrib[XMLTypes.ID]
-                    kid.parent = item
-                    kid.node = kidnode
-                    q.put(kid)
-        elif item.node.tag == XMLTypes.ATT:
-            if len(item.node) > 0:
-                for kidnode in item.node:
-                    if kidnode.tag in [XMLTypes.OBJ, XMLTypes.LIST, XMLTypes.VAL]:
-                        kid = Item()
-                        kid.id = item.id
-                        kid.parent = item.parent
-                        kid.node = kidnode
-                        q.put(kid)
+    :param iterable chunks: An iterable of ``bytes`` or ``str`` chunks
+    :param bool,optional compact: Decode objects as compact records, defaults to ``False``
+    :returns: Python object
+    """
+    decoder = XMLStreamDecoder(compact)
+    for chunk in chunks:
+        decoder.feed(chunk)
+    return decoder.close()
+
+
+def fromdavxml(string):
+    """
+    Parse a WebDAV multi-status response, such as the response to a ``PROPFIND`` request
+
+    :param str string: XML document, either ``str`` or ``bytes``
+    :returns: List of resources, with their ``href``, ``name``, ``isFolder``, ``size`` and ``lastmodified`` properties
+    :rtype: list[cterasdk.common.object.Object]
+    """
+    if not string:
+        return []
+    dav = '{DAV:}'
+    resources = []
+    for response in ElementTree.fromstring(string).iter(dav + 'response'):
+        resource = Object()
+        resource.href = response.findtext(dav + 'href')
+        resource.name = unquote(resource.href.rstrip('/').rsplit('/', 1)[-1])
+        resource.isFolder = response.find('.//%sresourcetype/%scollection' % (dav, dav)) is not None
+        size = response.findtext('.//%sgetcontentlength' % dav)
+        resource.size = int(size) if size else None
+        resource.lastmodified = response.findtext('.//%sgetlastmodified' % dav)
+        resources.append(resource)
+    return resources
+
+
+_TAG, _LIVE, _VALUE, _KEY, _CHILDREN, _TEXT = range(6)
+
+
+class XMLStreamDecoder:
+    """
+    Incremental, single-pass XML decoder, built on expat callbacks.
+
+    Feed the document in chunks, as received, and call :func:`close` to obtain the Python object.
+    Objects are built as elements are parsed, without materializing the document or an element tree.
+    Each open element is tracked by a frame on a stack: ``[tag, live, value, key, children, text]``,
+    where ``live`` is ``False`` for elements that are ignored, such as ``<att>`` under a ``<list>``.
+
+    In compact mode, every ``<obj>`` is converted to a :class:`cterasdk.common.object.Record` once its element is closed,
+    and repeated string values are shared rather than duplicated.
+
+    :param bool,optional compact: Decode objects as compact records, defaults to ``False``
+    """
+
+    accepts = {
+        XMLTypes.OBJ: (XMLTypes.ATT,),
+        XMLTypes.LIST: (XMLTypes.OBJ, XMLTypes.VAL),
+        XMLTypes.ATT: (XMLTypes.OBJ, XMLTypes.LIST, XMLTypes.VAL),
+        XMLTypes.VAL: ()
+    }
+
+    def __init__(self, compact=False):
+        self._compact = compact
+        self._strings = {} if compact else None
+        self._parser = expat.ParserCreate()
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._parser.CharacterDataHandler = self._data
+        self._stack = []
+        self._root = None
+        self._head = []
+        self._size = 0
+        self._html = None
+
+    def feed(self, data):
+        """
+        Feed a chunk of the document
+
+        :param object data: Chunk, either ``bytes`` or ``str``
+        """
+        if not data:
+            return
+        if self._head is not None:
+            self._head.append(data)
+            self._size = self._size + len(data)
+            if self._size < 15:
+                return
+            data = self._detect()
+        if self._html is not None:
+            self._html.append(data)
+            return
+        self._parse(data, False)
+
+    def close(self):
+        """
+        Finish decoding the document
+
+        :returns: Python object
+        """
+        if self._head is not None:
+            data = self._detect()
+            if not data:
+                logging.getLogger().debug('Skipping.')
+                return data
+            if self._html is None:
+                self._parse(data, False)
+        if self._html is not None:
+            html = self._html[0][:0].join(self._html)  # decoded once, characters may be split across chunks
+            return html.decode('utf-8') if isinstance(html, bytes) else html
+        self._parse(b'', True)
+        return self._root
+
+    def _detect(self):
+        data = self._head[0][:0].join(self._head) if self._head else ''
+        self._head = None
+        head = data[:15].decode('utf-8', 'ignore') if isinstance(data, bytes) else data[:15]
+        if head.upper() == '<!DOCTYPE HTML>':  # Do not attempt to parse HTML
+            logging.getLogger().debug('Skipping. %s', {'type': 'HTML'})
+            self._html = [data]
+            return data[:0]
+        return data
+
+    def _parse(self, data, final):
+        try:
+            self._parser.Parse(data, final)
+        except expat.ExpatError:
+            raise ParseException()
+
+    def _attach(self, parent, value):
+        if parent is None:
+            self._root = value
+        elif parent[_TAG] == XMLTypes.LIST:
+            parent[_VALUE].append(value)
+        elif parent[_VALUE] is not None:
+            setattr(parent[_VALUE], parent[_KEY], value)
+
+    def _replace(self, parent, value):
+        """ Replace the last value attached to the parent """
+        if parent is None:
+            self._root = value
+        elif parent[_TAG] == XMLTypes.LIST:
+            parent[_VALUE][-1] = value
+        elif parent[_VALUE] is not None:
+            setattr(parent[_VALUE], parent[_KEY], value)
+
+    def _start(self, tag, attrib):
+        stack = self._stack
+        if stack:
+            parent = stack[-1]
+            parent[_CHILDREN] = parent[_CHILDREN] + 1
+            live = parent[_LIVE] and tag in XMLStreamDecoder.accepts[parent[_TAG]]
+        else:
+            parent = None
+            live = tag in XMLStreamDecoder.accepts
+
+        if not live:
+            stack.append([tag, False, None, None, 0, None])
+        elif tag == XMLTypes.VAL:
+            stack.append([tag, True, None, None, 0, []])
+        elif tag == XMLTypes.ATT:
+            if parent is None:
+                stack.append([tag, True, None, None, 0, None])
             else:
-                SetAppendValue(item, None)              # include empty attrs
+                stack.append([tag, True, parent[_VALUE], attrib[XMLTypes.ID], 0, None])
+        elif tag == XMLTypes.OBJ:
+            value = Object()
+            if attrib:
+                classname = attrib.get(XMLTypes.CLASS)
+                if classname is not None:  # Convert <obj class="ShareConfig"> to { "_classname" : "ShareConfig" }
+                    value._classname = classname  # pylint: disable=protected-access
+                uuid = attrib.get(XMLTypes.UUID)
+                if uuid is not None:  # Convert <obj uuid="6f0e8c79-..."> to { "_uuid" : "6f0e8c79-..." }
+                    value._uuid = uuid  # pylint: disable=protected-access
+            self._attach(parent, value)
+            stack.append([tag, True, value, None, 0, None])
+        else:
+            value = []
+            self._attach(parent, value)
+            stack.append([tag, True, value, None, 0, None])
+
+    def _end(self, _tag):
+        stack = self._stack
+        frame = stack.pop()
+        if not frame[_LIVE]:
+            return
+        tag = frame[_TAG]
+        if tag == XMLTypes.VAL:
+            text = frame[_TEXT]
+            value = ParseValue(''.join(text) if text else None)
+            if self._strings is not None and value.__class__ is str:
+                value = self._strings.setdefault(value, value)  # share repeated strings
+            self._attach(stack[-1] if stack else None, value)
+        elif tag == XMLTypes.ATT and frame[_CHILDREN] == 0 and frame[_VALUE] is not None:
+            setattr(frame[_VALUE], frame[_KEY], None)  # include empty attrs
+        elif tag == XMLTypes.OBJ and self._compact:
+            value = record(frame[_VALUE].__dict__)
+            if value is not None:
+                self._replace(stack[-1] if stack else None, value)
 
-    return root.value
+    def _data(self, data):
+        frame = self._stack[-1]
+        if frame[_TEXT] is not None and frame[_CHILDREN] == 0:  # text of a <val>, up to its first child element
+            frame[_TEXT].append(data)
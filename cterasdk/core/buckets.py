@@ -1,6 +1,7 @@
 import logging
 
 from ..common import union
+from ..lib import Projection
 from ..exception import CTERAException
 from .base_command import BaseCommand
 from . import query
@@ -29,9 +30,8 @@ class Buckets(BaseCommand):
         :param str name: Name of the bucket
         :param list[str] include: List of fields to retrieve, defaults to ``['name']``
         """
-        include = union(include or [], Buckets.default)
-        include = ['/' + attr for attr in include]
-        bucket = self._portal.get_multi('/locations/' + name, include)
+        projection = Projection(include, Buckets.default)
+        bucket = projection.enforce(self._portal.get_multi('/locations/' + name, projection.paths))
         if bucket.name is None:
             raise CTERAException('Could not find bucket', None, name=name)
         return bucket
@@ -5,6 +5,7 @@ from . import query
 from .enum import ListFilter
 from ..common import Object
 from ..common import union
+from ..lib import Projection
 from ..exception import CTERAException
 
 
@@ -20,9 +21,8 @@ class CloudFS(BaseCommand):
         :param str name: Name of the Folder Group to find
         :param str,optional include: List of fields to retrieve, defaults to ['name', 'owner']
         """
-        include = union(include or [], ['name', 'owner'])
-        include = ['/' + attr for attr in include]
-        folder_group = self._portal.get_multi('/foldersGroups/' + name, include)
+        projection = Projection(include, ['name', 'owner'])
+        folder_group = projection.enforce(self._portal.get_multi('/foldersGroups/' + name, projection.paths))
         if folder_group.name is None:
             raise CTERAException('Could not find folder group', None, name=name)
         return folder_group
@@ -165,7 +165,8 @@ class CloudFS(BaseCommand):
         :param str owner: User name of the owner of the directory
         :param list[str] include: List of metadata fields to include in the response
         """
-        builder = query.QueryParamBuilder().include(include)
+        projection = Projection(include, ['owner'])
+        builder = query.QueryParamBuilder().include(projection.include)
         query_filter = query.FilterBuilder('name').eq(name)
         builder.addFilter(query_filter)
         param = builder.build()
@@ -2,6 +2,7 @@ from .base_command import BaseCommand
 from .enum import DeviceType
 from . import remote, query
 from ..common import union
+from ..lib import Projection
 from ..exception import CTERAException
 
 
@@ -23,8 +24,7 @@ class Devices(BaseCommand):
         :return: Managed Device
         :rtype: ctera.object.Gateway.Gateway or ctera.object.Agent.Agent
         """
-        include = union(include or [], Devices.default)
-        include = ['/' + attr for attr in include]
+        projection = Projection(include, Devices.default)
 
         session = self._portal.session()
         if not tenant:
@@ -36,7 +36,7 @@ class Devices(BaseCommand):
         else:
             url = '/portals/%s/devices/%s' % (tenant, device_name)  # regular auth: support both tenant and Administration context
 
-        dev = self._portal.get_multi(url, include)
+        dev = projection.enforce(self._portal.get_multi(url, projection.paths))
         if dev.name is None:
             raise CTERAException('Device not found', None, tenant=tenant, device=device_name)
 
@@ -113,7 +113,7 @@ class Devices(BaseCommand):
         filters = [query.FilterBuilder('name').eq(name) for name in names]
         return self.devices(include, False, filters)
 
-    def devices(self, include=None, allPortals=False, filters=None, user=None):
+    def devices(self, include=None, allPortals=False, filters=None, user=None, checkpoint=None):
         """
         Get Devices
 
@@ -121,6 +121,8 @@ class Devices(BaseCommand):
         :param bool,optional allPortals: Search in all portals, defaults to False
         :param list[],optional filters: List of additional filters, defaults to None
         :param cterasdk.core.types.UserAccount user: User account of the device owner
+        :param str,optional checkpoint: Path of a file to save the position of the iteration to,
+         and to resume the iteration from if it exists, defaults to None. See :func:`cterasdk.lib.iterator.Iterator.checkpoint`
 
         :return: Iterator for all matching Devices
         :rtype: cterasdk.lib.iterator.Iterator
@@ -137,5 +139,7 @@ class Devices(BaseCommand):
         param = builder.build()
         # Check if the _all attribute conflicts with the current tenant
         iterator = query.iterator(self._portal, '/devices', param)
+        if checkpoint is not None:
+            iterator.checkpoint(checkpoint)
         for dev in iterator:
             yield remote.remote_command(self._portal, dev)
@@ -1,7 +1,9 @@
 from .path import CTERAPath
 
 from ..base_command import BaseCommand
-from . import ls, directory, rename, rm, recover, mv, cp, ln, collaboration, file_access
+from ...common import Object
+from ...lib import Walker
+from . import ls, directory, rename, rm, recover, mv, cp, ln, collaboration, file_access, walk
 
 
 # pylint: disable=too-many-public-methods
@@ -25,33 +27,71 @@ class FileBrowser(BaseCommand):
         """
         return ls.ls(self._portal, self.mkpath(path), include_deleted=include_deleted)
 
-    def walk(self, path, include_deleted=False):
+    def walk(self, path, include_deleted=False, concurrency=None, ordered=True, max_depth=None, predicate=None, onerror=None):
         """
         Perform walk on the provided path
 
         :param str path: Path to perform walk on
         :param bool,optional include_deleted: Include deleted files, defaults to False
+        :param int,optional concurrency: Number of directories to list concurrently, defaults to listing one directory at a time
+        :param bool,optional ordered: Return items in breadth-first order, rather than as directories are listed, defaults to True
+        :param int,optional max_depth: Maximum depth to list, ``1`` lists the top directory only, defaults to unlimited
+        :param callable,optional predicate: Function receiving a folder item, return ``False`` to skip listing the folder
+        :param callable,optional onerror: Function receiving a path and an error, called for sub-directories that could not be listed,
+         defaults to logging a warning and skipping the directory
         """
-        paths = [self.mkpath(path)]
+        walker = Walker(
+            lambda path: walk.list_directory(self._portal, path, include_deleted),
+            self.mkpath, concurrency, ordered, max_depth, predicate, onerror
+        )
+        return walker.walk(self.mkpath(path))
 
-        while len(paths) > 0:
-            path = paths.pop(0)
-            items = ls.ls(self._portal, path, include_deleted=include_deleted)
-            for item in items:
-                if item.isFolder:
-                    paths.append(self.mkpath(item))
-                yield item
-
-    def download(self, path, destination=None):
+    def download(self, path, destination=None, segments=None, chunk_size=None, resume=False):  # pylint: disable=too-many-arguments
         """
         Download a file
 
         :param str path: Path of the file to download
         :param str,optional destination:
          File destination, if it is a directory, the original filename will be kept, defaults to the default directory
+        :param int,optional segments: Number of connections to download the file over, using range requests, defaults to a single connection
+        :param int,optional chunk_size: Number of bytes to read at a time, defaults to ``config.filesystem['chunk_size']``
+        :param bool,optional resume:
+         Resume an interrupted download of the file to the same destination, retrying up to ``config.filesystem['retries']`` times
+         on a connection error, timeout or server error,
+         and keep the partially downloaded file if the download fails, defaults to ``False``
+        :returns: Path of the downloaded file
+        :rtype: str
         """
         path = self.mkpath(path)
-        self._file_access.download(path, destination=destination)
+        return self._file_access.download(path, destination=destination, segments=segments, chunk_size=chunk_size, resume=resume)
+
+    def download_tree(self, remote_dir, local_dir, concurrency=None, bandwidth=None):
+        """
+        Download a directory tree, mirroring its directories and files to a local directory
+
+        Files whose local size and modification time match the remote file are skipped.
+        Files and sub-directories that could not be downloaded are included in the report, without aborting the download.
+
+        :param str remote_dir: Path of the directory to download
+        :param str local_dir: Local directory to download to, created if missing
+        :param int,optional concurrency: Number of directories to list, and files to download, concurrently, defaults to ``1``
+        :param int,optional bandwidth: Maximum total download rate, in bytes per second, defaults to unlimited
+        :returns: Transfer report, with the number of directories, files downloaded and skipped, bytes written and failures
+        :rtype: cterasdk.common.object.Object
+        """
+        root = self.mkpath(remote_dir)
+        download = self._file_access.tree_download(local_dir, concurrency, bandwidth)
+        items = self.walk(remote_dir, concurrency=concurrency, onerror=download.onerror)
+        return download.run(self._entry(root, item) for item in items)
+
+    def _entry(self, root, item):
+        entry = Object()
+        entry.source = self.mkpath(item)
+        entry.path = str(entry.source.relativepath.relative_to(root.relativepath))
+        entry.isFolder = item.isFolder
+        entry.size = getattr(item, 'size', None)
+        entry.lastmodified = getattr(item, 'lastmodified', None)
+        return entry
 
     def download_as_zip(self, cloud_directory, files, destination=None):
         """
@@ -66,14 +106,40 @@ class FileBrowser(BaseCommand):
         """
         self._file_access.download_as_zip(self.mkpath(cloud_directory), files, destination=destination)
 
-    def upload(self, file_path, server_path):
+    def upload(self, file_path, server_path, retries=None):
         """
         Upload a file
 
         :param str file_path: Path to the local file to upload
         :param str server_path: Path to the directory to upload the file to
+        :param int,optional retries:
+         Number of times to retry the upload if it fails on a connection error, timeout or server error, defaults to ``0``.
+         The file may be uploaded again if the server stored it before the error
         """
-        self._file_access.upload(file_path, self.mkpath(server_path))
+        self._file_access.upload(file_path, self.mkpath(server_path), retries)
+
+    def upload_tree(self, local_dir, remote_dir, concurrency=None, retries=None):
+        """
+        Upload a local directory tree, creating its directories and uploading its files to a remote directory
+
+        Directories are created once, top-down, and files are uploaded concurrently.
+        Files that could not be uploaded are retried, and included in the report if they still fail, without aborting the upload.
+
+        :param str local_dir: Local directory to upload
+        :param str remote_dir: Path of the remote directory to upload to, created if missing
+        :param int,optional concurrency: Number of directories to create, and files to upload, concurrently, defaults to ``1``
+        :param int,optional retries: Number of times to retry uploading a file, defaults to ``3``
+        :returns: Transfer report, with the number of directories, files uploaded, bytes read, retries and failures
+        :rtype: cterasdk.common.object.Object
+        """
+        upload = self._file_access.tree_upload(self._mkdir, self.mkpath(remote_dir), concurrency, retries)
+        return upload.run(local_dir)
+
+    def _mkdir(self, path, recurse):
+        try:
+            directory.mkdir(self._portal, path, recurse)
+        except directory.ItemExists:
+            pass
 
     def mkdir(self, path, recurse=False):
         """
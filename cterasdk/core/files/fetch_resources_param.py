@@ -11,6 +11,14 @@ class FetchResourcesParam(Object):
     def increment(self):
         self.start = self.start + self.limit
 
+    @property
+    def page_size(self):
+        return self.limit
+
+    @page_size.setter
+    def page_size(self, size):
+        self.limit = size
+
 
 class FetchResourcesParamBuilder:
 
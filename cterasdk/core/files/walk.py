@@ -0,0 +1,20 @@
+from ...exception import CTERAClientException, RemoteDirectoryNotFound
+from . import ls
+
+
+def list_directory(ctera_host, path, include_deleted=False):
+    """
+    List all items of a directory, page by page
+
+    :param cterasdk.core.files.path.CTERAPath path: Directory path
+    :param bool,optional include_deleted: Include deleted files, defaults to False
+    :returns: Directory items
+    :rtype: list
+    :raises cterasdk.exception.RemoteDirectoryNotFound: If the server reports the directory was not found
+    """
+    try:
+        return list(ls.ls(ctera_host, path, include_deleted=include_deleted))
+    except CTERAClientException as error:
+        if getattr(getattr(error, 'response', None), 'code', None) == 404:
+            raise RemoteDirectoryNotFound(path.fullpath()) from error
+        raise
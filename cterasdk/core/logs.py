@@ -1,9 +1,10 @@
 from datetime import datetime
 
 from .base_command import BaseCommand
-from ..lib import Iterator, Command
+from ..lib import Iterator, Command, Keyset, Follower
 from ..core import enum
 from . import query
+from ..convert import tojsonstr
 
 
 class Logs(BaseCommand):
@@ -11,13 +12,16 @@ class Logs(BaseCommand):
     Portal Logs APIs
     """
 
+    _format = '%Y-%m-%dT%H:%M:%S'
+
     def device(self,
                name,
                topic=enum.LogTopic.System,
                min_severity=enum.Severity.INFO,
                before=None,
                after=None,
-               filters=None):
+               filters=None,
+               keyset=False):
         """
         Get device logs from the Portal
 
@@ -28,14 +32,15 @@ class Logs(BaseCommand):
         :param str,optional before: Get logs before this date (in format "%m/%d/%Y %H:%M:%S"), defaults to None
         :param str,optional after: Get logs after this date (in format "%m/%d/%Y %H:%M:%S"), defaults to None
         :param list[cterasdk.core.query.FilterBuilder],optional filters: List of additional filters, defaults to None
+        :param bool,optional keyset: Page by the time of the last log returned rather than by offset, defaults to ``False``
 
         :return: Iterator for all matching logs
         :rtype: cterasdk.lib.iterator.Iterator[cterasdk.object.Object]
         """
-        return self.get(topic, min_severity, enum.OriginType.Device, name, before, after, filters)
+        return self.get(topic, min_severity, enum.OriginType.Device, name, before, after, filters, keyset)
 
     def get(self, topic=enum.LogTopic.System, min_severity=enum.Severity.INFO, origin_type=enum.OriginType.Portal, origin=None,
-            before=None, after=None, filters=None):
+            before=None, after=None, filters=None, keyset=False):
         """
         Get logs from the Portal
 
@@ -48,19 +53,63 @@ class Logs(BaseCommand):
         :param str,optional before: Get logs before this date (in format "%m/%d/%Y %H:%M:%S"), defaults to None
         :param str,optional after: Get logs after this date (in format "%m/%d/%Y %H:%M:%S"), defaults to None
         :param list[cterasdk.core.query.FilterBuilder],optional filters: List of additional filters, defaults to None
+        :param bool,optional keyset: Page by the time of the last log returned rather than by offset, defaults to ``False``.
+         Each page is requested from the time of the last log, which avoids deep offsets on large log tables,
+         and logs added while iterating do not shift the next page
 
         :return: Iterator for all matching logs
         :rtype: cterasdk.lib.iterator.Iterator[cterasdk.object.Object]
         """
+        param = Logs._query_param(topic, min_severity, origin_type, origin, before, after, filters)
+        function = Command(self._query_logs)
+        if keyset:
+            function = Keyset(function, Logs._time, Logs._identity, Logs._boundary)
+
+        return Iterator(function, param)
+
+    def follow(self, topic=enum.LogTopic.System, min_severity=enum.Severity.INFO, origin_type=enum.OriginType.Portal, origin=None,
+               since=None, filters=None, interval=1, max_interval=60):
+        """
+        Follow logs from the Portal, polling for new logs
+
+        :param cterasdk.core.enum.LogTopic,optional topic: Log topic to get, defaults to cterasdk.core.enum.LogTopic.System
+        :param cterasdk.core.enum.Severity,optional min_severity:
+         Minimun severity of logs to get, defaults to cterasdk.core.enum.Severity.INFO
+        :param cterasdk.core.enum.OriginType,optional origin_type:
+         Origin type of the logs to get, defaults to cterasdk.core.enum.OriginType.Portal
+        :param str,optional origin: Log origin (e.g. device name, Portal server name), defaults to None
+        :param str,optional since: Get logs since this date (in format "%m/%d/%Y %H:%M:%S"), defaults to the current time
+        :param list[cterasdk.core.query.FilterBuilder],optional filters: List of additional filters, defaults to None
+        :param float,optional interval: Minimum interval between polls, in seconds, defaults to ``1``
+        :param float,optional max_interval: Maximum interval between polls, when no new logs are found, in seconds, defaults to ``60``
+
+        :return: Generator of logs, in order of time. Each poll only gets the logs since the time of the last log returned
+        :rtype: cterasdk.lib.follow.Follower
+        """
+        def poll(mark):
+            conditions = list(filters or [])
+            if mark is not None:
+                conditions.append(query.FilterBuilder('time').ge(datetime.strptime(mark, Logs._format)))
+            return self.get(topic, min_severity, origin_type, origin, filters=conditions, keyset=True)
+
+        mark = (self._strptime(since) if since is not None else datetime.now()).strftime(Logs._format)
+        return Follower(poll, Logs._time, Logs._identity, mark, interval, max_interval)
+
+    def _query_logs(self, param):
+        response = self._portal.execute('', 'queryLogs', param)
+        return (response.hasMore, response.logs)
+
+    @staticmethod
+    def _query_param(topic, min_severity, origin_type, origin, before, after, filters):
         builder = query.QueryParamBuilder().put('topic', topic).put('minSeverity', min_severity)
 
         builder.addFilter(query.FilterBuilder('originType').eq(origin_type))
 
         if before is not None:
-            builder.addFilter(query.FilterBuilder('time').before(self._strptime(before)))
+            builder.addFilter(query.FilterBuilder('time').before(Logs._strptime(before)))
 
         if after is not None:
-            builder.addFilter(query.FilterBuilder('time').after(self._strptime(after)))
+            builder.addFilter(query.FilterBuilder('time').after(Logs._strptime(after)))
 
         if origin is not None:
             builder.addFilter(query.FilterBuilder.ref('origin').eq(origin))
@@ -69,14 +118,23 @@ class Logs(BaseCommand):
             for user_filter in filters:
                 builder.addFilter(user_filter)
 
-        param = builder.build()
-        function = Command(self._query_logs)
+        return builder.build()
 
-        return Iterator(function, param)
+    @staticmethod
+    def _time(log):
+        try:
+            return datetime.strptime(log.time[:19], Logs._format).strftime(Logs._format)
+        except (AttributeError, TypeError, ValueError):
+            return None
 
-    def _query_logs(self, param):
-        response = self._portal.execute('', 'queryLogs', param)
-        return (response.hasMore, response.logs)
+    @staticmethod
+    def _identity(log):
+        return getattr(log, 'id', None) or tojsonstr(log, pretty_print=False, no_log=False)
+
+    @staticmethod
+    def _boundary(time, direction):
+        time = datetime.strptime(time, Logs._format)
+        return query.FilterBuilder('time').ge(time) if direction > 0 else query.FilterBuilder('time').le(time)
 
     @staticmethod
     def _strptime(datetime_str):
@@ -3,6 +3,7 @@ from .base_command import BaseCommand
 from ..exception import CTERAException, InputError
 from .enum import PlanItem, PlanRetention
 from ..common import union, convert_size, DataUnit, PolicyRuleConverter
+from ..lib import Projection
 from . import query
 
 
@@ -73,9 +74,8 @@ class Plans(BaseCommand):
         :param list[str] include: List of fields to retrieve, defaults to ['name']
         :return: The subscription plan, including the requested fields
         """
-        include = union(include or [], Plans.default)
-        include = ['/' + attr for attr in include]
-        plan = self._portal.get_multi('/plans/' + name, include)
+        projection = Projection(include, Plans.default)
+        plan = projection.enforce(self._portal.get_multi('/plans/' + name, projection.paths))
         if plan.name is None:
             raise CTERAException('Could not find subscription plan', None, name=name)
         return plan
@@ -2,7 +2,7 @@ import logging
 
 from ..exception import CTERAException
 from .base_command import BaseCommand
-from ..lib import Iterator, Command
+from ..lib import Iterator, Command, Projection
 from ..common import Object
 from ..common import union
 from . import enum
@@ -23,9 +23,8 @@ class Portals(BaseCommand):
         :param str name: Name of the tenant
         :param list[str] include: List of fields to retrieve, defaults to ['name']
         """
-        include = union(include or [], Portals.default)
-        include = ['/' + attr for attr in include]
-        tenant = self._portal.get_multi('/portals/' + name, include)
+        projection = Projection(include, Portals.default)
+        tenant = projection.enforce(self._portal.get_multi('/portals/' + name, projection.paths))
         if tenant.name is None:
             raise CTERAException('Could not find tenant', None, name=name)
         return tenant
@@ -1,13 +1,17 @@
+import functools
 from datetime import datetime
 
-from ..lib import Iterator, Command
+from ..lib import Iterator, ParallelIterator, Projection
+from ..lib.export import Format, export as export_objects
 from ..common import Object
 from ..convert import tojsonstr
+from .. import config
 
 
-def query(CTERAHost, path, param):
-    response = CTERAHost.db(path, 'query', param)
-    return (response.hasMore, response.objects)
+def query(CTERAHost, path, param, compact=False):
+    response = CTERAHost.db(path, 'query', param, compact=compact)
+    include = getattr(param, 'include', None)
+    return (response.hasMore, Projection(include).enforce(response.objects) if include else response.objects)
 
 
 def show(CTERAHost, path, param):
@@ -16,9 +20,27 @@ def show(CTERAHost, path, param):
     return hasMore
 
 
-def iterator(CTERAHost, path, param):
-    function = Command(query, CTERAHost, path)
-    return Iterator(function, param)
+def iterator(CTERAHost, path, param, compact=False, prefetch=None, parallel=None, ordered=None, pager=None):
+    function = functools.partial(query, CTERAHost, path, compact=compact)
+    parallel = config.iterator['parallel'] if parallel is None else parallel
+    if parallel > 1:
+        return ParallelIterator(function, param, parallel, config.iterator['ordered'] if ordered is None else ordered)
+    return Iterator(function, param, prefetch, pager)
+
+
+def export(objects, sink, fields=None, format=Format.NDJSON, concurrent=False):  # pylint: disable=redefined-builtin
+    """
+    Export query results to a file, writing rows as they are fetched
+
+    :param iterable objects: Query results, such as a query iterator, see :func:`iterator`
+    :param object sink: Path of a file to create, or a file object
+    :param list[str],optional fields: Field paths to export, nested attributes separated by ``/``, defaults to all fields
+    :param str,optional format: Export format: ``'ndjson'``, ``'csv'`` or ``'arrow'``, defaults to ``'ndjson'``
+    :param bool,optional concurrent: Write rows on a background thread while the next pages are fetched, defaults to ``False``
+    :returns: Number of rows written
+    :rtype: int
+    """
+    return export_objects(objects, sink, fields, format, concurrent)
 
 
 class Restriction:
@@ -132,6 +154,14 @@ class QueryParams(Object):
     def increment(self):
         self.startFrom = self.startFrom + self.countLimit
 
+    @property
+    def page_size(self):
+        return self.countLimit
+
+    @page_size.setter
+    def page_size(self, size):
+        self.countLimit = size
+
 
 class QueryParamBuilder:
 
@@ -0,0 +1,143 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ..exception import CTERAException
+from .session import Session
+
+
+class TenantPool:
+    """
+    Pool of Global Admin sessions for running work on many tenants in parallel.
+
+    Browsing a tenant changes the current tenant of the session on the Portal, so a single session can only
+    work on one tenant at a time. The pool logs in up to ``size`` separate sessions, and assigns each call to
+    an idle session already browsing the requested tenant, if there is one, to switch tenants only when required.
+
+    :param cterasdk.object.Portal.GlobalAdmin admin: Global Admin object, used for the Portal address
+    :param str username: User name to log in
+    :param str password: User password
+    :param int,optional size: Maximum number of sessions, defaults to ``4``
+    """
+
+    def __init__(self, admin, username, password, size=4):
+        self._admin = admin
+        self._username = username
+        self._password = password
+        self._size = size
+        self._sessions = []
+        self._idle = []
+        self._available = threading.Condition()
+        self._closed = False
+
+    @property
+    def size(self):
+        return self._size
+
+    def map(self, function, tenants, concurrency=None):
+        """
+        Run a function on each tenant, in parallel
+
+        :param callable function: Function to run, called with a Global Admin object browsing the tenant, and the tenant name
+        :param list[str] tenants: Tenant names
+        :param int,optional concurrency: Number of tenants to run concurrently, defaults to the pool size
+        :returns: Function results, in the order of the tenants
+        :rtype: list
+        """
+        tenants = list(tenants)
+        if not tenants:
+            return []
+        concurrency = min(concurrency or self._size, self._size, len(tenants))
+        logging.getLogger().info('Running on tenants. %s', {'tenants': len(tenants), 'concurrency': concurrency})
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(lambda tenant: self.run(function, tenant), tenants))
+
+    def run(self, function, tenant):
+        """
+        Run a function on a tenant, using a session from the pool
+
+        :param callable function: Function to run, called with a Global Admin object browsing the tenant, and the tenant name
+        :param str tenant: Tenant name, or ``None`` for the Global Administration
+        :returns: Function result
+        """
+        session = self._acquire(tenant)
+        try:
+            if TenantPool._tenant(session) != (tenant or Session.Administration):
+                if tenant:
+                    session.portals.browse(tenant)
+                else:
+                    session.portals.browse_global_admin()
+            return function(session, tenant)
+        finally:
+            self._release(session)
+
+    def _acquire(self, tenant):
+        with self._available:
+            while True:
+                if self._closed:
+                    raise CTERAException('Tenant pool is closed')
+                session = self._idle_session(tenant)
+                if session is not None:
+                    return session
+                if len(self._sessions) < self._size:
+                    self._sessions.append(None)  # reserve a slot, and log in without holding the lock
+                    break
+                self._available.wait()
+        try:
+            session = self._login()
+        except BaseException:
+            with self._available:
+                self._sessions.remove(None)
+                self._available.notify()
+            raise
+        with self._available:
+            self._sessions[self._sessions.index(None)] = session
+        return session
+
+    def _idle_session(self, tenant):
+        if not self._idle:
+            return None
+        tenant = tenant or Session.Administration
+        for session in self._idle:
+            if TenantPool._tenant(session) == tenant:
+                break
+        else:
+            session = self._idle[0]
+        self._idle.remove(session)
+        return session
+
+    def _release(self, session):
+        with self._available:
+            self._idle.append(session)
+            self._available.notify()
+
+    def _login(self):
+        session = type(self._admin)(self._admin.host(), self._admin.port(), self._admin.https())
+        session.login(self._username, self._password)
+        logging.getLogger().debug('Started tenant pool session. %s', {'host': self._admin.host(), 'user': self._username})
+        return session
+
+    @staticmethod
+    def _tenant(session):
+        return session.session().tenant()
+
+    def close(self):
+        """
+        Log out all sessions
+        """
+        with self._available:
+            self._closed = True
+            sessions, self._sessions, self._idle = [session for session in self._sessions if session is not None], [], []
+            self._available.notify_all()
+        for session in sessions:
+            try:
+                session.logout()
+            except Exception:  # pylint: disable=broad-except
+                logging.getLogger().warning('Failed to log out tenant pool session. %s', {'host': self._admin.host()})
+        logging.getLogger().debug('Closed tenant pool. %s', {'sessions': len(sessions)})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
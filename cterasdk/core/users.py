@@ -5,6 +5,7 @@ from .types import UserAccount
 from ..exception import CTERAException
 from ..common import Object, DateTimeUtils
 from ..common import union
+from ..lib import Projection
 from . import query
 
 
@@ -33,9 +34,8 @@ class Users(BaseCommand):
         """
         baseurl = '/users/%s' % user_account.name if user_account.is_local \
             else '/domains/%s/adUsers/%s' % (user_account.directory, user_account.name)
-        include = union(include or [], Users.default)
-        include = ['/' + attr for attr in include]
-        user_object = self._portal.get_multi(baseurl, include)
+        projection = Projection(include, Users.default)
+        user_object = projection.enforce(self._portal.get_multi(baseurl, projection.paths))
         if user_object.name is None:
             raise CTERAException('Could not find user', None, user_directory=user_account.directory, username=user_account.name)
         return user_object
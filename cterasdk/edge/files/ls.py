@@ -0,0 +1,25 @@
+from urllib.parse import unquote, urlparse
+
+
+def ls(ctera_host, path):
+    """
+    List the items of a directory
+
+    :param cterasdk.edge.files.path.CTERAPath path: Directory path
+    :returns: Directory items, with their ``name``, ``path``, ``isFolder``, ``size`` and ``lastmodified`` properties
+    :rtype: list[cterasdk.common.object.Object]
+    """
+    directory = path.fullpath().strip('/')
+    items = []
+    for resource in ctera_host.propfind(ctera_host.make_local_files_dir(path.fullpath()), depth=1, use_file_url=True):
+        resource.path = _relative(resource.href)
+        if resource.path != directory:
+            items.append(resource)
+    return items
+
+
+def _relative(href):
+    """ Path of a resource relative to the root of the Edge Filer """
+    href = unquote(urlparse(href).path)
+    _, _, path = href.partition('localFiles/')
+    return path.strip('/')
@@ -1,7 +1,7 @@
 # pylint: disable=line-too-long
 import logging
 
-from ..lib import Command, Iterator
+from ..lib import Command, Iterator, Keyset, Follower
 from . import query
 from . import enum
 from .base_command import BaseCommand
@@ -31,13 +31,15 @@ class Logs(BaseCommand):
         self._gateway.put('/config/logging/general', log_config)
         logging.getLogger().info('Log settings updated. %s', {'retention': retention, 'min_severity': log_config.minSeverity})
 
-    def logs(self, topic, include=None, minSeverity=enum.Severity.INFO):
+    def logs(self, topic, include=None, minSeverity=enum.Severity.INFO, keyset=False):
         """
         Fetch Gateway logs
 
         :param str topic: Log Topic to fetch
         :param list[str],optional include: List of fields to include in the response, defailts to Logs.default_include
         :param cterasdk.edge.enum.Severity,optional minSeverity: Minimal log severity to fetch, defaults to cterasdk.edge.enum.Severity.INFO
+        :param bool,optional keyset: Skip logs that were already returned, shifted to the next page by logs added while iterating,
+         defaults to ``False``
 
         :return: Log lines
         :rtype: cterasdk.lib.iterator.Iterator
@@ -45,8 +47,41 @@ class Logs(BaseCommand):
         param = query.QueryParamBuilder().include(
             include or Logs.default_include).put('topic', topic).put('minSeverity', minSeverity).build()
         function = Command(self._query_logs)
+        if keyset:
+            function = Keyset(function, lambda log: getattr(log, 'time', None))
         return Iterator(function, param)
 
+    def follow(self, topic, include=None, minSeverity=enum.Severity.INFO, interval=1, max_interval=60):
+        """
+        Follow Gateway logs, polling for new logs
+
+        :param str topic: Log Topic to fetch
+        :param list[str],optional include: List of fields to include in the response, defailts to Logs.default_include
+        :param cterasdk.edge.enum.Severity,optional minSeverity: Minimal log severity to fetch, defaults to cterasdk.edge.enum.Severity.INFO
+        :param float,optional interval: Minimum interval between polls, in seconds, defaults to ``1``
+        :param float,optional max_interval: Maximum interval between polls, when no new logs are found, in seconds, defaults to ``60``
+
+        :return: Generator of log lines, in order of time, starting from the newest log
+        :rtype: cterasdk.lib.follow.Follower
+        """
+        include = include or Logs.default_include
+        if 'time' not in include:
+            include = include + ['time']
+
+        def poll(mark):
+            with self.logs(topic, include, minSeverity, keyset=True) as iterator:
+                first = None
+                for log in iterator:
+                    time = getattr(log, 'time', None)
+                    first = time if first is None else first
+                    if mark is None and time != first:
+                        return  # logs are returned newest first, start following from the newest log
+                    if None not in (mark, time) and time < mark and time < first:
+                        return  # logs are returned newest first, the remaining logs were already returned
+                    yield log
+
+        return Follower(poll, lambda log: getattr(log, 'time', None), interval=interval, max_interval=max_interval)
+
     def _query_logs(self, param):
         response = self._gateway.execute('/config/logging/general', 'pagedQuery', param)
         return (response.hasMore, response.logs)
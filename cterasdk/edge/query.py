@@ -25,6 +25,14 @@ class QueryParam(Object):
     def increment(self):
         self.startFrom = self.startFrom + self.countLimit
 
+    @property
+    def page_size(self):
+        return self.countLimit
+
+    @page_size.setter
+    def page_size(self, size):
+        self.countLimit = size
+
 
 class QueryParamBuilder:
 
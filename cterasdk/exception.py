@@ -39,12 +39,24 @@ class ConnectionTimeout(CTERAException):
         super().__init__(message, None, seconds=seconds, **kwargs)
 
 
+class ConnectionClosed(CTERAException):
+
+    def __init__(self, **kwargs):
+        super().__init__('Connection closed before the end of the response', None, **kwargs)
+
+
 class HostUnreachable(CTERAConnectionError):
 
     def __init__(self, instance, host, port, protocol):
         super().__init__("Unable to reach host", instance, host=host, port=port, protocol=protocol)
 
 
+class CircuitBreakerOpen(CTERAConnectionError):
+
+    def __init__(self, host, port, protocol, baseurl, retry_in):
+        super().__init__('Circuit breaker is open', None, host, port, protocol, baseurl=baseurl, retry_in=retry_in)
+
+
 class ExhaustedException(ConnectionTimeout):
 
     def __init__(self, retries, timeout):
@@ -0,0 +1,268 @@
+import csv
+import json
+import logging
+import os
+import pickle
+import queue
+import tempfile
+import threading
+
+from ..common import Object, Record
+from ..exception import CTERAException
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+class Format:
+    """
+    Export Formats
+
+    :ivar str NDJSON: Newline delimited JSON, one object per line
+    :ivar str CSV: Comma separated values, with a header row
+    :ivar str Arrow: Apache Arrow IPC stream, requires ``pyarrow``
+    """
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+    Arrow = 'arrow'
+
+
+def export(objects, sink, fields=None, format=Format.NDJSON, concurrent=False, batch=1000):  # pylint: disable=redefined-builtin
+    """
+    Write objects to a file, one row per object, as they are iterated.
+
+    Nested attributes are flattened by field path, e.g. ``owner/name``. Lists and objects are written as JSON strings,
+    except to NDJSON, which keeps their structure. If no fields are specified, NDJSON rows include the entire object,
+    and CSV and Arrow rows include the fields of the first object.
+
+    :param iterable objects: Objects to export, such as a query iterator
+    :param object sink: Path of a file to create, or a file object, opened in binary mode for Arrow and in text mode otherwise
+    :param list[str],optional fields: Field paths to export, nested attributes separated by ``/``, defaults to all fields
+    :param str,optional format: Export format, see :class:`cterasdk.lib.export.Format`, defaults to NDJSON
+    :param bool,optional concurrent: Write rows on a background thread while the next objects are fetched, defaults to ``False``
+    :param int,optional batch: Number of rows to write at a time, defaults to ``1000``
+    :returns: Number of rows written
+    :rtype: int
+    """
+    writers = {Format.NDJSON: NDJSONWriter, Format.CSV: CSVWriter, Format.Arrow: ArrowWriter}
+    if format not in writers:
+        raise CTERAException('Unsupported export format', None, format=format, supported=list(writers))
+    if format == Format.Arrow and pyarrow is None:
+        raise CTERAException('Arrow export requires pyarrow. Install it using: pip install pyarrow')
+    fields = [field.split('/') for field in fields] if fields else None
+    if isinstance(sink, str):
+        f = open(os.path.expanduser(sink), 'wb' if format == Format.Arrow else 'w', **_text(format))  # pylint: disable=R1732
+    else:
+        f = sink
+    try:
+        writer = writers[format](f, fields)
+        count = _write(writer, objects, batch, concurrent)
+        writer.close()
+    finally:
+        if f is not sink:
+            f.close()
+    logging.getLogger().info('Exported objects. %s', {'format': format, 'count': count})
+    return count
+
+
+def _text(format):  # pylint: disable=redefined-builtin
+    if format == Format.Arrow:
+        return {}
+    return dict(encoding='utf-8', newline='' if format == Format.CSV else None)
+
+
+def _write(writer, objects, batch, concurrent):
+    count = 0
+    if not concurrent:
+        rows = []
+        for o in objects:
+            rows.append(o)
+            if len(rows) >= batch:
+                writer.write(rows)
+                count, rows = count + len(rows), []
+        if rows:
+            writer.write(rows)
+        return count + len(rows)
+    return _write_concurrently(writer, objects, batch)
+
+
+def _write_concurrently(writer, objects, batch):
+    batches = queue.Queue(maxsize=2)
+    errors = []
+
+    def consume():
+        while True:
+            rows = batches.get()
+            if rows is None:
+                return
+            if not errors:
+                try:
+                    writer.write(rows)
+                except Exception as error:  # pylint: disable=broad-except
+                    errors.append(error)
+
+    thread = threading.Thread(target=consume, daemon=True)
+    thread.start()
+    count, rows = 0, []
+    try:
+        for o in objects:
+            if errors:
+                break
+            rows.append(o)
+            if len(rows) >= batch:
+                batches.put(rows)
+                count, rows = count + len(rows), []
+        if rows and not errors:
+            batches.put(rows)
+            count = count + len(rows)
+    finally:
+        batches.put(None)
+        thread.join()
+    if errors:
+        raise errors[0]
+    return count
+
+
+def _resolve(o, path):
+    for name in path:
+        if not isinstance(o, (Object, Record)):
+            return None
+        o = getattr(o, name, None)
+    return o
+
+
+def _flatten(o, prefix=()):
+    """ Field paths of the leaf attributes of an object """
+    paths = []
+    for name, value in o.__dict__.items():
+        if name.startswith('_'):
+            continue
+        if isinstance(value, (Object, Record)):
+            paths.extend(_flatten(value, prefix + (name,)))
+        else:
+            paths.append(list(prefix + (name,)))
+    return paths
+
+
+def _default(o):
+    return {k: v for k, v in o.__dict__.items() if not k.startswith('_')}
+
+
+def _scalar(value):
+    if isinstance(value, (Object, Record, list)):
+        return json.dumps(value, default=_default)
+    return value
+
+
+class NDJSONWriter:
+    """ Write rows as newline delimited JSON """
+
+    def __init__(self, f, fields):
+        self._f = f
+        self._fields = fields
+        self._encoder = json.JSONEncoder(default=_default)
+
+    def write(self, objects):
+        lines = []
+        for o in objects:
+            if self._fields is None:
+                lines.append(self._encoder.encode(o))
+            else:
+                lines.append(self._encoder.encode({'/'.join(path): _resolve(o, path) for path in self._fields}))
+        self._f.write('\n'.join(lines) + '\n')
+
+    def close(self):
+        pass
+
+
+class CSVWriter:
+    """ Write rows as comma separated values, with a header row """
+
+    def __init__(self, f, fields):
+        self._f = f
+        self._fields = fields
+        self._writer = None
+
+    def write(self, objects):
+        if self._writer is None:
+            self._fields = self._fields or _flatten(objects[0])
+            self._writer = csv.writer(self._f)
+            self._writer.writerow(['/'.join(path) for path in self._fields])
+        self._writer.writerows([_scalar(_resolve(o, path)) for path in self._fields] for o in objects)
+
+    def close(self):
+        if self._writer is None and self._fields:
+            csv.writer(self._f).writerow(['/'.join(path) for path in self._fields])
+
+
+class ArrowWriter:
+    """
+    Write rows as record batches of an Apache Arrow IPC stream.
+
+    The schema of a stream is written before its first batch, so batches are spooled to a temporary file while the type
+    of each column is unified across all batches, and the stream is written on close. Integer columns with floating point
+    values are written as floats. Columns with no values, or with values of different types, are written as strings.
+    """
+
+    def __init__(self, f, fields):
+        self._f = f
+        self._fields = fields
+        self._types = None
+        self._spool = None
+
+    def write(self, objects):
+        if self._spool is None:
+            self._fields = self._fields or _flatten(objects[0])
+            self._types = [pyarrow.null()] * len(self._fields)
+            self._spool = tempfile.TemporaryFile()  # pylint: disable=R1732
+        columns = [[_scalar(_resolve(o, path)) for o in objects] for path in self._fields]
+        self._types = [ArrowWriter._unify(kind, ArrowWriter._type(column)) for kind, column in zip(self._types, columns)]
+        pickle.dump(columns, self._spool, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _type(column):
+        """ Type of the values of a column in a batch. Values of different types are typed as strings """
+        try:
+            return pyarrow.array(column).type
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            return pyarrow.string()
+
+    @staticmethod
+    def _unify(kind, other):
+        """ Type of a column with values of both types """
+        if kind == other or other == pyarrow.null():
+            return kind
+        if kind == pyarrow.null():
+            return other
+        numeric = [pyarrow.types.is_integer(t) or pyarrow.types.is_floating(t) for t in (kind, other)]
+        return pyarrow.float64() if all(numeric) else pyarrow.string()
+
+    @staticmethod
+    def _array(column, kind):
+        if kind == pyarrow.string():
+            return pyarrow.array([None if value is None else str(value) for value in column], type=kind)
+        return pyarrow.array(column, type=kind)
+
+    def close(self):
+        if not self._fields:
+            return
+        types = [pyarrow.string() if kind == pyarrow.null() else kind for kind in self._types or [pyarrow.null()] * len(self._fields)]
+        schema = pyarrow.schema([('/'.join(path), kind) for path, kind in zip(self._fields, types)])
+        writer = pyarrow.ipc.new_stream(self._f, schema)
+        try:
+            if self._spool is not None:
+                self._spool.seek(0)
+                while True:
+                    try:
+                        columns = pickle.load(self._spool)
+                    except EOFError:
+                        break
+                    arrays = [ArrowWriter._array(column, kind) for column, kind in zip(columns, types)]
+                    writer.write_batch(pyarrow.record_batch(arrays, schema=schema))
+        finally:
+            writer.close()
+            if self._spool is not None:
+                self._spool.close()
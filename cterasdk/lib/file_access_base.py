@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 
+from .. import config
 from ..convert import toxmlstr
 from .filesystem import FileSystem
+from .transfer import TreeDownload, TreeUpload, SegmentedDownload, retry
 
 
 class FileAccessBase(ABC):
@@ -9,10 +11,21 @@ class FileAccessBase(ABC):
         self._ctera_host = ctera_host
         self._filesystem = FileSystem.instance()
 
-    def download(self, path, destination=None):
+    def download(self, path, destination=None, segments=None, chunk_size=None, resume=False):  # pylint: disable=too-many-arguments
         directory, filename = self._split_destination(destination, path.name)
+        if resume or (segments is not None and segments > 1):
+            retries = config.filesystem['retries'] if resume else 0
+
+            def write(filepath):
+                return retry(lambda: self._segmented_download(path, segments, chunk_size, resume).write(filepath), retries)
+
+            return self._filesystem.save_with(directory, filename, write, keep=resume)
         handle = self._openfile(path)
-        self._filesystem.save(directory, filename, handle)
+        return self._filesystem.save(directory, filename, handle, chunk_size)
+
+    def _segmented_download(self, path, segments, chunk_size, resume):
+        handle = self._openfile(path, SegmentedDownload.first())
+        return SegmentedDownload(lambda headers: self._openfile(path, headers), handle, segments, chunk_size, resume)
 
     def download_as_zip(self, cloud_directory, files, destination=None):
         files = files if isinstance(files, list) else [files]
@@ -25,11 +38,37 @@ class FileAccessBase(ABC):
         handle = self._get_zip_file_handle(cloud_directory, files)
         self._filesystem.save(directory, filename, handle)
 
-    def upload(self, local_file, dest_path):
+    def tree_download(self, destination, concurrency=None, bandwidth=None):
+        """
+        Create a directory tree download, streaming files using this object
+
+        :param str destination: Local directory to download the tree to
+        :param int,optional concurrency: Number of files to download concurrently, defaults to ``1``
+        :param int,optional bandwidth: Maximum total download rate, in bytes per second, defaults to unlimited
+        :rtype: cterasdk.lib.transfer.TreeDownload
+        """
+        return TreeDownload(self._openfile, destination, concurrency, bandwidth)
+
+    def tree_upload(self, mkdir, destination, concurrency=None, retries=None):
+        """
+        Create a directory tree upload, uploading files using this object
+
+        :param callable mkdir: Function receiving a remote directory path and whether to create its parents, ignoring existing directories
+        :param object destination: Path of the remote directory to upload the tree to
+        :param int,optional concurrency: Number of directories to create, and files to upload, concurrently, defaults to ``1``
+        :param int,optional retries: Number of times to retry uploading a file, defaults to ``3``
+        :rtype: cterasdk.lib.transfer.TreeUpload
+        """
+        return TreeUpload(mkdir, self._get_upload_url, self._upload, destination, concurrency, retries)
+
+    def upload(self, local_file, dest_path, retries=None):
+        return retry(lambda: self._upload(local_file, dest_path, self._get_upload_url(dest_path)), retries or 0)
+
+    def _upload(self, local_file, dest_path, upload_url):
         local_file_info = self._filesystem.get_local_file_info(local_file)
         with open(local_file, 'rb') as fd:
             return self._ctera_host.upload(
-                self._get_upload_url(dest_path),
+                upload_url,
                 self._get_upload_form(local_file_info, fd, dest_path),
                 use_file_url=True
             )
@@ -42,8 +81,8 @@ class FileAccessBase(ABC):
     def _get_upload_form(self, local_file_info, fd, dest_path):
         raise NotImplementedError("Subclass must implement _get_upload_form")
 
-    def _openfile(self, path):
-        return self._ctera_host.openfile(self._get_single_file_url(path), use_file_url=True)
+    def _openfile(self, path, headers=None):
+        return self._ctera_host.openfile(self._get_single_file_url(path), use_file_url=True, headers=headers)
 
     @abstractmethod
     def _get_single_file_url(self, path):
@@ -44,14 +44,31 @@ class FileSystem:
         if not self.exists(dirpath):
             raise LocalDirectoryNotFound(dirpath)
 
-    def save(self, dirpath, filename, handle):
+    def save(self, dirpath, filename, handle, chunk_size=None):
+        return self.save_with(dirpath, filename, lambda filepath: self.write(filepath, handle, chunk_size))
+
+    def save_with(self, dirpath, filename, write, keep=False):
+        """
+        Save a file, writing it to a temporary file first
+
+        :param str dirpath: Directory to save the file to
+        :param str filename: File name, versioned if a file with the same name exists
+        :param callable write: Function receiving the path of the temporary file to write
+        :param bool,optional keep: Keep the temporary file if writing fails, to resume writing it later, defaults to ``False``
+        :returns: Path of the saved file
+        """
         dirpath = os.path.expanduser(dirpath)
         if not self.exists(dirpath):
             raise LocalDirectoryNotFound(dirpath)
 
         tempfile = filename + '.Chopin3'
         filepath = os.path.join(dirpath, tempfile)
-        self.write(filepath, handle)
+        try:
+            write(filepath)
+        except BaseException:
+            if self.exists(filepath) and not keep:
+                os.remove(filepath)
+            raise
         origin = filename
         version = 0
         while True:
@@ -80,9 +97,9 @@ class FileSystem:
         return name + ' ' + '(' + str(version) + ')' + extension
 
     @staticmethod
-    def write(filepath, handle):
+    def write(filepath, handle, chunk_size=None):
         with open(filepath, 'w+b') as fd:
-            for chunk in handle.iter_content(chunk_size=8192):
+            for chunk in handle.iter_content(chunk_size=chunk_size or config.filesystem['chunk_size']):
                 fd.write(chunk)
         logging.getLogger().debug('Saved temporary file. %s', {'path': filepath})
 
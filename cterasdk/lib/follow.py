@@ -0,0 +1,110 @@
+import itertools
+import logging
+import threading
+
+from ..convert import tojsonstr
+
+
+class Follower:
+    """
+    Poll for objects newer than the last object returned, such as new logs.
+
+    The key of the last object returned, the high-water mark, is passed to the poll function,
+    which returns the objects at or after it. Objects preceding the mark, or returned before with the same key, are skipped.
+    Only the identifiers of the objects returned with the key of the mark are kept to detect duplicates.
+    The objects of a poll are read one page at a time, and each page is returned in order of key,
+    so objects are returned in order of key if the poll returns them in ascending order.
+    The interval between polls grows while polls return no objects, and is reset once objects are returned.
+
+    :param callable poll: Function receiving the high-water mark, or ``None``, and returning an iterable of the objects at or after it
+    :param callable key: Function returning the key of an object, or ``None`` if the object has no valid key
+    :param callable,optional identity: Function returning a unique identifier of an object, defaults to the serialized object
+    :param str,optional mark: Initial high-water mark, defaults to ``None``, to return all objects on the first poll.
+     Objects with the key of the initial mark are returned
+    :param float,optional interval: Minimum interval between polls, in seconds, defaults to ``1``
+    :param float,optional max_interval: Maximum interval between polls, in seconds, defaults to ``60``
+    :param float,optional backoff: Factor to grow the interval by after an idle poll, defaults to ``2``
+    """
+
+    page = 1000  # objects to read from a poll, and order by key, at a time
+
+    def __init__(self, poll, key, identity=None, mark=None, interval=1, max_interval=60, backoff=2):  # pylint: disable=too-many-arguments
+        self._poll = poll
+        self._key = key
+        self._identity = identity if identity is not None else Follower._serialize
+        self._mark = mark
+        self._seen = set()
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._stopped = threading.Event()
+
+    def __iter__(self):
+        delay = self.interval
+        while not self._stopped.is_set():
+            count = 0
+            for page in self._pages():
+                for key, o in page:
+                    self._advance(key, o)
+                    yield o
+                count = count + len(page)
+            delay = self.interval if count else min(self.max_interval, delay * self.backoff)
+            logging.getLogger().debug('Polled for new objects. %s', {'count': count, 'mark': self._mark, 'delay': delay})
+            self._stopped.wait(delay)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def mark(self):
+        """ Key of the last object returned, to follow from on a new follower """
+        return self._mark
+
+    def close(self):
+        """ Stop polling """
+        self._stopped.set()
+
+    def _pages(self):
+        """ Poll for new objects, one page at a time, each ordered by key """
+        mark, seen = self._mark, set(self._seen)
+        objects = iter(self._poll(mark))
+        try:
+            while True:
+                chunk = list(itertools.islice(objects, Follower.page))
+                page = []
+                for o in chunk:
+                    key = self._key(o)
+                    if key is None or Follower._returned(mark, seen, key, self._identity(o)):
+                        continue
+                    page.append((key, o))
+                page.sort(key=lambda item: item[0])
+                if page:
+                    yield page
+                if len(chunk) < Follower.page:
+                    return
+        finally:
+            if hasattr(objects, 'close'):
+                objects.close()
+
+    def _advance(self, key, o):
+        if self._mark is None or key > self._mark:
+            self._mark = key
+            self._seen = set()
+        if key == self._mark:
+            self._seen.add(self._identity(o))
+
+    @staticmethod
+    def _returned(mark, seen, key, identity):
+        """ Whether an object was returned before the poll, given the mark and the objects seen at the start of the poll """
+        if mark is None:
+            return False
+        if key == mark:
+            return identity in seen
+        return key < mark
+
+    @staticmethod
+    def _serialize(o):
+        return tojsonstr(o, pretty_print=False, no_log=False)
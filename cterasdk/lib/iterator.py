@@ -1,30 +1,542 @@
+import asyncio
+import collections
+import copy
+import functools
 import logging
+import os
+import queue
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
+from .pager import AdaptivePager
+from ..common import Object
+from ..convert import fromjsonstr, tojsonstr
+from ..exception import CTERAException
+from .. import config
 
-class Iterator:
-    """ Objects Iterator """
 
-    def __init__(self, function, param):
+class Iterator:  # pylint: disable=too-many-instance-attributes
+    """
+    Objects Iterator
+
+    The position of the iterator is described by a :attr:`cursor`, which can be saved and used to resume
+    the iteration from the same position on a new iterator, see :func:`resume` and :func:`checkpoint`.
+
+    :param callable function: Function returning a tuple of ``(hasMore, objects)`` for the page described by ``param``
+    :param object param: Query parameter, advanced to the next page by calling ``param.increment()``
+    :param int,optional prefetch: Number of pages to fetch ahead on a background thread while the current page is consumed,
+     defaults to ``config.iterator['prefetch']``. Set to ``0`` to fetch each page only after the current page was consumed
+    :param cterasdk.lib.pager.AdaptivePager,optional pager: Adjust the page size to the response latency,
+     defaults to a new pager if ``config.iterator['pager']['enabled']`` is set
+    """
+
+    def __init__(self, function, param, prefetch=None, pager=None):
+        if pager is None and config.iterator['pager']['enabled']:
+            pager = AdaptivePager.from_config()
+        self.pager = pager
+        if pager is not None:
+            function = functools.partial(pager.fetch, function)
         self._function = function
         self._param = param
         self._hasMore = True
-        self._objects = []
+        self._objects = collections.deque()
+        self._page = None  # state of the query parameter of the current page
+        self._length = 0  # number of objects in the current page
+        self._skip = 0  # number of objects to skip when resuming
+        self._pages = 0
+        self._started = False
+        self._checkpoint = None
+        prefetch = config.iterator['prefetch'] if prefetch is None else prefetch
+        self._prefetcher = Prefetcher(function, param, prefetch) if prefetch > 0 else None
+        if self._prefetcher is not None:
+            weakref.finalize(self, self._prefetcher.stop)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if not self._objects:
-            if self._hasMore:
-                self._hasMore, self._objects = self._function(self._param)
-                if not self._hasMore and not self._objects:
-                    self._terminate()
-                self._param.increment()
-            else:
-                self._terminate()
-        return self._objects.pop(0)
+        self._started = True
+        while not self._objects:
+            if not self._hasMore:
+                self._complete()
+            try:
+                self._hasMore, objects, self._page = self._next_page()
+            except BaseException:
+                if self._checkpoint is not None:
+                    Iterator._save(self._checkpoint[0], self.cursor)
+                raise
+            self._length = len(objects) if objects else 0
+            if self._length > self._skip:
+                self._objects.extend(objects[self._skip:] if self._skip else objects)
+            self._skip = 0
+            self._pages = self._pages + 1
+            if self._checkpoint is not None and self._pages % self._checkpoint[1] == 0:
+                Iterator._save(self._checkpoint[0], self.cursor)
+        return self._objects.popleft()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def cursor(self):
+        """
+        Position of the iterator: the state of the query parameter of the current page,
+        and the number of objects already returned from that page.
+        Objects returned before the cursor was obtained are skipped when resuming.
+
+        :rtype: cterasdk.common.object.Object
+        """
+        cursor = Object()
+        cursor.param = Object()
+        if self._page is not None:
+            cursor.param.__dict__.update(copy.deepcopy(self._page))
+            cursor.position = self._length - len(self._objects)
+        else:
+            cursor.param.__dict__.update(copy.deepcopy(self._param.__dict__))
+            cursor.position = self._skip
+        return cursor
+
+    def resume(self, cursor):
+        """
+        Resume from a cursor, obtained from an iterator over the same query
+
+        :param cterasdk.common.object.Object cursor: Cursor
+        """
+        if self._started:
+            raise CTERAException('Cannot resume an iterator that was already started')
+        paging = Iterator._paging(self._param)
+        state = {k: v for k, v in self._param.__dict__.items() if not Iterator._state(k, paging)}
+        saved = {k: v for k, v in cursor.param.__dict__.items() if not Iterator._state(k, paging)}
+        if tojsonstr(state, pretty_print=False, no_log=False) != tojsonstr(saved, pretty_print=False, no_log=False):
+            raise CTERAException('Cursor does not match the query')
+        paging = [k for k in cursor.param.__dict__ if Iterator._state(k, paging)]
+        for key in paging:
+            setattr(self._param, key, getattr(cursor.param, key))
+        self._skip = cursor.position
+        logging.getLogger().debug('Resuming iteration. %s', {k: getattr(self._param, k) for k in paging if not k.startswith('_')})
+        return self
+
+    def checkpoint(self, path, pages=1):
+        """
+        Save the cursor to a file as pages are fetched, or fail to be fetched, and resume from the file if it exists.
+        The file is removed once the iteration completes.
+
+        :param str path: Path of the checkpoint file
+        :param int,optional pages: Number of pages to fetch between saves, defaults to ``1``
+        """
+        path = os.path.expanduser(path)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.resume(fromjsonstr(f.read()))
+        self._checkpoint = (path, pages)
+        return self
+
+    def close(self):
+        """ Stop fetching pages ahead """
+        self._hasMore = False
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+
+    def _next_page(self):
+        if self._prefetcher is not None:
+            return self._prefetcher.get()
+        return Prefetcher.fetch(self._function, self._param)
+
+    def _complete(self):
+        if self._checkpoint is not None and os.path.exists(self._checkpoint[0]):
+            os.remove(self._checkpoint[0])
+            self._checkpoint = None
+        Iterator._terminate()
+
+    @staticmethod
+    def _paging(param):
+        """ Attributes of the query parameter modified when paging """
+        state = dict(param.__dict__)
+        probe = copy.copy(param)
+        probe.increment()
+        if hasattr(type(param), 'page_size'):
+            probe.page_size = -1
+        return [k for k, v in probe.__dict__.items() if state.get(k, v) != v or k not in state]
+
+    @staticmethod
+    def _state(key, paging):
+        """ Paging attributes, and private attributes holding client-side paging state, which are not sent to the server """
+        return key in paging or (key.startswith('_') and key not in ('_classname', '_uuid'))
+
+    @staticmethod
+    def _save(path, cursor):
+        temp = path + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            f.write(tojsonstr(cursor, pretty_print=False, no_log=False))
+        os.replace(temp, path)
 
     @staticmethod
     def _terminate():
         logging.getLogger().debug('No more objects to return. Stopping iteration.')
         raise StopIteration
+
+
+class Prefetcher:
+    """
+    Fetch pages on a background thread, ahead of the consumer
+
+    :param callable function: Function returning a tuple of ``(hasMore, objects)`` for the page described by ``param``
+    :param object param: Query parameter, advanced to the next page by calling ``param.increment()``
+    :param int depth: Maximum number of pages fetched ahead of the consumer
+    """
+
+    def __init__(self, function, param, depth):
+        self._pages = queue.Queue(maxsize=depth)
+        self._stopped = threading.Event()
+        # the thread must not reference the iterator, so that an abandoned iterator can be collected
+        self._thread = threading.Thread(target=Prefetcher._produce, args=(function, param, self._pages, self._stopped), daemon=True)
+        self._started = False
+        self._error = None
+
+    def get(self):
+        """ Wait for the next page. Once fetching a page failed, the error is raised on every call """
+        if self._error is not None:
+            raise self._error
+        if not self._started:
+            self._started = True
+            self._thread.start()
+        hasMore, objects, state, error = self._pages.get()
+        if error is not None:
+            self._error = error
+            raise error
+        return hasMore, objects, state
+
+    def stop(self):
+        """ Stop fetching pages """
+        self._stopped.set()
+
+    @staticmethod
+    def fetch(function, param):
+        """ Fetch a page, and advance the query parameter to the next page """
+        hasMore, objects = function(param)
+        state = dict(param.__dict__)
+        if hasMore or objects:
+            param.increment()
+        return hasMore, objects, state
+
+    @staticmethod
+    def _produce(function, param, pages, stopped):
+        hasMore = True
+        while hasMore and not stopped.is_set():
+            try:
+                hasMore, objects, state = Prefetcher.fetch(function, param)
+            except Exception as error:  # pylint: disable=broad-except
+                Prefetcher._put(pages, stopped, (False, None, None, error))
+                return
+            Prefetcher._put(pages, stopped, (hasMore, objects, state, None))
+        logging.getLogger().debug('Stopped fetching pages. %s', {'completed': not hasMore})
+
+    @staticmethod
+    def _put(pages, stopped, page):
+        while not stopped.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+
+class ParallelIterator:
+    """
+    Objects Iterator, fetching disjoint pages concurrently.
+
+    Windows are assigned by advancing a copy of the query parameter, as for :class:`Iterator`, and fetched on a thread pool.
+    Since the number of objects is not known in advance, up to ``concurrency`` windows are kept in flight,
+    and no further windows are requested once a page reports that there are no more objects.
+    Objects received beyond that page, added while iterating, are ignored. When pages are not returned in order,
+    such objects may have already been returned.
+
+    :param callable function: Function returning a tuple of ``(hasMore, objects)`` for the page described by ``param``
+    :param object param: Query parameter of the first page, advanced to the next page by calling ``param.increment()``
+    :param int concurrency: Maximum number of pages to fetch concurrently
+    :param bool,optional ordered: Return objects in order, defaults to ``True``. Otherwise, pages are returned as they are received
+    """
+
+    def __init__(self, function, param, concurrency, ordered=True):
+        self._function = function
+        self._cursor = copy.copy(param)
+        self._concurrency = concurrency
+        self._objects = collections.deque()
+        self._pages = self._ordered() if ordered else self._unordered()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self._objects:
+            objects = next(self._pages, None)
+            if objects is None:
+                Iterator._terminate()  # pylint: disable=protected-access
+            self._objects.extend(objects)
+        return self._objects.popleft()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """ Stop fetching pages """
+        self._pages.close()
+
+    def _next_window(self):
+        param = copy.copy(self._cursor)
+        self._cursor.increment()
+        return param
+
+    def _ordered(self):
+        executor = ThreadPoolExecutor(max_workers=self._concurrency)
+        pending = collections.deque()
+        try:
+            while True:
+                while len(pending) < self._concurrency:
+                    param = self._next_window()
+                    pending.append((param, executor.submit(self._function, param)))
+                param, future = pending.popleft()
+                hasMore, objects = future.result()
+                ParallelIterator._check(param, hasMore, objects)
+                yield objects or []
+                if not hasMore:
+                    ParallelIterator._discard([future for _, future in pending])
+                    return
+        finally:
+            ParallelIterator._shutdown(executor, [future for _, future in pending])
+
+    def _unordered(self):
+        executor = ThreadPoolExecutor(max_workers=self._concurrency)
+        pending = {}
+        index, last = 0, None
+        try:
+            while True:
+                while last is None and len(pending) < self._concurrency:
+                    param = self._next_window()
+                    pending[executor.submit(self._function, param)] = (index, param)
+                    index = index + 1
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window, param = pending.pop(future)
+                    hasMore, objects = future.result()
+                    if last is not None and window > last:
+                        ParallelIterator._discard([future])
+                        continue
+                    ParallelIterator._check(param, hasMore, objects)
+                    if not hasMore:
+                        if last is not None:
+                            ParallelIterator._changed(param)
+                        last = window
+                    yield objects or []
+                if last is not None:
+                    for future in [future for future, (window, _) in pending.items() if window > last]:
+                        ParallelIterator._discard([future])
+                        pending.pop(future)
+        finally:
+            ParallelIterator._shutdown(executor, pending)
+
+    @staticmethod
+    def _check(param, hasMore, objects):
+        limit = getattr(param, 'countLimit', None)
+        if hasMore and limit is not None and len(objects or []) < limit:
+            ParallelIterator._changed(param)
+
+    @staticmethod
+    def _changed(param):
+        logging.getLogger().warning('Collection changed while iterating. %s', {'window': getattr(param, 'startFrom', None)})
+
+    @staticmethod
+    def _discard(futures):
+        for future in futures:
+            if future.cancel() or not future.done():
+                continue
+            if not future.exception() and future.result()[1]:
+                logging.getLogger().warning('Collection changed while iterating. Ignoring objects beyond the last page.')
+
+    @staticmethod
+    def _shutdown(executor, futures):
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+class AsyncIterator:
+    """
+    Asynchronous Objects Iterator
+
+    :param callable function: Coroutine function returning a tuple of ``(hasMore, objects)`` for the page described by ``param``
+    :param object param: Query parameter, advanced to the next page by calling ``param.increment()``
+    :param int,optional prefetch: Number of pages to fetch ahead on a task while the current page is consumed,
+     defaults to ``config.iterator['prefetch']``. Set to ``0`` to fetch each page only after the current page was consumed
+    """
+
+    def __init__(self, function, param, prefetch=None):
+        self._function = function
+        self._param = param
+        self._objects = collections.deque()
+        prefetch = config.iterator['prefetch'] if prefetch is None else prefetch
+        self._pages = self._prefetch(prefetch) if prefetch > 0 else self._fetch()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._objects:
+            objects = await self._pages.__anext__()
+            self._objects.extend(objects)
+        return self._objects.popleft()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """ Stop fetching pages """
+        await self._pages.aclose()
+
+    async def _fetch(self):
+        hasMore = True
+        while hasMore:
+            hasMore, objects = await AsyncIterator.fetch(self._function, self._param)
+            yield objects or []
+        logging.getLogger().debug('No more objects to return. Stopping iteration.')
+
+    async def _prefetch(self, depth):
+        pages = asyncio.Queue(maxsize=depth)
+        producer = asyncio.ensure_future(AsyncIterator._produce(self._function, self._param, pages))
+        try:
+            hasMore = True
+            while hasMore:
+                hasMore, objects, error = await pages.get()
+                if error is not None:
+                    raise error
+                yield objects or []
+            logging.getLogger().debug('No more objects to return. Stopping iteration.')
+        finally:
+            producer.cancel()
+
+    @staticmethod
+    async def fetch(function, param):
+        """ Fetch a page, and advance the query parameter to the next page """
+        hasMore, objects = await function(param)
+        if hasMore or objects:
+            param.increment()
+        return hasMore, objects
+
+    @staticmethod
+    async def _produce(function, param, pages):
+        hasMore = True
+        while hasMore:
+            try:
+                hasMore, objects = await AsyncIterator.fetch(function, param)
+            except Exception as error:  # pylint: disable=broad-except
+                await pages.put((False, None, error))
+                return
+            await pages.put((hasMore, objects, None))
+
+
+class AsyncParallelIterator:
+    """
+    Asynchronous Objects Iterator, fetching disjoint pages concurrently on the event loop.
+    See :class:`ParallelIterator` for how windows are assigned.
+
+    :param callable function: Coroutine function returning a tuple of ``(hasMore, objects)`` for the page described by ``param``
+    :param object param: Query parameter of the first page, advanced to the next page by calling ``param.increment()``
+    :param int concurrency: Maximum number of pages to fetch concurrently
+    :param bool,optional ordered: Return objects in order, defaults to ``True``. Otherwise, pages are returned as they are received
+    """
+
+    def __init__(self, function, param, concurrency, ordered=True):
+        self._function = function
+        self._cursor = copy.copy(param)
+        self._concurrency = concurrency
+        self._objects = collections.deque()
+        self._pages = self._ordered() if ordered else self._unordered()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._objects:
+            objects = await self._pages.__anext__()
+            self._objects.extend(objects)
+        return self._objects.popleft()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """ Stop fetching pages """
+        await self._pages.aclose()
+
+    def _next_window(self):
+        param = copy.copy(self._cursor)
+        self._cursor.increment()
+        return param
+
+    async def _ordered(self):
+        pending = collections.deque()
+        try:
+            while True:
+                while len(pending) < self._concurrency:
+                    param = self._next_window()
+                    pending.append((param, asyncio.ensure_future(self._function(param))))
+                param, task = pending.popleft()
+                hasMore, objects = await task
+                ParallelIterator._check(param, hasMore, objects)  # pylint: disable=protected-access
+                yield objects or []
+                if not hasMore:
+                    ParallelIterator._discard([task for _, task in pending])  # pylint: disable=protected-access
+                    return
+        finally:
+            AsyncParallelIterator._cancel([task for _, task in pending])
+
+    async def _unordered(self):
+        pending = {}
+        index, last = 0, None
+        try:
+            while True:
+                while last is None and len(pending) < self._concurrency:
+                    param = self._next_window()
+                    pending[asyncio.ensure_future(self._function(param))] = (index, param)
+                    index = index + 1
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(list(pending), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    window, param = pending.pop(task)
+                    hasMore, objects = task.result()
+                    if last is not None and window > last:
+                        ParallelIterator._discard([task])  # pylint: disable=protected-access
+                        continue
+                    ParallelIterator._check(param, hasMore, objects)  # pylint: disable=protected-access
+                    if not hasMore:
+                        if last is not None:
+                            ParallelIterator._changed(param)  # pylint: disable=protected-access
+                        last = window
+                    yield objects or []
+                if last is not None:
+                    for task in [task for task, (window, _) in pending.items() if window > last]:
+                        ParallelIterator._discard([task])  # pylint: disable=protected-access
+                        pending.pop(task)
+        finally:
+            AsyncParallelIterator._cancel(pending)
+
+    @staticmethod
+    def _cancel(tasks):
+        for task in tasks:
+            task.cancel()
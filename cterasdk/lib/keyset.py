@@ -0,0 +1,94 @@
+import copy
+import logging
+
+from ..common import Object
+from ..convert import tojsonstr
+
+
+class Keyset:
+    """
+    Page through objects ordered by a key, such as the time of a log, from the last key returned rather than by offset.
+
+    When a ``boundary`` function is specified, each page is requested from the last key returned,
+    using a filter added to a copy of the query parameter, and the offset only counts the objects
+    returned with that key. Otherwise, pages are requested by offset.
+    In both cases, objects preceding the last key returned, or returned with that key, are removed from the next page,
+    so that objects shifted across pages by objects added while iterating are not returned twice.
+
+    The direction of the order is determined from the first page with different keys.
+    The state of the iteration is kept in the ``_keyset`` attribute of the query parameter, which is not sent to the server,
+    and is saved and restored with the cursor of the iterator.
+
+    :param callable function: Function returning a tuple of ``(hasMore, objects)`` for the page described by ``param``
+    :param callable key: Function returning the key of an object, or ``None`` if the object has no valid key
+    :param callable,optional identity: Function returning a unique identifier of an object, defaults to the serialized object
+    :param callable,optional boundary: Function returning a filter for objects from a key, in the order of the page,
+     receiving the key and the direction of the order: ``1`` if ascending, or ``-1`` if descending
+    """
+
+    def __init__(self, function, key, identity=None, boundary=None):
+        self._function = function
+        self._key = key
+        self._identity = identity if identity is not None else Keyset._serialize
+        self._boundary = boundary
+        self._next = None
+
+    def __call__(self, param):
+        state = self._next if self._next is not None else getattr(param, '_keyset', None)
+        if state is None:
+            state = Keyset._state(None, 0, param.startFrom, [])
+        request = copy.copy(param)
+        request.__dict__.pop('_keyset', None)
+        param._keyset = state  # pylint: disable=protected-access
+        request.startFrom = state.offset
+        if self._boundary is not None and state.boundary is not None:
+            request.filters = list(getattr(param, 'filters', [])) + [self._boundary(state.boundary, state.direction)]
+        hasMore, objects = self._function(request)
+        objects = objects or []
+        self._next = self._advance(state, param.page_size, objects)
+        return hasMore, [o for o in objects if not self._returned(state, o)]
+
+    def _returned(self, state, o):
+        if state.boundary is None:
+            return False
+        key = self._key(o)
+        if key is None:
+            return False
+        if key == state.boundary:
+            return self._identity(o) in state.seen
+        return (key < state.boundary) if state.direction > 0 else (key > state.boundary)
+
+    def _advance(self, state, size, objects):
+        keys = [self._key(o) for o in objects]
+        if not objects or None in keys:
+            if objects:
+                logging.getLogger().debug('Paging by offset. Objects with no key. %s', {'offset': state.offset})
+            return Keyset._state(state.boundary, state.direction, state.offset + (len(objects) or size), state.seen)
+        direction = state.direction
+        if not direction and keys[0] != keys[-1]:
+            direction = 1 if keys[0] < keys[-1] else -1
+            logging.getLogger().debug('Paging by key. %s', {'order': 'ascending' if direction > 0 else 'descending'})
+        if not direction:
+            return Keyset._state(None, 0, state.offset + len(objects), [])
+        last = keys[-1]
+        identities = [self._identity(o) for o, key in zip(objects, keys) if key == last]
+        if last == state.boundary:
+            seen = state.seen + [identity for identity in identities if identity not in state.seen]
+            offset = state.offset + len(objects)
+        else:
+            seen = identities
+            offset = len(identities) if self._boundary is not None else state.offset + len(objects)
+        return Keyset._state(last, direction, offset, seen)
+
+    @staticmethod
+    def _state(boundary, direction, offset, seen):
+        state = Object()
+        state.boundary = boundary
+        state.direction = direction
+        state.offset = offset
+        state.seen = seen
+        return state
+
+    @staticmethod
+    def _serialize(o):
+        return tojsonstr(o, pretty_print=False, no_log=False)
@@ -0,0 +1,117 @@
+import collections
+import logging
+import threading
+import time
+
+from ..common import Object
+from ..exception import ConnectionTimeout, CTERAClientException
+from .. import config
+
+
+class AdaptivePager:  # pylint: disable=too-many-instance-attributes
+    """
+    Adjust the page size of an iterator to the response latency.
+    The page size grows while pages are returned well within the target latency,
+    and shrinks when a page takes longer than the target, or times out.
+    A page that timed out is requested again, using a smaller page size,
+    and the page size does not grow back to a size that timed out.
+
+    :param float,optional target: Target response latency, in seconds, defaults to ``2``
+    :param int,optional minimum: Minimum page size, defaults to ``10``
+    :param int,optional maximum: Maximum page size, defaults to ``1000``
+    :param int,optional initial: Initial page size, defaults to the page size of the query parameter
+    :param float,optional growth: Factor to grow the page size by, defaults to ``2``
+    :param float,optional shrink: Factor to shrink the page size by, defaults to ``0.5``
+    :param float,optional headroom: Grow the page size only if the latency is below this fraction of the target,
+     defaults to ``0.5``
+    """
+
+    statuses = [504]  # http status codes treated as a timeout
+
+    def __init__(self, target=2, minimum=10, maximum=1000, initial=None, growth=2, shrink=0.5, headroom=0.5):
+        self.target = target
+        self.minimum = minimum
+        self.maximum = maximum
+        self.growth = growth
+        self.shrink = shrink
+        self.headroom = headroom
+        self._lock = threading.Lock()
+        self._size = self._clamp(initial) if initial is not None else None
+        self._ceiling = maximum
+        self._pages = 0
+        self._timeouts = 0
+        self._latencies = collections.deque(maxlen=32)
+
+    @staticmethod
+    def from_config():
+        return AdaptivePager(**{k: v for k, v in config.iterator['pager'].items() if k != 'enabled'})
+
+    @property
+    def size(self):
+        """ Current page size """
+        return self._size
+
+    def fetch(self, function, param):
+        """
+        Fetch a page, adjusting its size
+
+        :param callable function: Function returning a tuple of ``(hasMore, objects)`` for the page described by ``param``
+        :param object param: Query parameter, with a ``page_size`` property
+        """
+        while True:
+            with self._lock:
+                if self._size is None:
+                    self._size = self._clamp(param.page_size)
+                size = self._size
+            param.page_size = size
+            start = time.monotonic()
+            try:
+                page = function(param)
+            except (ConnectionTimeout, CTERAClientException) as error:
+                if not self._timeout(error) or size <= self.minimum:
+                    raise
+                self._adjust(size, None)
+                continue
+            self._adjust(size, time.monotonic() - start)
+            return page
+
+    def snapshot(self):
+        """
+        Get the current page size and recent latencies
+
+        :return: Pager statistics, including the page size, the number of pages and timeouts,
+         and a list of recent ``[page size, latency]`` pairs
+        :rtype: cterasdk.common.object.Object
+        """
+        with self._lock:
+            param = Object()
+            param.size = self._size
+            param.pages = self._pages
+            param.timeouts = self._timeouts
+            param.latencies = [list(latency) for latency in self._latencies]
+            return param
+
+    def _timeout(self, error):
+        if isinstance(error, ConnectionTimeout):
+            return True
+        response = getattr(error, 'response', None)
+        return getattr(response, 'code', None) in AdaptivePager.statuses
+
+    def _adjust(self, size, latency):
+        with self._lock:
+            if latency is None:
+                self._timeouts = self._timeouts + 1
+                self._size = self._clamp(size * self.shrink)
+                self._ceiling = min(self._ceiling, self._size)
+            else:
+                self._pages = self._pages + 1
+                self._latencies.append((size, latency))
+                if latency > self.target:
+                    self._size = self._clamp(size * self.shrink)
+                elif latency < self.target * self.headroom:
+                    self._size = min(self._ceiling, self._clamp(size * self.growth))
+            if self._size != size:
+                logging.getLogger().debug('Adjusted page size. %s', {'from': size, 'to': self._size, 'latency': latency})
+
+    def _clamp(self, size):
+        return max(self.minimum, min(self.maximum, int(size)))
@@ -0,0 +1,57 @@
+import logging
+
+from ..common import Object, union
+from .. import config
+
+
+class Projection:
+    """
+    Fields of an object to retrieve, rather than the entire object.
+
+    The fields are translated to an ``include`` list for queries, or to attribute paths for ``get_multi``.
+    If ``config.projection['warn']`` is set, objects retrieved using a projection log a warning when reading
+    an attribute that was not retrieved, to find call sites that require additional fields.
+
+    :param list[str] fields: Field names. Nested fields are separated by ``/``
+    :param list[str],optional default: Fields to retrieve in addition to ``fields``, defaults to None
+    """
+
+    def __init__(self, fields, default=None):
+        self.fields = union(fields or [], default or [])
+
+    @property
+    def include(self):
+        """ Top level fields, for the ``include`` list of a query """
+        include = []
+        for field in self.fields:
+            name = field.split('/')[0]
+            if name not in include:
+                include.append(name)
+        return include
+
+    @property
+    def paths(self):
+        """ Attribute paths, for ``get_multi`` """
+        return ['/' + field for field in self.fields]
+
+    def enforce(self, objects):
+        """
+        Warn when reading attributes that were not retrieved, if ``config.projection['warn']`` is set
+
+        :param object objects: Object, or a list of objects, retrieved using this projection
+        :returns: The object, or list of objects
+        """
+        if config.projection['warn']:
+            for o in objects if isinstance(objects, list) else [objects]:
+                if type(o) is Object:  # pylint: disable=unidiomatic-typecheck
+                    o.__class__ = ProjectedObject
+        return objects
+
+
+class ProjectedObject(Object):
+    """ Object retrieved using a projection, logging a warning when reading an attribute that was not retrieved """
+
+    def __getattr__(self, name):
+        if not name.startswith('_'):
+            logging.getLogger().warning('Attribute was not retrieved. %s', {'attribute': name})
+        raise AttributeError(name)
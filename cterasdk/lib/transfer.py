@@ -0,0 +1,644 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests.exceptions as requests_exceptions
+
+from .. import config
+from ..client.ratelimit import RateLimit
+from ..common import Object
+from ..exception import CTERAException, CTERAClientException, CTERAConnectionError, ConnectionTimeout, ConnectionClosed, \
+    InputError, LocalDirectoryNotFound
+from .filesystem import FileSystem
+
+
+def timestamp(value):
+    """
+    Convert a modification time to seconds since the epoch
+
+    :param object value: Seconds since the epoch, an HTTP date, or an ISO 8601 date, naive dates are assumed to be UTC
+    :returns: Seconds since the epoch, or ``None`` if the value could not be parsed
+    :rtype: float
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    date = None
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        for layout in ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%d %H:%M:%S']:
+            try:
+                date = datetime.strptime(value, layout)
+                break
+            except ValueError:
+                continue
+    if date is None:
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date.timestamp()
+
+
+def transient(error):
+    """
+    Check if an error may not recur on retry: a connection failure or timeout, a connection closed while
+    reading a response, or a ``429 Too Many Requests`` or ``5xx`` server error response
+
+    :param Exception error: Error
+    :rtype: bool
+    """
+    if isinstance(error, (CTERAConnectionError, ConnectionTimeout, ConnectionClosed)):
+        return True
+    if isinstance(error, CTERAClientException):
+        code = getattr(getattr(error, 'response', None), 'code', None)
+        return isinstance(code, int) and (code == 429 or 500 <= code < 600)
+    return isinstance(error, (requests_exceptions.ConnectionError, requests_exceptions.Timeout, requests_exceptions.ChunkedEncodingError))
+
+
+def retry(function, retries, delay=1, callback=None):
+    """
+    Call a function, retrying with exponential backoff if it fails on a transient error
+
+    Other errors, such as client error responses or local file system errors, are raised without retrying.
+
+    :param callable function: Function to call
+    :param int retries: Number of times to retry
+    :param float,optional delay: Seconds to wait before the first retry, doubled on each retry, defaults to ``1``
+    :param callable,optional callback: Function receiving the error, before each retry
+    :returns: The return value of the function
+    """
+    attempt = 0
+    while True:
+        try:
+            return function()
+        except Exception as error:  # pylint: disable=broad-except
+            if attempt >= retries or not transient(error):
+                raise
+            logging.getLogger().debug('Retrying. %s', {'attempt': attempt + 1, 'error': str(error)})
+            if callback is not None:
+                callback(error)
+            time.sleep(delay * 2 ** attempt)
+            attempt = attempt + 1
+
+
+class TreeDownload:
+    """
+    Download a directory tree, writing files concurrently.
+
+    Directories are created as they are listed, and files are streamed by a bounded pool of worker threads.
+    Files whose local size and modification time match the remote file are skipped, and downloaded files
+    are stamped with the remote modification time, so downloading the tree again only fetches changed files.
+    Files that fail to download are reported, without aborting the download.
+
+    :param callable openfile: Function receiving the source of an entry, and returning a streamed response
+    :param str destination: Local directory to download the tree to
+    :param int,optional concurrency: Number of files to download concurrently, defaults to ``1``
+    :param int,optional bandwidth: Maximum total download rate, in bytes per second, defaults to unlimited
+    """
+
+    chunk_size = 65536
+
+    def __init__(self, openfile, destination, concurrency=None, bandwidth=None):
+        self._openfile = openfile
+        self._destination = os.path.abspath(os.path.expanduser(destination))
+        self._concurrency = max(concurrency or 1, 1)
+        self._throttle = RateLimit(rate=bandwidth, burst=TreeDownload.chunk_size) if bandwidth else None
+        self._lock = threading.Lock()
+        self._report = TreeDownload._empty()
+
+    def run(self, entries):
+        """
+        Download entries of a directory tree
+
+        :param iterable entries: Objects with the ``path`` of the entry relative to the top directory, ``isFolder``,
+         ``size``, ``lastmodified`` and ``source`` to pass to ``openfile``
+        :returns: Transfer report, with the number of directories, files downloaded and skipped, bytes written and failures
+        :rtype: cterasdk.common.object.Object
+        """
+        start = time.monotonic()
+        os.makedirs(self._destination, exist_ok=True)
+        slots = threading.BoundedSemaphore(self._concurrency * 2)
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            for entry in entries:
+                try:
+                    target = self._target(entry.path)
+                except InputError as error:
+                    self.onerror(entry.path, error)
+                    continue
+                if entry.isFolder:
+                    self._mkdir(entry, target)
+                else:
+                    slots.acquire()  # pylint: disable=R1732  # released once the file was downloaded
+                    executor.submit(self._download, entry, target).add_done_callback(lambda future: slots.release())
+        self._report.duration = time.monotonic() - start
+        logging.getLogger().info('Downloaded directory tree. %s', {
+            'destination': self._destination,
+            'files': self._report.files,
+            'skipped': self._report.skipped,
+            'failed': len(self._report.failed),
+            'bytes': self._report.bytes
+        })
+        return self._report
+
+    def onerror(self, path, error):
+        """
+        Record a failure to list a directory, or to download a file
+
+        :param object path: Path of the directory or file
+        :param Exception error: Error
+        """
+        logging.getLogger().warning('Could not download. %s', {'path': str(path), 'error': str(error)})
+        failure = Object()
+        failure.path = str(path)
+        failure.error = error
+        with self._lock:
+            self._report.failed.append(failure)
+
+    def _target(self, path):
+        target = os.path.normpath(os.path.join(self._destination, path))
+        if os.path.commonpath([self._destination, target]) != self._destination:
+            raise InputError('Path is outside the destination directory', path, self._destination)
+        return target
+
+    def _mkdir(self, entry, target):
+        try:
+            os.makedirs(target, exist_ok=True)
+        except OSError as error:
+            self.onerror(entry.path, error)
+            return
+        with self._lock:
+            self._report.directories = self._report.directories + 1
+
+    def _download(self, entry, target):
+        try:
+            mtime = timestamp(entry.lastmodified)
+            if TreeDownload._current(target, entry.size, mtime):
+                with self._lock:
+                    self._report.skipped = self._report.skipped + 1
+                return
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            self._write(entry, target, mtime)
+        except Exception as error:  # pylint: disable=broad-except
+            self.onerror(entry.path, error)
+            return
+        with self._lock:
+            self._report.files = self._report.files + 1
+
+    def _write(self, entry, target, mtime):
+        tempfile = target + '.Chopin3'
+        handle = self._openfile(entry.source)
+        try:
+            with open(tempfile, 'w+b') as fd:
+                for chunk in handle.iter_content(chunk_size=TreeDownload.chunk_size):
+                    if self._throttle is not None:
+                        self._throttle.acquire(len(chunk))
+                    fd.write(chunk)
+                    with self._lock:
+                        self._report.bytes = self._report.bytes + len(chunk)
+            os.replace(tempfile, target)
+        finally:
+            if hasattr(handle, 'close'):
+                handle.close()
+            if os.path.exists(tempfile):
+                os.remove(tempfile)
+        if mtime is not None:
+            os.utime(target, (mtime, mtime))
+        logging.getLogger().debug('Downloaded file. %s', {'path': target})
+
+    @staticmethod
+    def _current(target, size, mtime):
+        """ Whether the local file matches the size and modification time of the remote file """
+        if size is None or mtime is None:
+            return False
+        try:
+            stat = os.stat(target)
+        except OSError:
+            return False
+        return stat.st_size == int(size) and int(stat.st_mtime) == int(mtime)
+
+    @staticmethod
+    def _empty():
+        report = Object()
+        report.directories = 0
+        report.files = 0
+        report.skipped = 0
+        report.bytes = 0
+        report.failed = []
+        report.duration = 0
+        return report
+
+
+class TreeUpload:
+    """
+    Upload a local directory tree, uploading files concurrently.
+
+    The remote directories are created once, top-down, with the directories of each level created concurrently.
+    The upload address of each directory is resolved once, rather than for every file, and files are then uploaded
+    by a bounded pool of worker threads. A file that fails to upload on a transient error is retried, and reported if it still fails,
+    without aborting the upload. Files of directories that could not be created are not uploaded.
+
+    :param callable mkdir: Function receiving a remote directory path and whether to create its parents, ignoring existing directories
+    :param callable resolve: Function receiving a remote directory path, and returning its upload address
+    :param callable upload: Function receiving a local file path, remote directory path and upload address
+    :param object destination: Path of the remote directory to upload the tree to
+    :param int,optional concurrency: Number of directories to create, and files to upload, concurrently, defaults to ``1``
+    :param int,optional retries: Number of times to retry uploading a file on a transient error, defaults to ``3``
+    """
+
+    delay = 1  # seconds to wait before the first retry, doubled on each retry
+
+    def __init__(self, mkdir, resolve, upload, destination, concurrency=None, retries=None):  # pylint: disable=too-many-arguments
+        self._mkdir = mkdir
+        self._resolve = resolve
+        self._upload = upload
+        self._destination = destination
+        self._concurrency = max(concurrency or 1, 1)
+        self._retries = 3 if retries is None else retries
+        self._lock = threading.Lock()
+        self._addresses = {}
+        self._report = TreeUpload._empty()
+
+    def run(self, source):
+        """
+        Upload a local directory tree
+
+        :param str source: Local directory to upload
+        :returns: Transfer report, with the number of directories, files uploaded, bytes read, retries and failures
+        :rtype: cterasdk.common.object.Object
+        """
+        start = time.monotonic()
+        source = os.path.abspath(os.path.expanduser(source))
+        if not os.path.isdir(source):
+            raise LocalDirectoryNotFound(source)
+        levels, files = TreeUpload._scan(source)
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            self._create('', True, bool(files.get('')))
+            for level in levels:
+                list(executor.map(lambda directory: self._create(directory, False, bool(files.get(directory))), level))
+            slots = threading.BoundedSemaphore(self._concurrency * 2)
+            for directory, names in files.items():
+                if directory not in self._addresses:
+                    continue
+                for name in names:
+                    slots.acquire()  # pylint: disable=R1732  # released once the file was uploaded
+                    future = executor.submit(self._upload_file, source, directory, name)
+                    future.add_done_callback(lambda future: slots.release())
+        self._report.duration = time.monotonic() - start
+        logging.getLogger().info('Uploaded directory tree. %s', {
+            'source': source,
+            'files': self._report.files,
+            'failed': len(self._report.failed),
+            'bytes': self._report.bytes
+        })
+        return self._report
+
+    @staticmethod
+    def _scan(source):
+        """ Directories of the tree grouped by depth, and the files of each directory """
+        levels, files = [], {}
+        for dirpath, dirnames, filenames in os.walk(source):
+            directory = os.path.relpath(dirpath, source).replace(os.sep, '/')
+            directory = '' if directory == '.' else directory
+            depth = directory.count('/') + 1 if directory else 0
+            if dirnames:
+                while len(levels) <= depth:
+                    levels.append([])
+                levels[depth].extend('/'.join([directory, name]) if directory else name for name in sorted(dirnames))
+            if filenames:
+                files[directory] = sorted(filenames)
+        return levels, files
+
+    def _path(self, directory):
+        return self._destination.joinpath(directory) if directory else self._destination
+
+    def _create(self, directory, recurse, resolve):
+        parent = directory.rpartition('/')[0]
+        if directory and parent not in self._addresses:
+            return  # the parent directory could not be created
+        path = self._path(directory)
+        try:
+            self._mkdir(path, recurse)
+            address = self._resolve(path) if resolve else None
+        except Exception as error:  # pylint: disable=broad-except
+            self.onerror(path, error)
+            return
+        with self._lock:
+            self._addresses[directory] = address
+            self._report.directories = self._report.directories + 1
+
+    def _upload_file(self, source, directory, name):
+        local_file = os.path.join(source, *directory.split('/'), name)
+        path = self._path(directory)
+        try:
+            retry(lambda: self._upload(local_file, path, self._addresses[directory]), self._retries, TreeUpload.delay, self._retried)
+        except Exception as error:  # pylint: disable=broad-except
+            self.onerror(local_file, error)
+            return
+        with self._lock:
+            self._report.files = self._report.files + 1
+            self._report.bytes = self._report.bytes + os.path.getsize(local_file)
+
+    def _retried(self, error):  # pylint: disable=unused-argument
+        with self._lock:
+            self._report.retries = self._report.retries + 1
+
+    def onerror(self, path, error):
+        """
+        Record a failure to create a directory, or to upload a file
+
+        :param object path: Path of the directory or file
+        :param Exception error: Error
+        """
+        logging.getLogger().warning('Could not upload. %s', {'path': str(path), 'error': str(error)})
+        failure = Object()
+        failure.path = str(path)
+        failure.error = error
+        with self._lock:
+            self._report.failed.append(failure)
+
+    @staticmethod
+    def _empty():
+        report = Object()
+        report.directories = 0
+        report.files = 0
+        report.bytes = 0
+        report.retries = 0
+        report.failed = []
+        report.duration = 0
+        return report
+
+
+class Journal:
+    """
+    Byte ranges of a file that were written, saved to a sidecar file next to it.
+
+    The journal is bound to the size of the remote file, and to its validator, the ``ETag`` or ``Last-Modified``
+    response header, so a partially written file is only resumed if the remote file did not change.
+
+    :param str filepath: Path of the file being written
+    :param int size: Size of the file
+    :param str validator: Validator of the remote file
+    """
+
+    suffix = '.journal'
+    interval = 1  # seconds between saves of the journal
+
+    def __init__(self, filepath, size, validator):
+        self.filepath = filepath
+        self.path = filepath + Journal.suffix
+        self.size = size
+        self.validator = validator
+        self.completed = []
+        self._saved = time.monotonic()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def load(filepath, size, validator):
+        """
+        Load the journal of a partially written file
+
+        :param str filepath: Path of the file being written
+        :param int size: Size of the file
+        :param str validator: Validator of the remote file
+        :returns: The saved journal, or an empty journal if the file cannot be resumed
+        :rtype: cterasdk.lib.transfer.Journal
+        """
+        journal = Journal(filepath, size, validator)
+        try:
+            with open(journal.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if os.path.getsize(filepath) != size:
+                return journal
+        except (OSError, ValueError):
+            return journal
+        if state.get('size') == size and state.get('validator') == validator:
+            journal.completed = [[start, end] for start, end in state.get('completed', [])]
+            logging.getLogger().debug('Resuming file. %s', {'path': filepath, 'completed': journal.written})
+        return journal
+
+    @property
+    def written(self):
+        """ Number of bytes written """
+        return sum(end - start + 1 for start, end in self.completed)
+
+    @property
+    def complete(self):
+        """ Whether all byte ranges of the file were written """
+        return self.completed == [[0, self.size - 1]]
+
+    def add(self, start, end):
+        """
+        Record a written byte range
+
+        :param int start: First byte
+        :param int end: Last byte
+        """
+        with self._lock:
+            merged = []
+            for first, last in sorted(self.completed + [[start, end]]):
+                if merged and first <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], last)
+                else:
+                    merged.append([first, last])
+            self.completed = merged
+
+    def missing(self):
+        """
+        Byte ranges that were not written
+
+        :returns: List of first and last byte of each range
+        :rtype: list[tuple]
+        """
+        ranges, offset = [], 0
+        for start, end in self.completed:
+            if start > offset:
+                ranges.append((offset, start - 1))
+            offset = max(offset, end + 1)
+        if offset < self.size:
+            ranges.append((offset, self.size - 1))
+        return ranges
+
+    def checkpoint(self, fd):
+        """
+        Save the journal, if it was not saved recently
+
+        :param int fd: Descriptor of the file being written, flushed to disk before the journal is saved
+        """
+        if time.monotonic() - self._saved >= Journal.interval:
+            self.save(fd)
+
+    def save(self, fd):
+        """
+        Flush the file to disk, and save the journal
+
+        :param int fd: Descriptor of the file being written
+        """
+        os.fsync(fd)
+        with self._lock:
+            state = dict(size=self.size, validator=self.validator, completed=self.completed)
+            self._saved = time.monotonic()
+            with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(self.path + '.tmp', self.path)
+
+    def remove(self):
+        """ Remove the journal """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class SegmentedDownload:
+    """
+    Download a file over several connections, using HTTP range requests.
+
+    The first response, requested with an open ended range, reports the size of the file. The file is then
+    preallocated and split into segments. The first segment is read from the first response, and the others
+    are requested concurrently and written at their offsets. If the server does not honor range requests,
+    the file is read from the first response on a single connection.
+
+    When resuming, the byte ranges written are recorded in a :class:`Journal`, saved next to the file when the
+    download fails. Downloading to the same file again only requests the ranges that were not written,
+    and the size of the file is verified once all ranges were written.
+
+    :param callable openfile: Function receiving request headers, and returning a streamed response
+    :param object response: Response to a request for the range ``bytes=0-``
+    :param int segments: Number of segments to download concurrently
+    :param int,optional chunk_size: Number of bytes to read at a time, defaults to ``config.filesystem['chunk_size']``
+    :param bool,optional resume: Resume a partially written file, and save the journal if the download fails, defaults to ``False``
+    """
+
+    def __init__(self, openfile, response, segments, chunk_size=None, resume=False):  # pylint: disable=too-many-arguments
+        self._openfile = openfile
+        self._response = response
+        self._segments = max(segments or 1, 1)
+        self._chunk_size = chunk_size or config.filesystem['chunk_size']
+        self._resume = resume
+        self._journal = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def first():
+        """ Headers of the first request """
+        return {'Range': 'bytes=0-'}
+
+    def write(self, filepath):
+        """
+        Download the file
+
+        :param str filepath: Path of the file to write
+        """
+        size = SegmentedDownload._range(self._response, 0)
+        if size is None or size <= self._chunk_size:
+            logging.getLogger().debug('Downloading on a single connection. %s', {'path': filepath, 'size': size})
+            FileSystem.write(filepath, self._response, self._chunk_size)
+            if self._resume:
+                Journal(filepath, size, None).remove()
+            return filepath
+        self._journal = Journal.load(filepath, size, SegmentedDownload._validator(self._response)) if self._resume else \
+            Journal(filepath, size, None)
+        if not self._journal.completed:
+            with open(filepath, 'w+b') as f:
+                f.truncate(size)
+        ranges = self._split(self._journal.missing())
+        logging.getLogger().debug('Downloading segments. %s', {
+            'path': filepath, 'size': size, 'segments': len(ranges), 'written': self._journal.written
+        })
+        fd = os.open(filepath, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+        try:
+            self._download(fd, ranges)
+            if not self._journal.complete or os.fstat(fd).st_size != size:
+                raise CTERAException('Downloaded file is incomplete', None, path=filepath, size=size, missing=self._journal.missing())
+        except BaseException:
+            if self._resume:
+                self._journal.save(fd)
+            raise
+        finally:
+            os.close(fd)
+        self._journal.remove()
+        return filepath
+
+    def _download(self, fd, ranges):
+        first = ranges[0] if ranges and ranges[0][0] == 0 else None
+        if first is None:
+            self._response.close()
+        else:
+            ranges = ranges[1:]
+        with ThreadPoolExecutor(max_workers=max(self._segments - 1, 1) if first else self._segments) as executor:
+            futures = [executor.submit(self._segment, fd, start, end) for start, end in ranges]
+            try:
+                if first is not None:
+                    self._copy(fd, self._response, *first)
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _split(self, missing):
+        """ Split the missing byte ranges into segments of about equal length """
+        length = max(-(-sum(end - start + 1 for start, end in missing) // self._segments), self._chunk_size)
+        ranges = []
+        for start, end in missing:
+            ranges.extend((offset, min(offset + length, end + 1) - 1) for offset in range(start, end + 1, length))
+        return ranges
+
+    def _segment(self, fd, start, end):
+        response = self._openfile({'Range': 'bytes=%d-%d' % (start, end)})
+        if SegmentedDownload._range(response, start) is None:
+            response.close()
+            raise CTERAException('Server did not return the requested range', None, start=start, end=end)
+        self._copy(fd, response, start, end)
+
+    def _copy(self, fd, response, start, end):
+        offset, remaining = start, end - start + 1
+        try:
+            for chunk in response.iter_content(chunk_size=self._chunk_size):
+                chunk = chunk[:remaining]
+                self._pwrite(fd, chunk, offset)
+                if chunk:
+                    self._journal.add(offset, offset + len(chunk) - 1)
+                offset, remaining = offset + len(chunk), remaining - len(chunk)
+                if self._resume:
+                    self._journal.checkpoint(fd)
+                if remaining == 0:
+                    break
+        finally:
+            response.close()
+        if remaining > 0:
+            raise ConnectionClosed(start=start, end=end, remaining=remaining)
+
+    def _pwrite(self, fd, data, offset):
+        """ Write all of the data at an offset, writes may be short """
+        data = memoryview(data)
+        while data:
+            if hasattr(os, 'pwrite'):
+                written = os.pwrite(fd, data, offset)
+            else:
+                with self._lock:
+                    os.lseek(fd, offset, os.SEEK_SET)
+                    written = os.write(fd, data)
+            data, offset = data[written:], offset + written
+
+    @staticmethod
+    def _validator(response):
+        """ Validator of the remote file, used to detect whether it changed """
+        return response.headers.get('ETag') or response.headers.get('Last-Modified')
+
+    @staticmethod
+    def _range(response, start):
+        """ Size of the file, if the response is a partial response starting at ``start`` """
+        if getattr(response, 'status_code', None) != 206:
+            return None
+        match = re.match(r'bytes (\d+)-\d+/(\d+)', response.headers.get('Content-Range', ''))
+        if match is None or int(match.group(1)) != start:
+            return None
+        return int(match.group(2))
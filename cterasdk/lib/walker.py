@@ -0,0 +1,98 @@
+import collections
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from ..exception import CTERAClientException, RemoteFileSystemException
+
+
+class Walker:
+    """
+    Walk a directory tree, listing directories concurrently.
+
+    Directories are listed by a bounded pool of worker threads. In ordered mode, items are returned in
+    breadth-first order, as by a sequential walk. Otherwise, items are returned as soon as their directory
+    was listed. A directory that fails to list, such as one deleted during the walk, is reported to ``onerror``
+    and skipped, without aborting the walk. Failing to list the top directory is raised.
+
+    :param callable listdir: Function receiving a path and returning the items of the directory
+    :param callable mkpath: Function receiving an item and returning its path
+    :param int,optional concurrency: Number of directories to list concurrently, defaults to ``1``
+    :param bool,optional ordered: Return items in breadth-first order, defaults to ``True``
+    :param int,optional max_depth: Maximum depth to list, ``1`` lists the top directory only, defaults to unlimited
+    :param callable,optional predicate: Function receiving a directory item, return ``False`` to skip listing it
+    :param callable,optional onerror: Function receiving a path and an error, for directories that failed to list,
+     defaults to logging a warning
+    """
+
+    errors = (CTERAClientException, RemoteFileSystemException)
+
+    def __init__(self, listdir, mkpath, concurrency=None, ordered=True, max_depth=None, predicate=None, onerror=None):
+        self._listdir = listdir
+        self._mkpath = mkpath
+        self._concurrency = max(concurrency or 1, 1)
+        self._ordered = ordered
+        self._max_depth = max_depth
+        self._predicate = predicate
+        self._onerror = onerror or Walker._warn
+
+    def walk(self, path):
+        """
+        Walk a directory tree
+
+        :param cterasdk.core.files.path.CTERAPath path: Top directory
+        :returns: Generator of items
+        """
+        pending = collections.deque([(path, 0)])
+        if self._concurrency == 1:
+            return self._walk(pending)
+        return self._walk_concurrently(pending)
+
+    def _walk(self, pending):
+        while pending:
+            path, depth = pending.popleft()
+            items = self._list(path, depth)
+            yield from self._expand(items, depth, pending)
+
+    def _walk_concurrently(self, pending):
+        window = self._concurrency * 2
+        inflight = collections.OrderedDict()
+        executor = ThreadPoolExecutor(max_workers=self._concurrency)
+        try:
+            while pending or inflight:
+                while pending and len(inflight) < window:
+                    path, depth = pending.popleft()
+                    inflight[executor.submit(self._list, path, depth)] = depth
+                if self._ordered:
+                    future = list(inflight)[0]
+                else:
+                    future = wait(inflight, return_when=FIRST_COMPLETED).done.pop()
+                depth = inflight.pop(future)
+                yield from self._expand(future.result(), depth, pending)
+        finally:
+            for future in inflight:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _list(self, path, depth):
+        try:
+            return self._listdir(path)
+        except Walker.errors as error:
+            if depth == 0:
+                raise
+            self._onerror(path, error)
+            return []
+
+    def _expand(self, items, depth, pending):
+        for item in items:
+            if item.isFolder and self._descend(item, depth + 1):
+                pending.append((self._mkpath(item), depth + 1))
+            yield item
+
+    def _descend(self, item, depth):
+        if self._max_depth is not None and depth >= self._max_depth:
+            return False
+        return self._predicate is None or self._predicate(item)
+
+    @staticmethod
+    def _warn(path, error):
+        logging.getLogger().warning('Could not list directory. %s', {'path': str(path), 'error': str(error)})
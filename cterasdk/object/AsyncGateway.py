@@ -0,0 +1,80 @@
+import asyncio
+
+from ..client.async_host import AsyncCTERAHost, authenticated
+from ..client import NetworkHost
+from ..edge import connection
+from ..edge import uri
+from ..asynchronous.edge import config
+from ..asynchronous.edge import login
+from ..asynchronous.edge import session
+
+
+class AsyncGateway(AsyncCTERAHost):
+    """
+    Main class operating on a Gateway asynchronously
+
+    :ivar cterasdk.asynchronous.edge.config.Config config: Object holding the asynchronous Gateway Configuration APIs
+    """
+
+    def __init__(self, host, port=None, https=False, Portal=None):
+        """
+        :param str host: The fully qualified domain name, hostname or an IPv4 address of the Gateway
+        :param int,optional port: Set a custom port number (0 - 65535), If not set defaults to 80 for http and 443 for https
+        :param bool,optional https: Set to True to require HTTPS, defaults to False
+        :param cterasdk.object.AsyncPortal.AsyncPortal,optional Portal:
+         The portal throught which the remote session was created, defaults to None
+        """
+        super().__init__(host, port, https)
+        self._session = session.Session(self.host())
+        if Portal is not None:
+            self._Portal = Portal
+            self._ctera_client = Portal._ctera_client
+            self._session.start_remote_session(self._Portal.session())
+        self.config = config.Config(self)
+
+    @property
+    def base_api_url(self):
+        return uri.api(self)
+
+    @property
+    def base_file_url(self):
+        return uri.files(self)
+
+    @property
+    def _session_id_key(self):
+        return '_cteraSessionId_'
+
+    @staticmethod
+    def make_local_files_dir(full_path):
+        return 'localFiles/%s' % full_path
+
+    @property
+    def _omit_fields(self):
+        return super()._omit_fields + ['config']
+
+    @property
+    def _login_object(self):
+        return login.Login(self)
+
+    def _is_authenticated(self, function, *args, **kwargs):
+        def is_nosession(path):
+            return path.startswith('/nosession')
+        current_session = self.session()
+        return current_session.authenticated() or current_session.initializing() or is_nosession(args[0])
+
+    async def test(self):
+        """ Verification check to ensure the target host is a Gateway. """
+        await asyncio.get_running_loop().run_in_executor(None, connection.test_network, self)
+        return await self.get('/nosession/logininfo')
+
+    async def close(self):
+        """ Close the underlying HTTP session, unless it is shared with the Portal """
+        if getattr(self, '_Portal', None) is None:
+            await super().close()
+
+    @authenticated
+    async def rm(self, path):
+        return await super().delete(path, use_file_url=True)
+
+    def _baseurl(self):
+        return NetworkHost.baseurl(self)
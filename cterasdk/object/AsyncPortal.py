@@ -0,0 +1,136 @@
+import asyncio
+
+from ..client.async_host import AsyncCTERAHost, authenticated
+from ..core import connection
+from ..core import uri
+from ..asynchronous.core import decorator
+from ..asynchronous.core import devices
+from ..asynchronous.core import login
+from ..asynchronous.core import logs
+from ..asynchronous.core import portals
+from ..asynchronous.core import query
+from ..asynchronous.core import session
+from ..asynchronous.core import users
+
+
+class AsyncPortal(AsyncCTERAHost):
+    """
+    Parent class for communicating with the Portal asynchronously, through either AsyncGlobalAdmin or AsyncServicesPortal
+
+    :ivar cterasdk.asynchronous.core.users.Users users: Object holding the asynchronous Portal user APIs
+    :ivar cterasdk.asynchronous.core.devices.Devices devices: Object holding the asynchronous Portal devices APIs
+    :ivar cterasdk.asynchronous.core.logs.Logs logs: Object holding the asynchronous Portal logs APIs
+    """
+
+    def __init__(self, host, port, https):
+        """
+        :param str host: The fully qualified domain name, hostname or an IPv4 address of the Portal
+        :param int port: Set a custom port number (0 - 65535)
+        :param bool https: Set to True to require HTTPS
+        """
+        super().__init__(host, port, https)
+        self._session = session.Session(self.host(), self.context)
+        self.users = users.Users(self)
+        self.devices = devices.Devices(self)
+        self.logs = logs.Logs(self)
+
+    @property
+    def base_api_url(self):
+        return uri.api(self)
+
+    @property
+    def base_portal_url(self):
+        return self.baseurl() + '/' + self.context
+
+    @property
+    def base_file_url(self):
+        return self.baseurl()
+
+    @property
+    def _session_id_key(self):
+        return 'JSESSIONID'
+
+    @property
+    def context(self):
+        raise NotImplementedError("Implementing class must implement the context property")
+
+    @property
+    def _omit_fields(self):
+        return super()._omit_fields + [
+            'users',
+            'devices',
+            'logs'
+        ]
+
+    @property
+    def _login_object(self):
+        return login.Login(self)
+
+    def _is_authenticated(self, function, *args, **kwargs):
+        def is_public(path):
+            return path.startswith('/%s/public' % self.context)
+
+        def is_setup(path):
+            return path.startswith('/%s/setup' % self.context)
+
+        def is_startup(path):
+            return path.startswith('/%s/startup' % self.context)
+        current_session = self.session()
+        return current_session.authenticated() or current_session.initializing() or \
+            is_public(args[0]) or is_setup(args[0]) or is_startup(args[0]) or \
+            current_session.is_local_auth()
+
+    async def test(self):
+        """ Verification check to ensure the target host is a Portal. """
+        await asyncio.get_running_loop().run_in_executor(None, connection.test, self)
+        return await self.public_info()
+
+    async def public_info(self):
+        """ Obtain the Portal's public info. """
+        return await self.get('/' + self.context + '/public/publicInfo', params={}, use_file_url=True)
+
+    @decorator.update_current_tenant
+    async def put(self, path, value, use_file_url=False):
+        return await super().put(path, value, use_file_url=use_file_url)
+
+    @authenticated
+    async def query(self, path, param, compact=False):
+        return await query.query(self, path, param, compact)
+
+    def iterator(self, path, param, compact=False, prefetch=None, parallel=None, ordered=None):
+        return query.iterator(self, path, param, compact, prefetch, parallel, ordered)
+
+
+class AsyncGlobalAdmin(AsyncPortal):
+    """
+    Main class for asynchronous Global Admin operations on a Portal
+
+    :ivar cterasdk.asynchronous.core.portals.Portals portals: Object holding the asynchronous Portals Management APIs
+    """
+
+    def __init__(self, host, port=None, https=True):
+        """
+        :param str host: The fully qualified domain name, hostname or an IPv4 address of the Portal
+        :param int,optional port: Set a custom port number (0 - 65535), If not set defaults to 80 for http and 443 for https
+        :param bool,optional https: Set to True to require HTTPS, defaults to True
+        """
+        super().__init__(host, port, https)
+        self.portals = portals.Portals(self)
+
+    @property
+    def _omit_fields(self):
+        return super()._omit_fields + ['portals']
+
+    @property
+    def context(self):
+        return 'admin'
+
+
+class AsyncServicesPortal(AsyncPortal):
+    """
+    Main class for asynchronous Service operations on a Portal
+    """
+
+    @property
+    def context(self):
+        return 'ServicesPortal'
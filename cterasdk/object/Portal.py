@@ -20,6 +20,7 @@ from ..core import zones
 from ..core import setup
 from ..core import startup
 from ..core import taskmgr
+from ..core import tenants
 from ..core import uri
 from ..core import files
 
@@ -133,15 +134,16 @@ class Portal(CTERAHost):  # pylint: disable=too-many-instance-attributes
         return super().put(path, value, use_file_url=use_file_url)
 
     @authenticated
-    def query(self, path, param):
-        return query.query(self, path, param)
+    def query(self, path, param, compact=False):
+        return query.query(self, path, param, compact)
 
     @authenticated
     def show_query(self, path, param):
         return query.show(self, path, param)
 
-    def iterator(self, path, param):
-        return query.iterator(self, path, param)
+    def iterator(self, path, param, compact=False, prefetch=None, parallel=None,
+                 ordered=None, pager=None):
+        return query.iterator(self, path, param, compact, prefetch, parallel, ordered, pager)
 
 
 class GlobalAdmin(Portal):
@@ -182,6 +184,18 @@ class GlobalAdmin(Portal):
     def file_browser_base_path(self):
         return '/admin/webdav/Users'
 
+    def tenant_pool(self, username, password, size=4):
+        """
+        Create a pool of sessions for running work on many tenants in parallel
+
+        :param str username: User name to log in
+        :param str password: User password
+        :param int,optional size: Maximum number of sessions, defaults to ``4``
+        :returns: Tenant pool
+        :rtype: cterasdk.core.tenants.TenantPool
+        """
+        return tenants.TenantPool(self, username, password, size)
+
 
 class ServicesPortal(Portal):
     """
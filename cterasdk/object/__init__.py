@@ -1,3 +1,5 @@
 from .Portal import GlobalAdmin, ServicesPortal  # noqa: E402, F401
 from .Gateway import Gateway  # noqa: E402, F401
 from .Agent import Agent  # noqa: E402, F401
+from .AsyncPortal import AsyncGlobalAdmin, AsyncServicesPortal  # noqa: E402, F401
+from .AsyncGateway import AsyncGateway  # noqa: E402, F401
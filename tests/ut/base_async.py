@@ -0,0 +1,22 @@
+import asyncio
+from unittest import mock
+
+from tests.ut import base
+
+
+class AsyncMagicMock(mock.MagicMock):
+    """MagicMock whose calls return an awaitable."""
+
+    async def __call__(self, *args, **kwargs):  # pylint: disable=invalid-overridden-method,arguments-differ
+        return super().__call__(*args, **kwargs)
+
+
+class BaseAsyncTest(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._loop = asyncio.new_event_loop()
+        self.addCleanup(self._loop.close)
+
+    def run_async(self, coroutine):
+        return self._loop.run_until_complete(coroutine)
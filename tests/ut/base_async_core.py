@@ -0,0 +1,20 @@
+from cterasdk.object import AsyncGlobalAdmin
+from tests.ut import base_async
+
+
+class BaseAsyncCoreTest(base_async.BaseAsyncTest):
+
+    def setUp(self):
+        super().setUp()
+        self._global_admin = AsyncGlobalAdmin("")
+
+    def _init_global_admin(self, get_response=None, get_multi_response=None, put_response=None,
+                           execute_response=None, form_data_response=None, add_response=None,
+                           db_response=None):
+        self._global_admin.get = base_async.AsyncMagicMock(return_value=get_response)
+        self._global_admin.get_multi = base_async.AsyncMagicMock(return_value=get_multi_response)
+        self._global_admin.put = base_async.AsyncMagicMock(return_value=put_response)
+        self._global_admin.execute = base_async.AsyncMagicMock(return_value=execute_response)
+        self._global_admin.form_data = base_async.AsyncMagicMock(return_value=form_data_response)
+        self._global_admin.add = base_async.AsyncMagicMock(return_value=add_response)
+        self._global_admin.db = base_async.AsyncMagicMock(return_value=db_response)
@@ -0,0 +1,21 @@
+from cterasdk.common import Object
+from cterasdk.core.enum import LogTopic, Severity
+from cterasdk.asynchronous.core import logs
+from tests.ut import base_async_core
+
+
+class TestAsyncCoreLogs(base_async_core.BaseAsyncCoreTest):
+
+    def test_get_logs(self):
+        first, second = Object(), Object()
+        first.hasMore, first.logs = True, ['log-1', 'log-2']
+        second.hasMore, second.logs = False, ['log-3']
+        self._init_global_admin()
+        self._global_admin.execute.side_effect = [first, second]
+
+        async def get_logs():
+            return [log async for log in logs.Logs(self._global_admin).get(min_severity=Severity.ERROR, prefetch=1)]
+        self.assertEqual(self.run_async(get_logs()), ['log-1', 'log-2', 'log-3'])
+        self.assertEqual(self._global_admin.execute.call_count, 2)
+        actual_param = self._global_admin.execute.call_args[0][2]
+        self.assertEqual((actual_param.topic, actual_param.minSeverity), (LogTopic.System, Severity.ERROR))
@@ -0,0 +1,55 @@
+from unittest import mock
+
+from cterasdk.common import Object
+from cterasdk.core.types import UserAccount
+from cterasdk.core import users as sync_users
+from cterasdk.asynchronous.core import users
+from tests.ut import base_async_core
+
+
+class TestAsyncCoreUsers(base_async_core.BaseAsyncCoreTest):
+
+    def setUp(self):
+        super().setUp()
+        self._username = 'alice'
+        self._local_user_account = UserAccount(self._username)
+        self._domain_user_account = UserAccount(self._username, 'ctera.local')
+
+    def test_get_user_default_attrs(self):
+        get_multi_response = Object()
+        get_multi_response.name = self._username
+        self._init_global_admin(get_multi_response=get_multi_response)
+        ret = self.run_async(users.Users(self._global_admin).get(self._local_user_account))
+        self._global_admin.get_multi.assert_called_once_with('/users/' + self._username, mock.ANY)
+        actual_include = self._global_admin.get_multi.call_args[0][1]
+        self.assertEqual(sorted(actual_include), sorted(['/' + attr for attr in sync_users.Users.default]))
+        self.assertEqual(ret.name, self._username)
+
+    def test_add_user(self):
+        self._init_global_admin(add_response='Success')
+        ret = self.run_async(users.Users(self._global_admin).add(self._username, 'alice@wonderland.com', 'Alice',
+                                                                 'Wonderland', 'password', 'EndUser'))
+        self._global_admin.add.assert_called_once_with('/users', mock.ANY)
+        actual_param = self._global_admin.add.call_args[0][1]
+        self.assertEqual(actual_param._classname, 'PortalUser')  # pylint: disable=protected-access
+        self.assertEqual(actual_param.name, self._username)
+        self.assertEqual(ret, 'Success')
+
+    def test_delete_domain_user(self):
+        self._init_global_admin(execute_response='Success')
+        self.run_async(users.Users(self._global_admin).delete(self._domain_user_account))
+        self._global_admin.execute.assert_called_once_with('/domains/ctera.local/adUsers/' + self._username, 'delete', True)
+
+    def test_list_local_users(self):
+        db_response = Object()
+        db_response.hasMore = False
+        db_response.objects = [Object(), Object()]
+        self._init_global_admin(db_response=db_response)
+
+        async def list_local_users():
+            return [user async for user in users.Users(self._global_admin).list_local_users(['email'])]
+        ret = self.run_async(list_local_users())
+        self.assertEqual(ret, db_response.objects)
+        self._global_admin.db.assert_called_once_with('/users', 'query', mock.ANY, compact=False)
+        actual_param = self._global_admin.db.call_args[0][2]
+        self.assertEqual(sorted(actual_param.include), sorted(['email'] + sync_users.Users.default))
@@ -0,0 +1,134 @@
+import threading
+from unittest import mock
+
+import aiohttp
+from aiohttp import web
+
+from cterasdk import exception, config
+from cterasdk.client.async_http import AsyncHttpClientBase
+from cterasdk.client.http import HttpClientRequestPost
+from cterasdk.client.retry import RetryPolicy
+from cterasdk.common import Object
+from cterasdk.convert import toxmlstr
+from cterasdk.object import AsyncGlobalAdmin
+from tests.ut import base_async
+from tests.ut.base_async import AsyncMagicMock
+
+
+class TestAsyncHTTPClient(base_async.BaseAsyncTest):
+
+    def setUp(self):
+        super().setUp()
+        self._session_id = 'ABCDEF0123456789'
+        self._runner = None
+        self._requests = []
+
+    def tearDown(self):
+        if self._runner is not None:
+            self.run_async(self._runner.cleanup())
+        super().tearDown()
+
+    def test_login_and_get(self):
+        port = self.run_async(self._start_server())
+        user = self.run_async(self._login_and_get(port))
+        self.assertEqual(user.name, 'alice')
+        self.assertEqual(user.uid, 1024)
+        self.assertEqual(self._requests[-1]['cookie'], self._session_id)
+        self.assertEqual(self._requests[0]['body'], 'j_username=admin&j_password=password')
+
+    def test_http_error(self):
+        port = self.run_async(self._start_server())
+        with self.assertRaises(exception.CTERAClientException) as error:
+            self.run_async(self._login_and_get(port, '/users/bob'))
+        self.assertEqual(error.exception.response.code, 404)
+        self.assertEqual(error.exception.response.body.msg, 'Not found')
+
+    def test_ssl_consent_off_loop(self):
+        prompts = []
+
+        def ask(message):
+            prompts.append((message, threading.current_thread()))
+            return True
+
+        with mock.patch.dict(config.http, {'ssl': 'Consent'}), mock.patch('cterasdk.client.async_http.ask', side_effect=ask):
+            client = AsyncHttpClientBase('JSESSIONID')
+            self.run_async(client.on_ssl_error('portal', 443))
+        self.assertEqual(prompts[0][0], 'Proceed to portal:443?')
+        self.assertIsNot(prompts[0][1], threading.current_thread())
+        self.assertFalse(client.verify)
+
+    def test_ssl_consent_declined(self):
+        with mock.patch.dict(config.http, {'ssl': 'Consent'}), mock.patch('cterasdk.client.async_http.ask', return_value=False):
+            client = AsyncHttpClientBase('JSESSIONID')
+            with self.assertRaises(exception.SSLException):
+                self.run_async(client.on_ssl_error('portal', 443))
+        self.assertTrue(client.verify)
+
+    def test_retry_connect_timeout_non_idempotent(self):
+        response = mock.Mock(status=200, request_info=None)
+        connect_timeout = getattr(aiohttp, 'ConnectionTimeoutError', aiohttp.ServerTimeoutError)('Connection timeout to host')
+        client = self._retrying_client([connect_timeout, response])
+        self.assertEqual(self.run_async(client._dispatch(HttpClientRequestPost('/'))), (None, response))
+        self.assertEqual(client._do_dispatch.call_count, 2)
+
+    def test_no_retry_read_timeout_non_idempotent(self):
+        client = self._retrying_client([aiohttp.ServerTimeoutError('Timeout on reading data from socket')])
+        with self.assertRaises(exception.ExhaustedException):
+            self.run_async(client._dispatch(HttpClientRequestPost('/')))
+        self.assertEqual(client._do_dispatch.call_count, 1)
+
+    @staticmethod
+    def _retrying_client(side_effect):
+        client = AsyncHttpClientBase('JSESSIONID')
+        client.retry_policy = RetryPolicy(backoff=0)
+        client._do_dispatch = AsyncMagicMock(side_effect=side_effect)
+        return client
+
+    async def _login_and_get(self, port, path='/users/alice'):
+        async with AsyncGlobalAdmin('127.0.0.1', port, https=False) as admin:
+            await admin.login('admin', 'password')
+            self.assertEqual(await admin.get_session_id(), self._session_id)
+            return await admin.get(path)
+
+    async def _start_server(self):
+        app = web.Application()
+        app.router.add_post('/admin/api/login', self._login)
+        app.router.add_get('/admin/api/currentPortal', self._current_portal)
+        app.router.add_get('/admin/api/currentSession', self._current_session)
+        app.router.add_get('/admin/api/users/{name}', self._user)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        return self._runner.addresses[0][1]
+
+    async def _record(self, request):
+        self._requests.append(dict(path=request.path, cookie=request.cookies.get('JSESSIONID'), body=await request.text()))
+
+    async def _login(self, request):
+        await self._record(request)
+        response = web.Response(text='')
+        response.set_cookie('JSESSIONID', self._session_id)
+        return response
+
+    async def _current_portal(self, request):
+        await self._record(request)
+        return web.Response(text='<val></val>')
+
+    async def _current_session(self, request):
+        await self._record(request)
+        current_session = Object()
+        current_session.username = 'admin'
+        current_session.role = 'ReadWriteAdmin'
+        return web.Response(body=toxmlstr(current_session))
+
+    async def _user(self, request):
+        await self._record(request)
+        if request.match_info['name'] != 'alice':
+            error = Object()
+            error.msg = 'Not found'
+            return web.Response(status=404, body=toxmlstr(error))
+        user = Object()
+        user.name = 'alice'
+        user.uid = 1024
+        return web.Response(body=toxmlstr(user))
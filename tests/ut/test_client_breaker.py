@@ -0,0 +1,84 @@
+import socket
+import time
+import unittest
+
+from cterasdk import config, exception
+from cterasdk.client.breaker import CircuitBreaker, CircuitState
+from cterasdk.client.http import HTTPClient
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    _url = 'https://portal.ctera.com:443/admin/api/users'
+    _device_url = 'https://portal.ctera.com:443/admin/devicecmdnew/acme/vGateway-01/status'
+
+    def test_key(self):
+        self.assertEqual(CircuitBreaker.key(self._url), 'https://portal.ctera.com:443')
+        self.assertEqual(CircuitBreaker.key(self._device_url), 'https://portal.ctera.com:443/admin/devicecmdnew/acme/vGateway-01')
+        self.assertEqual(CircuitBreaker.key('https://portal.ctera.com:443/ServicesPortal/devices/vGateway-01/localFiles/share'),
+                         'https://portal.ctera.com:443/ServicesPortal/devices/vGateway-01')
+        self.assertEqual(CircuitBreaker.key('https://portal.ctera.com:443/admin/api/devices/vGateway-01'), 'https://portal.ctera.com:443')
+
+    def test_open_after_threshold(self):
+        breaker = CircuitBreaker(enabled=True, threshold=2)
+        breaker.failure(self._device_url)
+        breaker.before(self._device_url)
+        breaker.failure(self._device_url)
+        self.assertEqual(breaker.state(self._device_url).state, CircuitState.Open)
+        self.assertEqual(breaker.state(self._url).state, CircuitState.Closed)
+        with self.assertRaises(exception.CircuitBreakerOpen) as error:
+            breaker.before(self._device_url)
+        self.assertEqual(error.exception.baseurl, 'https://portal.ctera.com:443/admin/devicecmdnew/acme/vGateway-01')
+        breaker.before(self._url)
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker(enabled=True, threshold=2)
+        breaker.failure(self._url)
+        breaker.success(self._url)
+        breaker.failure(self._url)
+        self.assertEqual(breaker.state(self._url).state, CircuitState.Closed)
+        self.assertEqual(breaker.state(self._url).failures, 1)
+
+    def test_half_open_probe(self):
+        breaker = CircuitBreaker(enabled=True, threshold=1, reset_timeout=0.05)
+        breaker.failure(self._url)
+        time.sleep(0.1)
+        self.assertEqual(breaker.state(self._url).state, CircuitState.HalfOpen)
+        breaker.before(self._url)
+        with self.assertRaises(exception.CircuitBreakerOpen):
+            breaker.before(self._url)
+        breaker.failure(self._url)
+        self.assertEqual(breaker.state(self._url).state, CircuitState.Open)
+        time.sleep(0.1)
+        breaker.before(self._url)
+        breaker.success(self._url)
+        self.assertEqual(breaker.state(self._url).state, CircuitState.Closed)
+
+    def test_disabled(self):
+        breaker = CircuitBreaker(threshold=1)
+        breaker.failure(self._url)
+        breaker.before(self._url)
+        self.assertEqual(breaker.state(self._url).state, CircuitState.Closed)
+
+
+class TestHTTPClientCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self._breaker = config.http['breaker']
+        config.http['breaker'] = dict(self._breaker, enabled=True, threshold=2)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(('127.0.0.1', 0))
+        self._url = 'http://127.0.0.1:%s/admin/api/users' % sock.getsockname()[1]
+        sock.close()
+
+    def tearDown(self):
+        config.http['breaker'] = self._breaker
+
+    def test_fail_fast(self):
+        http_client = HTTPClient('JSESSIONID')
+        for _ in range(2):
+            with self.assertRaises(exception.HostUnreachable):
+                http_client.get(self._url)
+        self.assertEqual(http_client.circuit_state(self._url).state, CircuitState.Open)
+        with self.assertRaises(exception.CircuitBreakerOpen):
+            http_client.get(self._url)
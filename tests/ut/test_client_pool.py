@@ -0,0 +1,75 @@
+import socketserver
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from cterasdk import config
+from cterasdk.client.http import HTTPClient
+
+
+class PersistentConnectionHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = b'<val>ok</val>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self._pool = config.http['pool']
+        config.http['pool'] = dict(self._pool)
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), PersistentConnectionHandler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self._url = 'http://127.0.0.1:%s/' % self._server.server_address[1]
+
+    def tearDown(self):
+        self._server.shutdown()
+        self._server.server_close()
+        config.http['pool'] = self._pool
+
+    def test_connection_reused(self):
+        http_client = HTTPClient('JSESSIONID')
+        for _ in range(3):
+            _request, response = http_client.get(self._url)
+            self.assertEqual(response.text, '<val>ok</val>')
+        statistics = http_client.pool_statistics()
+        self.assertEqual(statistics.created, 1)
+        self.assertEqual(statistics.reused, 2)
+        self.assertEqual(statistics.expired, 0)
+
+    def test_idle_connection_expired(self):
+        config.http['pool']['idle_timeout'] = 0.05
+        http_client = HTTPClient('JSESSIONID')
+        for _ in range(2):
+            _request, response = http_client.get(self._url)
+            response.close()
+            time.sleep(0.1)
+        statistics = http_client.pool_statistics()
+        self.assertEqual(statistics.created, 2)
+        self.assertEqual(statistics.reused, 0)
+        self.assertEqual(statistics.expired, 1)
+
+    def test_pool_configuration(self):
+        config.http['pool'].update(dict(connections=4, maxsize=32, block=True, keepalive=30))
+        http_client = HTTPClient('JSESSIONID')
+        for scheme in ['http://', 'https://']:
+            poolmanager = http_client.session.get_adapter(scheme).poolmanager
+            self.assertEqual(poolmanager.connection_pool_kw['maxsize'], 32)
+            self.assertTrue(poolmanager.connection_pool_kw['block'])
+            self.assertIn(30, [option[2] for option in poolmanager.connection_pool_kw['socket_options']])
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from cterasdk.client.cteraclient import CTERAClient
+from cterasdk.client.ratelimit import RateLimiter, RateLimit
+from tests.ut import base_async
+
+
+class TestRateLimit(unittest.TestCase):
+
+    def test_token_bucket(self):
+        limit = RateLimit(rate=20, burst=1)
+        start = time.monotonic()
+        for _ in range(5):
+            limit.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_burst(self):
+        limit = RateLimit(rate=1, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            limit.acquire()
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_concurrency(self):
+        limit = RateLimit(concurrency=2)
+        lock = threading.Lock()
+        inflight = []
+        peak = []
+
+        def request():
+            limit.acquire()
+            with lock:
+                inflight.append(1)
+                peak.append(len(inflight))
+            time.sleep(0.02)
+            with lock:
+                inflight.pop()
+            limit.release()
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(limit.inflight, 0)
+
+    def test_rules(self):
+        users, add, total = RateLimit(rate=10), RateLimit(rate=5), RateLimit(rate=100)
+        limiter = RateLimiter().add(users, prefix='/users').add(add, verbs=['add']).add(total)
+        self.assertEqual(limiter.match('get', 'users/alice'), [users, total])
+        self.assertEqual(limiter.match('add', '/users'), [users, add, total])
+        self.assertEqual(limiter.match('add', '/zones'), [add, total])
+        self.assertEqual(limiter.match('put', '/settings'), [total])
+
+
+class TestAsyncRateLimit(base_async.BaseAsyncTest):
+
+    def test_concurrency(self):
+        limit = RateLimit(concurrency=2)
+        limiter = RateLimiter().add(limit)
+        inflight = []
+        peak = []
+
+        async def request():
+            async with limiter.async_limit('get', '/users'):
+                inflight.append(1)
+                peak.append(len(inflight))
+                await asyncio.sleep(0.01)
+                inflight.pop()
+
+        async def main():
+            await asyncio.gather(*[request() for _ in range(8)])
+
+        self.run_async(main())
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(limit.inflight, 0)
+
+
+class TestCTERAClientRateLimit(unittest.TestCase):
+
+    def test_client_rate_limit(self):
+        limit = RateLimit(concurrency=1)
+        limit.acquire = mock.MagicMock(wraps=limit.acquire)
+        client = CTERAClient('JSESSIONID')
+        client.limiter = RateLimiter().add(limit, verbs=['add'], prefix='/users')
+        client.http_client.dispatch = mock.MagicMock(return_value=(mock.MagicMock(), self._response('<val>ok</val>')))
+        self.assertEqual(client.db('https://portal/admin/api', '/users', 'add', None), 'ok')
+        self.assertEqual(client.get('https://portal/admin/api', '/users/alice'), 'ok')
+        limit.acquire.assert_called_once_with()
+        self.assertEqual(limit.inflight, 0)
+
+    @staticmethod
+    def _response(text):
+        response = mock.MagicMock()
+        response.iter_content.return_value = [text.encode('utf-8')]
+        return response
@@ -0,0 +1,125 @@
+import socketserver
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from cterasdk import config
+from cterasdk.client.http import HTTPClient, HTTPException, HttpClientRequestGet, HttpClientRequestPost
+from cterasdk.client.retry import RetryPolicy
+
+
+class UnavailableHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self._respond()
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._respond()
+
+    def _respond(self):
+        self.server.requests.append(self.command)
+        if len(self.server.requests) <= self.server.failures:
+            self._send(503, b'<val>Service Unavailable</val>', {'Retry-After': '0'})
+        else:
+            self._send(200, b'<val>ok</val>')
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_full_jitter_bounds(self):
+        policy = RetryPolicy(backoff=1, max_backoff=5)
+        for attempt in range(6):
+            for _ in range(20):
+                self.assertTrue(0 <= policy.delay(attempt) <= min(5, 2 ** attempt))
+
+    def test_retry_after(self):
+        policy = RetryPolicy()
+        self.assertEqual(policy.delay(0, '7'), 7)
+        self.assertEqual(policy.delay(0, '86400'), 30)
+        self.assertIsNone(RetryPolicy.parse_retry_after('invalid'))
+        self.assertEqual(RetryPolicy.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0)
+
+    def test_budget(self):
+        policy = RetryPolicy(retries=10, budget=5)
+        self.assertIsNone(policy.next(0, time.monotonic(), '10'))
+        self.assertEqual(policy.next(0, time.monotonic(), '1'), 1)
+        statistics = policy.statistics.snapshot()
+        self.assertEqual(statistics.retries, 1)
+        self.assertEqual(statistics.exhausted, 1)
+        self.assertEqual(statistics.sleep, 1)
+
+    def test_max_attempts(self):
+        policy = RetryPolicy(retries=2, backoff=0)
+        self.assertEqual(policy.next(0, time.monotonic()), 0)
+        self.assertIsNone(policy.next(1, time.monotonic()))
+
+    def test_idempotency(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.retryable_status(HttpClientRequestGet('/'), 503))
+        self.assertFalse(policy.retryable_status(HttpClientRequestGet('/'), 500))
+        self.assertFalse(policy.retryable_status(HttpClientRequestPost('/'), 503))
+        self.assertTrue(policy.retryable_status(HttpClientRequestPost('/'), 429))
+        self.assertTrue(policy.retryable_status(HttpClientRequestPost('/', idempotent=True), 503))
+        self.assertTrue(RetryPolicy(unsafe=True).retryable_status(HttpClientRequestPost('/'), 503))
+
+
+class TestHTTPClientRetry(unittest.TestCase):
+
+    def setUp(self):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), UnavailableHandler)
+        self._server.requests = []
+        self._server.failures = 2
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self._url = 'http://127.0.0.1:%s/' % self._server.server_address[1]
+
+    def tearDown(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def test_retry_idempotent_request(self):
+        http_client = HTTPClient('JSESSIONID')
+        _request, response = http_client.get(self._url)
+        self.assertEqual(response.text, '<val>ok</val>')
+        self.assertEqual(self._server.requests, ['GET', 'GET', 'GET'])
+        statistics = http_client.retry_statistics()
+        self.assertEqual(statistics.retries, 2)
+        self.assertEqual(statistics.exhausted, 0)
+
+    def test_no_retry_non_idempotent_request(self):
+        http_client = HTTPClient('JSESSIONID')
+        with self.assertRaises(HTTPException) as error:
+            http_client.post(self._url, data='<val>x</val>')
+        self.assertEqual(error.exception.response.code, 503)
+        self.assertEqual(self._server.requests, ['POST'])
+
+    def test_retry_exhausted(self):
+        retries = config.http['retries']
+        config.http['retries'] = 2
+        try:
+            http_client = HTTPClient('JSESSIONID')
+        finally:
+            config.http['retries'] = retries
+        with self.assertRaises(HTTPException):
+            http_client.get(self._url)
+        self.assertEqual(self._server.requests, ['GET', 'GET'])
+        self.assertEqual(http_client.retry_statistics().exhausted, 1)
@@ -1,6 +1,7 @@
 import json
+import pickle
 
-from cterasdk.common.object import Object
+from cterasdk.common.object import Object, Record, record
 from tests.ut import base
 
 
@@ -11,3 +12,37 @@ class TestCommonObject(base.BaseTest):
         object_str = str(o)
         object_str_json = json.loads(object_str)
         self.assertEqual(object_str_json['user'], o.user)
+
+
+class TestCommonRecord(base.BaseTest):
+
+    def test_record(self):
+        r = record({'_classname': 'PortalUser', 'name': 'alice', 'uid': 1})
+        self.assertIsInstance(r, Record)
+        self.assertEqual(type(r).__name__, 'PortalUser')
+        self.assertEqual((r.name, r.uid), ('alice', 1))
+        self.assertEqual(r.__dict__, {'_classname': 'PortalUser', 'name': 'alice', 'uid': 1})
+        self.assertEqual(json.loads(str(r))['name'], 'alice')
+        self.assertFalse(hasattr(r, 'email'))
+
+    def test_assignment(self):
+        r = record({'name': 'alice'})
+        r.name = 'bob'
+        self.assertEqual(r.name, 'bob')
+        with self.assertRaises(AttributeError):
+            r.email = 'bob@ctera.com'
+
+    def test_class_cache(self):
+        self.assertIs(type(record({'_classname': 'Device', 'name': 'a'})), type(record({'_classname': 'Device', 'name': 'b'})))
+        self.assertIsNot(type(record({'_classname': 'Device', 'name': 'a'})), type(record({'_classname': 'Device', 'uid': 1})))
+        self.assertIsNot(type(record({'_classname': 'Device', 'name': 'a'})), type(record({'_classname': 'Portal', 'name': 'a'})))
+
+    def test_invalid_names(self):
+        self.assertIsNone(record({'with space': 1}))
+        self.assertIsNone(record({'__private': 1}))
+
+    def test_pickle(self):
+        r = record({'_classname': 'PortalUser', 'name': 'alice', 'groups': [record({'name': 'admins'})]})
+        copy = pickle.loads(pickle.dumps(r))
+        self.assertIs(type(copy), type(r))
+        self.assertEqual(copy.groups[0].name, 'admins')
@@ -0,0 +1,88 @@
+import random
+from xml.etree.ElementTree import tostring
+
+from cterasdk import Object
+from cterasdk.convert import toxmlstr
+from cterasdk.convert.format import toxml
+from tests.ut import base_convert
+
+
+class TestXMLEncoder(base_convert.TestXML):
+
+    @staticmethod
+    def _legacy_toxmlstr(obj):
+        return tostring(toxml(obj))
+
+    def _assert_equivalent(self, obj):
+        self.assertEqual(toxmlstr(obj), self._legacy_toxmlstr(obj))
+
+    def test_escaping(self):
+        o = Object()
+        o._classname = 'Share"Config\'\n\r\t<&>'  # pylint: disable=protected-access
+        o._uuid = 'שלום'  # pylint: disable=protected-access
+        o.text = 'a < b && c > "d" \'e\'\n\r\t'
+        o.unicode = 'Café שלום 😀'
+        o.empty = ''
+        self._assert_equivalent(o)
+
+    def test_empty_elements(self):
+        o = Object()
+        o.none = None
+        o.empty_list = []
+        o.list_of_none = [None, None]
+        o.empty_object = Object()
+        o.hidden = Object()
+        o.hidden._private = 1  # pylint: disable=protected-access
+        self._assert_equivalent(o)
+        self._assert_equivalent([])
+        self._assert_equivalent(Object())
+
+    def test_unsupported_types(self):
+        o = Object()
+        o.dict = {'a': 1}
+        o.tuple = (1, 2)
+        o.list = [{'a': 1}, 1, (2,), None, 'x']
+        self._assert_equivalent(o)
+
+    def test_values(self):
+        for value in [0, -1, 2 ** 64, 0.1, 1e-07, 1e+22, float('inf'), complex(1, 2), True, False, 'true', ' padded ']:
+            self._assert_equivalent(value)
+
+    def test_nested(self):
+        o = Object()
+        o._classname = 'ShareConfig'  # pylint: disable=protected-access
+        o.acl = [Object()]
+        o.acl[0]._classname = 'ShareACLRule'  # pylint: disable=protected-access
+        o.acl[0].principal2 = Object()
+        o.acl[0].principal2._classname = 'LocalUser'  # pylint: disable=protected-access
+        o.acl[0].principal2.ref = '#config#auth#users#alice'
+        o.acl[0].permissions = 'ReadWrite'
+        o.matrix = [[1, 2], [], [[None]]]
+        self._assert_equivalent(o)
+
+    def test_equivalence_random(self):
+        generator = random.Random(2048)
+        for _ in range(200):
+            param = Object()
+            param.value = self._random_value(generator, 4)
+            self._assert_equivalent(param)
+
+    @staticmethod
+    def _random_value(generator, depth):
+        kind = generator.choice(['int', 'float', 'str', 'bool', 'none'] + (['list', 'obj'] * 2 if depth else []))
+        if kind == 'list':
+            return [TestXMLEncoder._random_value(generator, depth - 1) for _ in range(generator.randint(0, 4))]
+        if kind == 'obj':
+            param = Object()
+            if generator.random() < 0.5:
+                param._classname = generator.choice(['ShareConfig', 'Portal"User'])  # pylint: disable=protected-access
+            for index in range(generator.randint(0, 5)):
+                setattr(param, 'att%d' % index, TestXMLEncoder._random_value(generator, depth - 1))
+            return param
+        return {
+            'int': lambda: generator.randint(-1000, 1000),
+            'float': lambda: generator.uniform(-1000, 1000),
+            'str': lambda: generator.choice(['alice', 'x y', '<&>"', 'true', 'שלום', '', '\n']),
+            'bool': lambda: generator.choice([True, False]),
+            'none': lambda: None
+        }[kind]()
@@ -0,0 +1,107 @@
+import json
+import queue
+import random
+
+from cterasdk.common import Item, Object
+from cterasdk.convert import fromjsonstr, tojsonstr
+from cterasdk.convert.parse import SetAppendValue
+from tests.ut import base_convert
+
+
+def legacy_fromjsonstr(fromstr):
+    """ The breadth-first decoder, used as the reference implementation """
+    if not fromstr:
+        return fromstr
+    root = Item()
+    root.node = json.loads(fromstr)
+    root.parent = None
+    root.value = None
+    q = queue.Queue()
+    q.put(root)
+    while not q.empty():
+        item = q.get()
+        if item.node is None:
+            SetAppendValue(item, None)
+        elif isinstance(item.node, (int, float, bool, str)):
+            SetAppendValue(item, item.node)
+        elif isinstance(item.node, list):
+            item.value = []
+            SetAppendValue(item, item.value)
+            for kidnode in item.node:
+                kid = Item()
+                kid.parent = item
+                kid.node = kidnode
+                q.put(kid)
+        elif isinstance(item.node, dict):
+            item.value = Object()
+            SetAppendValue(item, item.value)
+            for kidnode, kidvalue in item.node.items():
+                kid = Item()
+                kid.parent = item
+                kid.id = kidnode
+                kid.node = kidvalue
+                q.put(kid)
+    return root.value
+
+
+class TestJSONDecoder(base_convert.TestJSON):
+
+    _documents = [
+        '{"name": "alice", "uid": 2156, "ratio": 0.5, "enabled": true, "password": null, "groups": ["a", "b"]}',
+        '[1, "x", null, false, [], {}, [[{"a": {"b": [1]}}]]]',
+        '{"a": 1, "a": 2, "_classname": "PortalUser", "with space": "\\u05e9\\u05dc\\u05d5\\u05dd"}',
+        '"text"',
+        '42',
+        'null',
+        '',
+        None
+    ]
+
+    @staticmethod
+    def _dumps(value):
+        return json.dumps(value, default=lambda o: o.__dict__)
+
+    def _assert_equivalent(self, document):
+        self.assertEqual(self._dumps(fromjsonstr(document)), self._dumps(legacy_fromjsonstr(document)), document)
+
+    def test_equivalence(self):
+        for document in self._documents:
+            self._assert_equivalent(document)
+
+    def test_objects(self):
+        o = fromjsonstr('{"user": {"name": "alice"}, "groups": [{"name": "admins"}]}')
+        self.assertIsInstance(o, Object)
+        self.assertIsInstance(o.user, Object)
+        self.assertIsInstance(o.groups[0], Object)
+        self.assertEqual(o.groups[0].name, 'admins')
+
+    def test_bytes(self):
+        for document in self._documents[:-2]:
+            expected = self._dumps(legacy_fromjsonstr(document))
+            for encoding in ['utf-8', 'utf-8-sig', 'utf-16', 'utf-32']:
+                self.assertEqual(self._dumps(fromjsonstr(document.encode(encoding))), expected)
+            self.assertEqual(self._dumps(fromjsonstr(bytearray(document.encode('utf-8')))), expected)
+        self.assertEqual(fromjsonstr(b''), b'')
+
+    def test_equivalence_random(self):
+        generator = random.Random(512)
+        for _ in range(200):
+            self._assert_equivalent(tojsonstr(self._random_value(generator, 4), pretty_print=False))
+
+    @staticmethod
+    def _random_value(generator, depth):
+        kind = generator.choice(['int', 'float', 'str', 'bool', 'none'] + (['list', 'obj'] * 2 if depth else []))
+        if kind == 'list':
+            return [TestJSONDecoder._random_value(generator, depth - 1) for _ in range(generator.randint(0, 4))]
+        if kind == 'obj':
+            param = Object()
+            for index in range(generator.randint(0, 5)):
+                setattr(param, 'att%d' % index, TestJSONDecoder._random_value(generator, depth - 1))
+            return param
+        return {
+            'int': lambda: generator.randint(-1000, 1000),
+            'float': lambda: generator.uniform(-1000, 1000),
+            'str': lambda: generator.choice(['alice', 'x y', '"quoted"', 'שלום', '']),
+            'bool': lambda: generator.choice([True, False]),
+            'none': lambda: None
+        }[kind]()
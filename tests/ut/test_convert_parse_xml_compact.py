@@ -0,0 +1,80 @@
+import json
+import tracemalloc
+from unittest import mock
+
+from cterasdk.common import Object, Record
+from cterasdk.convert import fromxmlstr, fromxmlstream, toxmlstr
+from cterasdk.core import query
+from tests.ut import base_convert
+
+
+class TestParseXMLCompact(base_convert.TestXML):
+
+    _value = None
+
+    _documents = [
+        '<obj class="QueryResults"><att id="hasMore"><val>false</val></att><att id="objects"><list>'
+        '<obj class="Device" uuid="1"><att id="name"><val>vGateway-01</val></att><att id="portal"><val>acme</val></att></obj>'
+        '<obj class="Device" uuid="2"><att id="name"><val>vGateway-02</val></att><att id="portal" /></obj>'
+        '<obj class="Device"><att id="name"><val>x</val></att><att id="tags"><list><obj><att id="t"><val>1</val></att></obj>'
+        '</list></att><att id="owner"><obj class="PortalUser"><att id="name"><val>alice</val></att></obj></att></obj>'
+        '</list></att></obj>',
+        '<obj><att id="a"><obj /><val>x</val></att><att id="b"><val>y</val><obj /></att></obj>',
+        '<obj><att id="with space"><obj><att id="n"><val>1</val></att></obj></att></obj>',
+        '<list><obj /><val>1</val><obj class="Empty" /></list>',
+        '<obj class="Empty" />',
+        '<val>1</val>'
+    ]
+
+    @staticmethod
+    def _dumps(value):
+        return json.dumps(value, default=lambda o: o.__dict__, sort_keys=True)
+
+    def test_equivalence(self):
+        for document in self._documents:
+            self.assertEqual(self._dumps(fromxmlstr(document, compact=True)), self._dumps(fromxmlstr(document)), document)
+            self.assertEqual(self._dumps(fromxmlstream([document.encode('utf-8')], compact=True)), self._dumps(fromxmlstr(document)))
+
+    def test_records(self):
+        response = fromxmlstr(self._documents[0], compact=True)
+        self.assertIsInstance(response, Record)
+        first, second, third = response.objects
+        self.assertIs(type(first), type(second))
+        self.assertEqual((first.name, first.portal, second.portal), ('vGateway-01', 'acme', None))
+        self.assertEqual(third.owner.name, 'alice')
+        self.assertIsInstance(third.tags[0], Record)
+
+    def test_fallback(self):
+        response = fromxmlstr(self._documents[2], compact=True)
+        self.assertIsInstance(response, Object)
+        self.assertIsInstance(getattr(response, 'with space'), Record)
+
+    def test_serialize(self):
+        for document in self._documents:
+            self.assertEqual(toxmlstr(fromxmlstr(document, compact=True)), toxmlstr(fromxmlstr(document)))
+
+    def test_query_iterator(self):
+        portal = mock.MagicMock()
+        portal.db.return_value = fromxmlstr(self._documents[0], compact=True)
+        param = mock.MagicMock()
+        names = [device.name for device in query.iterator(portal, '/devices', param, compact=True)]
+        self.assertEqual(names, ['vGateway-01', 'vGateway-02', 'x'])
+        portal.db.assert_called_once_with('/devices', 'query', param, compact=True)
+
+    def test_memory(self):
+        document = '<list>%s</list>' % ''.join(
+            '<obj class="LogMessage"><att id="id"><val>%d</val></att><att id="topic"><val>system</val></att>'
+            '<att id="msg"><val>Message %d</val></att><att id="origin"><val>vGateway-01</val></att></obj>' % (i, i) for i in range(10000)
+        )
+        regular = self._retained(lambda: fromxmlstr(document))
+        compact = self._retained(lambda: fromxmlstr(document, compact=True))
+        self.assertLess(compact, regular * 0.75, 'compact: %d bytes, regular: %d bytes' % (compact, regular))
+
+    def _retained(self, function):
+        tracemalloc.start()
+        try:
+            self._value = function()  # retain the decoded value while measuring
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+            self._value = None
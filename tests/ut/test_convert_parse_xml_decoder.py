@@ -0,0 +1,124 @@
+import json
+import queue
+import random
+from xml.etree.ElementTree import fromstring
+
+from cterasdk.common import Item, Object
+from cterasdk.convert import fromxmlstr, toxmlstr
+from cterasdk.convert.parse import ParseValue, SetAppendValue
+from cterasdk.convert.xml_types import XMLTypes
+from tests.ut import base_convert
+
+
+def legacy_fromxmlstr(string):  # pylint: disable=too-many-branches
+    """ The ElementTree based decoder, used as the reference implementation """
+    if not string:
+        return string
+    if string[:15].upper() == '<!DOCTYPE HTML>':
+        return string
+    root = Item()
+    root.value = None
+    root.parent = None
+    root.node = fromstring(string)
+    q = queue.Queue()
+    q.put(root)
+    while not q.empty():
+        item = q.get()
+        if item.node.tag == XMLTypes.VAL:
+            SetAppendValue(item, ParseValue(item.node.text))
+        elif item.node.tag == XMLTypes.LIST:
+            item.value = []
+            SetAppendValue(item, item.value)
+            for kidnode in item.node:
+                if kidnode.tag in [XMLTypes.OBJ, XMLTypes.VAL]:
+                    kid = Item()
+                    kid.parent = item
+                    kid.node = kidnode
+                    q.put(kid)
+        elif item.node.tag == XMLTypes.OBJ:
+            item.value = Object()
+            if item.node.attrib.get(XMLTypes.CLASS) is not None:
+                item.value._classname = item.node.attrib.get(XMLTypes.CLASS)  # pylint: disable=protected-access
+            if item.node.attrib.get(XMLTypes.UUID) is not None:
+                item.value._uuid = item.node.attrib.get(XMLTypes.UUID)  # pylint: disable=protected-access
+            SetAppendValue(item, item.value)
+            for kidnode in item.node:
+                if kidnode.tag == XMLTypes.ATT:
+                    kid = Item()
+                    kid.id = kidnode.attrib[XMLTypes.ID]
+                    kid.parent = item
+                    kid.node = kidnode
+                    q.put(kid)
+        elif item.node.tag == XMLTypes.ATT:
+            if len(item.node) > 0:
+                for kidnode in item.node:
+                    if kidnode.tag in [XMLTypes.OBJ, XMLTypes.LIST, XMLTypes.VAL]:
+                        kid = Item()
+                        kid.id = item.id
+                        kid.parent = item.parent
+                        kid.node = kidnode
+                        q.put(kid)
+            else:
+                SetAppendValue(item, None)
+    return root.value
+
+
+class TestXMLDecoder(base_convert.TestXML):
+
+    _documents = [
+        '<obj class="ShareConfig" uuid="6f0e8c79-5b1c-4d53-9d2b-7c0bde6b5ac3"><att id="name"><val>public</val></att>'
+        '<att id="acl"><list><obj class="ShareACLRule"><att id="principal2"><obj class="LocalUser"><att id="ref">'
+        '<val>#config#auth#users#alice</val></att></obj></att><att id="permissions"><val>ReadWrite</val></att></obj></list></att>'
+        '<att id="comment" /><att id="exportToNFS"><val>false</val></att><att id="quota"><val>0.5</val></att></obj>',
+        '<list><val>1</val><val>1.2.3</val><val> 42 </val><val>  true </val><val /><obj /></list>',
+        '<obj><att id="a"><val>x</val><val>y</val></att><att id="b"><unknown /></att><att id="c"><list><att id="d" /></list></att></obj>',
+        '<val>text<b>bold</b>tail</val>',
+        '<val>&lt;escaped&gt; &amp; &#1513;&#1500;&#1493;&#1501;</val>',
+        '<val><![CDATA[<raw>]]></val>',
+        '<obj class="Empty" />',
+        '<list />',
+        '',
+        '<!DOCTYPE HTML><html></html>'
+    ]
+
+    @staticmethod
+    def _dumps(value):
+        return json.dumps(value, default=lambda o: o.__dict__, sort_keys=True)
+
+    def _assert_equivalent(self, document):
+        self.assertEqual(self._dumps(fromxmlstr(document)), self._dumps(legacy_fromxmlstr(document)), document)
+
+    def test_equivalence(self):
+        for document in self._documents:
+            self._assert_equivalent(document)
+
+    def test_equivalence_bytes(self):
+        for document in self._documents[:-2]:
+            self.assertEqual(self._dumps(fromxmlstr(document.encode('utf-8'))), self._dumps(legacy_fromxmlstr(document)))
+
+    def test_equivalence_random(self):
+        generator = random.Random(1024)
+        for _ in range(200):
+            param = Object()
+            param.value = self._random_value(generator, 4)
+            self._assert_equivalent(toxmlstr(param).decode('utf-8'))
+
+    @staticmethod
+    def _random_value(generator, depth):
+        kind = generator.choice(['int', 'float', 'str', 'bool', 'none'] + (['list', 'obj'] * 2 if depth else []))
+        if kind == 'list':
+            return [TestXMLDecoder._random_value(generator, depth - 1) for _ in range(generator.randint(0, 4))]
+        if kind == 'obj':
+            param = Object()
+            if generator.random() < 0.5:
+                param._classname = generator.choice(['ShareConfig', 'PortalUser'])  # pylint: disable=protected-access
+            for index in range(generator.randint(0, 5)):
+                setattr(param, 'att%d' % index, TestXMLDecoder._random_value(generator, depth - 1))
+            return param
+        return {
+            'int': lambda: generator.randint(-1000, 1000),
+            'float': lambda: round(generator.uniform(-1000, 1000), 3),
+            'str': lambda: generator.choice(['alice', 'x y', '<&>', 'true', 'שלום', '1.2.3']),
+            'bool': lambda: generator.choice([True, False]),
+            'none': lambda: None
+        }[kind]()
@@ -0,0 +1,84 @@
+import json
+import tracemalloc
+
+from cterasdk.convert import fromxmlstr, fromxmlstream, ParseException
+from tests.ut import base_convert
+
+
+class TestParseXMLStream(base_convert.TestXML):
+
+    _documents = [
+        '<obj class="DiskStatus" uuid="ba94e323-e988-4c3d-a353-3fc5402a8614">'
+        '<att id="name"><val>SATA1</val></att>'
+        '<att id="isCtera"><val>true</val></att>'
+        '<att id="logicalCapacity"><val>952830</val></att>'
+        '<att id="ratio"><val>0.6901</val></att>'
+        '<att id="password" />'
+        '<att id="tags"><list><val>a</val><val>b</val><obj><att id="x"><val>1</val></att></obj></list></att>'
+        '</obj>',
+        '<list><val>1</val><val>2</val><obj class="Empty" /></list>',
+        '<list />',
+        '<val>Café &amp; שלום</val>',
+        '<val />',
+        '<?xml version="1.0" encoding="UTF-8"?>\n<obj>\n  <att id="name">\n    <val>alice</val>\n  </att>\n</obj>\n',
+        '<att id="detached" />',
+        '<unknown><val>1</val></unknown>'
+    ]
+
+    @staticmethod
+    def _dumps(value):
+        return json.dumps(value, default=lambda o: o.__dict__, sort_keys=True)
+
+    @staticmethod
+    def _chunks(data, size):
+        return [data[i:i + size] for i in range(0, len(data), size)]
+
+    def test_equivalent_to_fromxmlstr(self):
+        for document in self._documents:
+            expected = self._dumps(fromxmlstr(document))
+            encoded = document.encode('utf-8')
+            for size in [1, 2, 7, len(encoded)]:
+                self.assertEqual(self._dumps(fromxmlstream(self._chunks(encoded, size))), expected)
+            self.assertEqual(self._dumps(fromxmlstream(self._chunks(document, 5))), expected)
+
+    def test_empty(self):
+        self.assertEqual(fromxmlstream([]), '')
+        self.assertEqual(fromxmlstream([b'', b'']), '')
+
+    def test_html(self):
+        html = '<!DOCTYPE html><html><body>Portal</body></html>'
+        self.assertEqual(fromxmlstream(self._chunks(html.encode('utf-8'), 4)), html)
+        self.assertEqual(fromxmlstream([html]), fromxmlstr(html))
+
+    def test_html_split_character(self):
+        html = '<!DOCTYPE html><html>' + '\u05e9' * 10 + '</html>'
+        data = html.encode('utf-8')
+        self.assertEqual(fromxmlstream([data[:22], data[22:]]), html)  # the first character is split across chunks
+
+    def test_short_document(self):
+        self.assertEqual(fromxmlstream([b'<val>5</val>']), 5)
+
+    def test_parse_error(self):
+        with self.assertRaises(ParseException):
+            fromxmlstream([b'<obj><att id="a"><val>1</val></att>'])
+        with self.assertRaises(ParseException):
+            fromxmlstream([b'<obj></val>'])
+
+    def test_peak_memory(self):
+        document = '<list>%s</list>' % ''.join(
+            '<obj class="PortalUser"><att id="name"><val>user-%d</val></att><att id="email"><val>user-%d@ctera.com</val></att>'
+            '<att id="uid"><val>%d</val></att></obj>' % (i, i, i) for i in range(10000)
+        )
+        encoded = document.encode('utf-8')
+        del document
+        chunks = self._chunks(encoded, 65536)
+        self.assertLess(self._peak(fromxmlstream, chunks), self._peak(lambda c: fromxmlstr(b''.join(c).decode('utf-8')), chunks))
+
+    @staticmethod
+    def _peak(function, chunks):
+        tracemalloc.start()
+        try:
+            function(chunks)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
@@ -1,7 +1,11 @@
 import os
+import shutil
+import tempfile
 from unittest import mock
 
+from cterasdk.common import Object
 from cterasdk.core.files.browser import FileBrowser
+from cterasdk.exception import CTERAClientException
 from tests.ut import base_core
 
 
@@ -28,6 +32,68 @@ class TestCoreFilesBrowser(base_core.BaseCoreTest):
         actual_ctera_path = ls_mock.ls.call_args[0][1]
         self.assertEqual(actual_ctera_path.fullpath(), os.path.join(TestCoreFilesBrowser._base_path, path))
 
+    def test_upload_tree(self):
+        source = tempfile.mkdtemp()
+        try:
+            for path in [('a.txt',), ('docs', 'b.txt'), ('docs', 'c.txt'), ('docs', 'd.txt')]:
+                os.makedirs(os.path.join(source, *path[:-1]), exist_ok=True)
+                with open(os.path.join(source, *path), 'w', encoding='utf-8') as f:
+                    f.write('content')
+            self._global_admin.execute = mock.MagicMock(side_effect=TestCoreFilesBrowser._execute)
+            self._global_admin.upload = mock.MagicMock()
+            report = self.files.upload_tree(source, 'cloud/Users', concurrency=2)
+        finally:
+            shutil.rmtree(source)
+        self.assertEqual((report.directories, report.files, report.failed), (2, 4, []))
+        names = [call[0][1] for call in self._global_admin.execute.call_args_list]
+        self.assertEqual(names.count('fetchResources'), 2)  # the cloud folder of each directory is resolved once
+        self.assertEqual(names.count('makeCollection'), 3)  # cloud, cloud/Users and cloud/Users/docs
+        urls = sorted(call[0][0] for call in self._global_admin.upload.call_args_list)
+        self.assertEqual(urls, ['admin/upload/folders/docs', 'admin/upload/folders/docs', 'admin/upload/folders/docs',
+                                'admin/upload/folders/root'])
+
+    def test_upload_retry(self):
+        source = tempfile.mkdtemp()
+        try:
+            local_file = os.path.join(source, 'a.txt')
+            with open(local_file, 'w', encoding='utf-8') as f:
+                f.write('content')
+            self._global_admin.execute = mock.MagicMock(side_effect=TestCoreFilesBrowser._execute)
+            unavailable = TestCoreFilesBrowser._error(503)
+            self._global_admin.upload = mock.MagicMock(side_effect=[unavailable, unavailable, 'OK'])
+            with mock.patch('cterasdk.lib.transfer.time.sleep'):
+                self.files.upload(local_file, 'cloud/Users', retries=2)
+                self.assertEqual(self._global_admin.upload.call_count, 3)
+                self._global_admin.upload = mock.MagicMock(side_effect=TestCoreFilesBrowser._error(503))
+                with self.assertRaises(CTERAClientException):
+                    self.files.upload(local_file, 'cloud/Users')  # not retried by default
+                self.assertEqual(self._global_admin.upload.call_count, 1)
+                self._global_admin.upload = mock.MagicMock(side_effect=TestCoreFilesBrowser._error(403))
+                with self.assertRaises(CTERAClientException):
+                    self.files.upload(local_file, 'cloud/Users', retries=3)
+                self.assertEqual(self._global_admin.upload.call_count, 1)
+        finally:
+            shutil.rmtree(source)
+
+    @staticmethod
+    def _error(code):
+        error = CTERAClientException()
+        error.response = Object()
+        error.response.code = code
+        return error
+
+    @staticmethod
+    def _execute(path, name, param):
+        # pylint: disable=unused-argument
+        if name == 'fetchResources':
+            response = Object()
+            response.root = Object()
+            response.root.isFolder = True
+            response.root.cloudFolderInfo = Object()
+            response.root.cloudFolderInfo.uid = 'docs' if param.root.endswith('docs') else 'root'
+            return response
+        return None
+
     def test_mkdir(self):
         for recurse in [True, False]:
             self._test_mkdir(recurse)
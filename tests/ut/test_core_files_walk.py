@@ -0,0 +1,171 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from cterasdk.common import Object
+from cterasdk.exception import CTERAClientException, CTERAConnectionError, RemoteDirectoryNotFound
+from tests.ut import base_core_services
+
+
+class Tree:
+    """ Directory tree, listed using fetchResources """
+
+    basepath = '/ServicesPortal/webdav'
+
+    def __init__(self, directories, delay=None, errors=None):
+        self.directories = directories
+        self.delay = delay or (lambda root: 0)
+        self.errors = errors or {}
+        self.listed = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.concurrency = 0
+
+    def __call__(self, path, name, param):
+        # pylint: disable=unused-argument
+        root = param.root[len(Tree.basepath) + 1:]
+        with self.lock:
+            self.listed.append(root)
+            self.active = self.active + 1
+            self.concurrency = max(self.concurrency, self.active)
+        try:
+            time.sleep(self.delay(root))
+            if root in self.errors:
+                raise self.errors[root]
+            if root not in self.directories:
+                raise Tree._not_found()
+            response = Object()
+            names = self.directories[root]
+            response.hasMore = param.start + param.limit < len(names)
+            response.root = Tree._resource(root, True)
+            names = names[param.start: param.start + param.limit]
+            response.items = [Tree._resource(root + '/' + name, name.startswith('d')) for name in names]
+            return response
+        finally:
+            with self.lock:
+                self.active = self.active - 1
+
+    @staticmethod
+    def _not_found():
+        error = CTERAClientException()
+        error.response = Object()
+        error.response.code = 404
+        return error
+
+    @staticmethod
+    def _resource(path, folder):
+        resource_info = Object()
+        resource_info._classname = 'ResourceInfo'  # pylint: disable=protected-access
+        resource_info.href = Tree.basepath + '/' + path
+        resource_info.name = path.split('/')[-1]
+        resource_info.isFolder = folder
+        return resource_info
+
+
+class TestCoreFilesWalk(base_core_services.BaseCoreServicesTest):
+
+    directories = {
+        'Documents': ['d1', 'd2', 'f1'],
+        'Documents/d1': ['d3', 'f2', 'f3'],
+        'Documents/d2': ['f4'],
+        'Documents/d1/d3': ['f5']
+    }
+
+    breadth_first = [
+        'Documents/d1', 'Documents/d2', 'Documents/f1', 'Documents/d1/d3', 'Documents/d1/f2', 'Documents/d1/f3',
+        'Documents/d2/f4', 'Documents/d1/d3/f5'
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self._init_services()
+
+    def _walk(self, tree, *args, **kwargs):
+        self._services.execute = mock.MagicMock(side_effect=tree)
+        return [item.href[len(Tree.basepath) + 1:] for item in self._services.files.walk('Documents', *args, **kwargs)]
+
+    def test_walk(self):
+        tree = Tree(TestCoreFilesWalk.directories)
+        self.assertEqual(self._walk(tree), TestCoreFilesWalk.breadth_first)
+        self.assertEqual(tree.listed, ['Documents', 'Documents/d1', 'Documents/d2', 'Documents/d1/d3'])
+
+    def test_walk_pages(self):
+        tree = Tree({'Documents': ['f%d' % i for i in range(150)]})
+        self.assertEqual(len(self._walk(tree, concurrency=2)), 150)
+        self.assertEqual(tree.listed, ['Documents', 'Documents'])
+
+    def test_walk_concurrently_ordered(self):
+        tree = Tree(TestCoreFilesWalk.directories, delay=lambda root: 0.05 if root == 'Documents/d1' else 0)
+        self.assertEqual(self._walk(tree, concurrency=4), TestCoreFilesWalk.breadth_first)
+
+    def test_walk_concurrently_unordered(self):
+        tree = Tree(TestCoreFilesWalk.directories, delay=lambda root: 0.05 if root == 'Documents/d1' else 0)
+        items = self._walk(tree, concurrency=4, ordered=False)
+        self.assertEqual(sorted(items), sorted(TestCoreFilesWalk.breadth_first))
+        self.assertLess(items.index('Documents/d2/f4'), items.index('Documents/d1/f2'))
+
+    def test_walk_bounded(self):
+        directories = {'Documents': ['d%d' % i for i in range(40)]}
+        directories.update({'Documents/d%d' % i: [] for i in range(40)})
+        tree = Tree(directories, delay=lambda root: 0.01)
+        self.assertEqual(len(self._walk(tree, concurrency=3)), 40)
+        self.assertEqual(tree.concurrency, 3)
+
+    def test_max_depth(self):
+        tree = Tree(TestCoreFilesWalk.directories)
+        self.assertEqual(self._walk(tree, max_depth=1), ['Documents/d1', 'Documents/d2', 'Documents/f1'])
+        tree = Tree(TestCoreFilesWalk.directories)
+        self.assertEqual(self._walk(tree, concurrency=2, max_depth=2), TestCoreFilesWalk.breadth_first[:-1])
+
+    def test_predicate(self):
+        tree = Tree(TestCoreFilesWalk.directories)
+        items = self._walk(tree, concurrency=2, predicate=lambda folder: folder.name != 'd1')
+        self.assertEqual(items, ['Documents/d1', 'Documents/d2', 'Documents/f1', 'Documents/d2/f4'])
+        self.assertNotIn('Documents/d1', tree.listed)
+
+    def test_error_isolation(self):
+        for concurrency in [None, 4]:
+            errors = []
+            record = errors.append
+            directories = {k: v for k, v in TestCoreFilesWalk.directories.items() if k != 'Documents/d1'}
+            tree = Tree(directories, errors={'Documents/d2': CTERAClientException()})
+            items = self._walk(tree, concurrency=concurrency, onerror=lambda path, error, record=record: record((str(path), type(error))))
+            self.assertEqual(items, ['Documents/d1', 'Documents/d2', 'Documents/f1'])
+            self.assertEqual(sorted(errors), [
+                (Tree.basepath + '/Documents/d1', RemoteDirectoryNotFound),
+                (Tree.basepath + '/Documents/d2', CTERAClientException)
+            ])
+
+    def test_empty_directory(self):
+        directories = dict(TestCoreFilesWalk.directories)
+        directories['Documents/d2'] = []
+        self.assertEqual(len(self._walk(Tree(directories))), len(TestCoreFilesWalk.breadth_first) - 1)
+
+    def test_error_top_directory(self):
+        with self.assertRaises(RemoteDirectoryNotFound):
+            self._walk(Tree({}), concurrency=2)
+
+    def test_connection_error(self):
+        error = CTERAConnectionError('Connection reset', None, 'localhost', 443, 'HTTPS')
+        tree = Tree(TestCoreFilesWalk.directories, errors={'Documents/d2': error})
+        with self.assertRaises(CTERAConnectionError):
+            self._walk(tree, concurrency=2)
+
+    def test_download_tree(self):
+        errors = {'Documents/d2': CTERAClientException()}
+        self._services.execute = mock.MagicMock(side_effect=Tree(TestCoreFilesWalk.directories, errors=errors))
+        stream = mock.MagicMock()
+        stream.iter_content.return_value = [b'content']
+        self._services.openfile = mock.MagicMock(return_value=stream)
+        destination = tempfile.mkdtemp()
+        try:
+            report = self._services.files.download_tree('Documents', destination, concurrency=4)
+            self.assertEqual((report.directories, report.files, report.bytes), (3, 4, 28))
+            self.assertEqual([failure.path for failure in report.failed], [Tree.basepath + '/Documents/d2'])
+            self.assertTrue(os.path.isfile(os.path.join(destination, 'd1', 'd3', 'f5')))
+            self._services.openfile.assert_any_call(Tree.basepath + '/Documents/d1/d3/f5', use_file_url=True, headers=None)
+        finally:
+            shutil.rmtree(destination)
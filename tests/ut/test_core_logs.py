@@ -1,4 +1,5 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from unittest import mock
 
 from cterasdk.common import Object
 from cterasdk.core.enum import LogTopic, Severity, OriginType
@@ -44,6 +45,55 @@ class TestCoreLogs(base_core.BaseCoreTest):
         actual_query_params = self._global_admin.execute.call_args[0][2]
         self._assert_equal_objects(actual_query_params, expected_query_params)
 
+    def test_get_logs_keyset(self):
+        first, second = self._get_log_response(True, [(1, '2024-01-01T00:00:00'), (2, '2024-01-01T00:00:01')]), \
+            self._get_log_response(False, [(2, '2024-01-01T00:00:01'), (3, '2024-01-01T00:00:02')])
+        self._init_global_admin()
+        self._global_admin.execute.side_effect = [first, second]
+        logs_iterator = logs.Logs(self._global_admin).get(keyset=True)
+        self.assertEqual([log.id for log in logs_iterator], [1, 2, 3])
+        origin_type_filter = base_core.BaseCoreTest._create_filter(query.FilterType.String, 'originType',
+                                                                   query.Restriction.EQUALS, OriginType.Portal)
+        time_filter = base_core.BaseCoreTest._create_filter(query.FilterType.DateTime, 'time',
+                                                            query.Restriction.GREATER_EQUALS, '2024-01-01T00:00:01')
+        expected_query_params = base_core.BaseCoreTest._create_query_params(filters=[origin_type_filter, time_filter],
+                                                                            start_from=1, count_limit=50, topic=LogTopic.System,
+                                                                            minSeverity=Severity.INFO)
+        actual_query_params = self._global_admin.execute.call_args[0][2]
+        self._assert_equal_objects(actual_query_params, expected_query_params)
+
+    def test_follow_logs(self):
+        first, second = self._get_log_response(False, [(1, '2024-01-01T00:00:00'), (2, '2024-01-01T00:00:01')]), \
+            self._get_log_response(False, [(2, '2024-01-01T00:00:01'), (3, '2024-01-01T00:00:02')])
+        self._init_global_admin()
+        self._global_admin.execute.side_effect = [first, second]
+        follower = logs.Logs(self._global_admin).follow(since='01/01/2024 00:00:00', interval=0)
+        self.assertEqual([log.id for _, log in zip(range(3), follower)], [1, 2, 3])
+        time_filter = base_core.BaseCoreTest._create_filter(query.FilterType.DateTime, 'time',
+                                                            query.Restriction.GREATER_EQUALS, '2024-01-01T00:00:01')
+        actual_query_params = self._global_admin.execute.call_args[0][2]
+        self._assert_equal_objects(actual_query_params.filters[-1], time_filter)
+
+    def test_follow_logs_from_now(self):
+        self._init_global_admin()
+        self._global_admin.execute.side_effect = [self._get_log_response(False, [(1, '2024-01-01T00:00:00')])]
+        follower = logs.Logs(self._global_admin).follow(interval=0)
+        self.assertGreaterEqual(follower.mark, (datetime.now() - timedelta(minutes=1)).strftime('%Y-%m-%dT%H:%M:%S'))
+        with mock.patch.object(follower._stopped, 'wait', side_effect=lambda delay: follower.close()):  # pylint: disable=protected-access
+            self.assertEqual(list(follower), [])
+
+    @staticmethod
+    def _get_log_response(has_more, logs_list):
+        response = Object()
+        response.hasMore = has_more
+        response.logs = []
+        for log_id, time in logs_list:
+            log = Object()
+            log.id = log_id
+            log.time = time
+            response.logs.append(log)
+        return response
+
     @staticmethod
     def format_input_date(date_object, time):
         return date_object.strftime("%m/%d/%Y") + ' ' + time
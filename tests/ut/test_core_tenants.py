@@ -0,0 +1,126 @@
+import threading
+import time
+from unittest import mock
+
+from cterasdk.core.session import Session
+from cterasdk.core.tenants import TenantPool
+from cterasdk.exception import CTERAException
+from tests.ut import base
+
+
+class Admin:
+    """ Global Admin session, tracking logins and tenant switches """
+
+    lock = threading.Lock()
+    logins = []
+    browsed = []
+
+    def __init__(self, host, port, https):
+        self.address = (host, port, https)
+        self.tenant = Session.Administration
+        self.portals = mock.MagicMock()
+        self.portals.browse.side_effect = self._browse
+        self.portals.browse_global_admin.side_effect = lambda: self._browse(Session.Administration)
+        self.logout = mock.MagicMock()
+
+    def host(self):
+        return self.address[0]
+
+    def port(self):
+        return self.address[1]
+
+    def https(self):
+        return self.address[2]
+
+    def login(self, username, password):
+        with Admin.lock:
+            Admin.logins.append((username, password))
+
+    def session(self):
+        return mock.MagicMock(tenant=mock.MagicMock(return_value=self.tenant))
+
+    def _browse(self, tenant):
+        with Admin.lock:
+            Admin.browsed.append(tenant)
+        self.tenant = tenant
+
+
+class TestCoreTenantPool(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        Admin.logins = []
+        Admin.browsed = []
+        self._admin = Admin('portal.ctera.com', 443, True)
+
+    def test_map(self):
+        tenants = ['tenant-%d' % i for i in range(20)]
+        with TenantPool(self._admin, 'admin', 'password', size=4) as pool:
+            results = pool.map(self._work(), tenants)
+            sessions = list(pool._sessions)  # pylint: disable=protected-access
+        self.assertEqual(results, [('tenant-%d' % i, 'tenant-%d' % i) for i in range(20)])
+        self.assertLessEqual(len(Admin.logins), 4)
+        self.assertEqual(sorted(Admin.browsed), sorted(tenants))
+        for session in sessions:
+            self.assertEqual(session.address, ('portal.ctera.com', 443, True))
+            session.logout.assert_called_once()
+
+    def test_concurrency(self):
+        active = []
+        concurrency = []
+
+        def work(session, tenant):
+            with Admin.lock:
+                active.append(tenant)
+                concurrency.append(len(active))
+            time.sleep(0.01)
+            with Admin.lock:
+                active.remove(tenant)
+            return session.tenant
+
+        with TenantPool(self._admin, 'admin', 'password', size=4) as pool:
+            pool.map(work, ['tenant-%d' % i for i in range(12)], concurrency=2)
+        self.assertEqual(max(concurrency), 2)
+        self.assertLessEqual(len(Admin.logins), 2)
+
+    def test_switch_once_per_session(self):
+        with TenantPool(self._admin, 'admin', 'password', size=2) as pool:
+            pool.map(self._work(), ['acme', 'acme', 'acme'], concurrency=1)
+            pool.map(self._work(), ['acme', 'globex'], concurrency=1)
+        self.assertEqual(Admin.browsed, ['acme', 'globex'])
+        self.assertEqual(len(Admin.logins), 1)
+
+    def test_global_admin(self):
+        with TenantPool(self._admin, 'admin', 'password') as pool:
+            self.assertEqual(pool.run(self._work(), ''), ('', Session.Administration))
+        self.assertEqual(Admin.browsed, [])
+
+    def test_browse_global_admin(self):
+        with TenantPool(self._admin, 'admin', 'password', size=1) as pool:
+            pool.run(self._work(), 'acme')
+            self.assertEqual(pool.run(self._work(), None), (None, Session.Administration))
+            session = pool._sessions[0]  # pylint: disable=protected-access
+        session.portals.browse.assert_called_once_with('acme')
+        session.portals.browse_global_admin.assert_called_once_with()
+        self.assertEqual(Admin.browsed, ['acme', Session.Administration])
+
+    def test_error(self):
+        def work(session, tenant):
+            if tenant == 'globex':
+                raise CTERAException('Failed', None, tenant=tenant)
+            return session.tenant
+
+        with TenantPool(self._admin, 'admin', 'password', size=2) as pool:
+            with self.assertRaises(CTERAException):
+                pool.map(work, ['acme', 'globex', 'initech'])
+            self.assertEqual(pool.map(work, ['acme']), ['acme'])
+
+    def test_closed(self):
+        pool = TenantPool(self._admin, 'admin', 'password')
+        pool.close()
+        with self.assertRaises(CTERAException):
+            pool.run(self._work(), 'acme')
+
+    @staticmethod
+    def _work():
+        return lambda session, tenant: (tenant, session.tenant)
@@ -1,7 +1,13 @@
+import os
+import shutil
+import tempfile
 from unittest import mock
 
 from cterasdk import config
+from cterasdk.convert import fromdavxml
+from cterasdk.common import Object
 from cterasdk.edge.files.browser import FileBrowser
+from cterasdk.exception import CTERAClientException
 from tests.ut import base_edge
 
 
@@ -24,9 +30,73 @@ class TestEdgeFilesBrowser(base_edge.BaseEdgeTest):
         mock_get_dirpath = self.patch_call("cterasdk.lib.filesystem.FileSystem.get_dirpath",
                                            return_value=self._default_download_dir)
         self._files.download(self._path)
-        self._filer.openfile.assert_called_once_with(TestEdgeFilesBrowser.make_local_files_dir(self._fullpath), use_file_url=True)
+        self._filer.openfile.assert_called_once_with(TestEdgeFilesBrowser.make_local_files_dir(self._fullpath), use_file_url=True,
+                                                     headers=None)
         mock_get_dirpath.assert_called_once()
-        mock_save_file.assert_called_once_with(self._default_download_dir, self._filename, openfile_response)
+        mock_save_file.assert_called_once_with(self._default_download_dir, self._filename, openfile_response, None)
+
+    def test_download_segments(self):
+        content = os.urandom(200000)
+
+        def openfile(path, use_file_url, headers):
+            # pylint: disable=unused-argument
+            start, _, end = headers['Range'][len('bytes='):].partition('-')
+            start, end = int(start), int(end) if end else len(content) - 1
+            response = mock.MagicMock(status_code=206, headers={'Content-Range': 'bytes %d-%d/%d' % (start, end, len(content))})
+            response.iter_content.return_value = [content[start: end + 1]]
+            return response
+
+        self._init_filer()
+        self._filer.openfile = mock.MagicMock(side_effect=openfile)
+        destination = tempfile.mkdtemp()
+        try:
+            filepath = self._files.download(self._path, destination, segments=3)
+            with open(filepath, 'rb') as f:
+                self.assertEqual(f.read(), content)
+        finally:
+            shutil.rmtree(destination)
+        self.assertEqual(sorted(call[1]['headers']['Range'] for call in self._filer.openfile.call_args_list),
+                         ['bytes=0-', 'bytes=133334-199999', 'bytes=66667-133333'])
+
+    def test_download_resume(self):
+        content = os.urandom(200000)
+        drops = {0: 50000}
+
+        def openfile(path, use_file_url, headers):
+            # pylint: disable=unused-argument
+            start = int(headers['Range'][len('bytes='):].partition('-')[0])
+            content_range = 'bytes %d-%d/%d' % (start, len(content) - 1, len(content))
+            response = mock.MagicMock(status_code=206, headers={'Content-Range': content_range})
+            response.iter_content.return_value = [content[start: start + drops.pop(start, len(content))]]
+            return response
+
+        self._init_filer()
+        self._filer.openfile = mock.MagicMock(side_effect=openfile)
+        destination = tempfile.mkdtemp()
+        try:
+            with mock.patch('cterasdk.lib.transfer.time.sleep'):
+                filepath = self._files.download(self._path, destination, resume=True)
+            with open(filepath, 'rb') as f:
+                self.assertEqual(f.read(), content)
+            self.assertEqual(os.listdir(destination), [self._filename])
+        finally:
+            shutil.rmtree(destination)
+        self.assertEqual([call[1]['headers']['Range'] for call in self._filer.openfile.call_args_list],
+                         ['bytes=0-', 'bytes=0-', 'bytes=50000-199999'])
+
+    def test_download_resume_not_found(self):
+        error = CTERAClientException()
+        error.response = Object()
+        error.response.code = 404
+        self._init_filer()
+        self._filer.openfile = mock.MagicMock(side_effect=error)
+        destination = tempfile.mkdtemp()
+        try:
+            with self.assertRaises(CTERAClientException):
+                self._files.download(self._path, destination, resume=True)
+        finally:
+            shutil.rmtree(destination)
+        self._filer.openfile.assert_called_once()  # client errors are not retried
 
     def test_openfile_success(self):
         openfile_response = 'Stream'
@@ -89,6 +159,54 @@ class TestEdgeFilesBrowser(base_edge.BaseEdgeTest):
             calls.append(mock.call(TestEdgeFilesBrowser.make_local_files_dir(path), use_file_url=True))
         self._filer.mkcol.assert_has_calls(calls)
 
+    def test_ls(self):
+        self._init_filer()
+        self._filer.propfind = mock.MagicMock(return_value=fromdavxml(TestEdgeFilesBrowser._multistatus(self._path, [
+            ('', True, None), ('jumps', True, None), ('over%20the.txt', False, 12)
+        ])))
+        items = self._files.ls(self._path)
+        self._filer.propfind.assert_called_once_with(TestEdgeFilesBrowser.make_local_files_dir(self._fullpath), depth=1, use_file_url=True)
+        self.assertEqual([(item.name, item.path, item.isFolder, item.size) for item in items], [
+            ('jumps', self._path + '/jumps', True, None),
+            ('over the.txt', self._path + '/over the.txt', False, 12)
+        ])
+        self.assertEqual(items[1].lastmodified, 'Tue, 15 Nov 1994 08:12:31 GMT')
+
+    def test_download_tree(self):
+        tree = {
+            self._path: [('', True, None), ('jumps', True, None), ('a.txt', False, 3)],
+            self._path + '/jumps': [('', True, None), ('b.txt', False, 3)]
+        }
+        self._init_filer()
+        self._filer.propfind = mock.MagicMock(side_effect=lambda path, depth, use_file_url: fromdavxml(
+            TestEdgeFilesBrowser._multistatus(path[len('localFiles//'):], tree[path[len('localFiles//'):]])
+        ))
+        stream = mock.MagicMock()
+        stream.iter_content.return_value = [b'abc']
+        self._filer.openfile = mock.MagicMock(return_value=stream)
+        destination = tempfile.mkdtemp()
+        try:
+            report = self._files.download_tree(self._path, destination, concurrency=2)
+            self.assertEqual((report.directories, report.files, report.bytes), (1, 2, 6))
+            self.assertTrue(os.path.isfile(os.path.join(destination, 'jumps', 'b.txt')))
+            self._filer.openfile.assert_any_call(TestEdgeFilesBrowser.make_local_files_dir(self._fullpath + '/a.txt'), use_file_url=True,
+                                                 headers=None)
+        finally:
+            shutil.rmtree(destination)
+
+    @staticmethod
+    def _multistatus(directory, resources):
+        responses = []
+        for name, folder, size in resources:
+            href = '/localFiles/%s/%s' % (directory, name)
+            properties = '<D:resourcetype><D:collection/></D:resourcetype>' if folder else '<D:resourcetype/>'
+            if size is not None:
+                properties = properties + '<D:getcontentlength>%d</D:getcontentlength>' % size
+            properties = properties + '<D:getlastmodified>Tue, 15 Nov 1994 08:12:31 GMT</D:getlastmodified>'
+            properties = '<D:propstat><D:prop>%s</D:prop></D:propstat>' % properties
+            responses.append('<D:response><D:href>%s</D:href>%s</D:response>' % (href, properties))
+        return '<?xml version="1.0" encoding="utf-8"?><D:multistatus xmlns:D="DAV:">%s</D:multistatus>' % ''.join(responses)
+
     @staticmethod
     def make_local_files_dir(full_path):
         return 'localFiles/%s' % full_path
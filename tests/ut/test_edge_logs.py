@@ -23,6 +23,24 @@ class TestEdgeLogs(base_edge.BaseEdgeTest):
             self.assertEqual(expected_log, actual_log)
         self._filer.execute.assert_called_once_with('/config/logging/general', 'pagedQuery', mock.ANY)
 
+    def test_get_logs_keyset(self):
+        first = TestEdgeLogs._get_query_logs_response(True, [TestEdgeLogs._get_log('2024-01-01T00:00:0%d' % i, str(i)) for i in (5, 4)])
+        second = TestEdgeLogs._get_query_logs_response(False, [TestEdgeLogs._get_log('2024-01-01T00:00:0%d' % i, str(i)) for i in (4, 3)])
+        self._init_filer()
+        self._filer.execute.side_effect = [first, second]
+        error_log_iterator = logs.Logs(self._filer).logs(self._topic, keyset=True)
+        self.assertEqual([log.msg for log in error_log_iterator], ['5', '4', '3'])
+        self.assertEqual(self._filer.execute.call_args[0][2].startFrom, 2)
+
+    def test_follow_logs(self):
+        first = TestEdgeLogs._get_query_logs_response(False, [TestEdgeLogs._get_log('2024-01-01T00:00:0%d' % i, str(i)) for i in (2, 1)])
+        second = TestEdgeLogs._get_query_logs_response(True, [TestEdgeLogs._get_log('2024-01-01T00:00:0%d' % i, str(i)) for i in (3, 1)])
+        self._init_filer()
+        self._filer.execute.side_effect = [first, second]
+        follower = logs.Logs(self._filer).follow(self._topic, interval=0)
+        self.assertEqual([log.msg for _, log in zip(range(2), follower)], ['2', '3'])  # following from the newest log
+        self.assertEqual(self._filer.execute.call_count, 2)  # stopped at a log that was already returned
+
     def test_modify_log_settings(self):
         get_response = TestEdgeLogs._get_log_settings(7, Severity.INFO)
         self._init_filer(get_response=get_response)
@@ -40,6 +58,13 @@ class TestEdgeLogs(base_edge.BaseEdgeTest):
         param.minSeverity = min_severity
         return param
 
+    @staticmethod
+    def _get_log(time, msg):
+        log = Object()
+        log.time = time
+        log.msg = msg
+        return log
+
     @staticmethod
     def _get_query_logs_response(has_more, log_events):
         response = Object()
@@ -0,0 +1,85 @@
+import asyncio
+
+from cterasdk.core import query
+from cterasdk.lib import AsyncIterator, AsyncParallelIterator
+from tests.ut import base_async
+
+
+class Pages:
+    """ Asynchronous collection, fetched in pages of ``countLimit`` objects """
+
+    def __init__(self, total, delay=None, error=None):
+        self.total = total
+        self.delay = delay
+        self.error = error
+        self.requests = []
+        self.active = 0
+        self.concurrency = 0
+
+    async def __call__(self, param):
+        self.requests.append(param.startFrom)
+        self.active = self.active + 1
+        self.concurrency = max(self.concurrency, self.active)
+        try:
+            await asyncio.sleep(self.delay(param.startFrom) if self.delay is not None else 0)
+            if self.error is not None and param.startFrom >= self.error:
+                raise ConnectionError('Connection reset')
+            end = min(param.startFrom + param.countLimit, self.total)
+            return end < self.total, list(range(param.startFrom, end))
+        finally:
+            self.active = self.active - 1
+
+
+class TestAsyncIterator(base_async.BaseAsyncTest):
+
+    @staticmethod
+    def _param(size=10):
+        return query.QueryParamBuilder().countLimit(size).build()
+
+    async def _list(self, iterator):
+        return [o async for o in iterator]
+
+    def test_iterate(self):
+        for prefetch in [0, 2]:
+            pages = Pages(55)
+            self.assertEqual(self.run_async(self._list(AsyncIterator(pages, self._param(), prefetch))), list(range(55)))
+            self.assertEqual(pages.requests, [0, 10, 20, 30, 40, 50])
+
+    def test_empty(self):
+        self.assertEqual(self.run_async(self._list(AsyncIterator(Pages(0), self._param(), 0))), [])
+
+    def test_error(self):
+        for prefetch in [0, 2]:
+            with self.assertRaises(ConnectionError):
+                self.run_async(self._list(AsyncIterator(Pages(100, error=30), self._param(), prefetch)))
+
+    def test_prefetch_bounded(self):
+        async def consume():
+            async with AsyncIterator(pages, self._param(), 2) as iterator:
+                async for _ in iterator:
+                    await asyncio.sleep(0.05)
+                    break
+        pages = Pages(1000)
+        self.run_async(consume())
+        self.assertLessEqual(len(pages.requests), 4)  # a page being consumed, two queued and one waiting to be queued
+
+    def test_parallel(self):
+        for ordered in [True, False]:
+            pages = Pages(95, delay=lambda start: 0.01 if start % 20 == 0 else 0)
+            objects = self.run_async(self._list(AsyncParallelIterator(pages, self._param(), 4, ordered)))
+            self.assertEqual(objects if ordered else sorted(objects), list(range(95)))
+            self.assertLessEqual(pages.concurrency, 4)
+
+    def test_parallel_error(self):
+        with self.assertRaises(ConnectionError):
+            self.run_async(self._list(AsyncParallelIterator(Pages(100, error=30), self._param(), 4)))
+
+    def test_parallel_close(self):
+        async def consume():
+            async with AsyncParallelIterator(pages, self._param(), 4) as iterator:
+                async for o in iterator:
+                    return o
+            return None
+        pages = Pages(1000)
+        self.assertEqual(self.run_async(consume()), 0)
+        self.assertEqual(pages.requests, [0, 10, 20, 30])
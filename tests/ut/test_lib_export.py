@@ -0,0 +1,109 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from cterasdk.common import Object
+from cterasdk.core import query
+from cterasdk.exception import CTERAException
+from cterasdk.lib.export import export
+from tests.ut import base
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def device(i, owner=True):
+    o = Object()
+    o._classname = 'Device'  # pylint: disable=protected-access
+    o.name = 'device-%d' % i
+    o.bytes = i * 1024
+    if owner:
+        o.owner = Object()
+        o.owner.name = 'user-%d' % i
+    o.tags = ['a', 'b']
+    return o
+
+
+class TestExport(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._objects = [device(i) for i in range(5)]
+
+    def test_ndjson(self):
+        f = io.StringIO()
+        self.assertEqual(export(iter(self._objects), f, batch=2), 5)
+        rows = [json.loads(line) for line in f.getvalue().splitlines()]
+        self.assertEqual(rows[1], {'name': 'device-1', 'bytes': 1024, 'owner': {'name': 'user-1'}, 'tags': ['a', 'b']})
+
+    def test_ndjson_fields(self):
+        f = io.StringIO()
+        objects = self._objects + [device(5, owner=False)]
+        export(objects, f, ['name', 'owner/name'])
+        rows = [json.loads(line) for line in f.getvalue().splitlines()]
+        self.assertEqual(rows[0], {'name': 'device-0', 'owner/name': 'user-0'})
+        self.assertEqual(rows[5], {'name': 'device-5', 'owner/name': None})
+
+    def test_csv(self):
+        f = io.StringIO()
+        export(self._objects, f, format='csv')
+        rows = list(csv.reader(io.StringIO(f.getvalue())))
+        self.assertEqual(rows[0], ['name', 'bytes', 'owner/name', 'tags'])
+        self.assertEqual(rows[2], ['device-1', '1024', 'user-1', '["a", "b"]'])
+        self.assertEqual(len(rows), 6)
+
+    def test_csv_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'devices.csv')
+            export(self._objects, path, ['name'], format='csv', concurrent=True)
+            with open(path, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read().splitlines(), ['name'] + ['device-%d' % i for i in range(5)])
+
+    def test_concurrent(self):
+        f = io.StringIO()
+        self.assertEqual(export(iter(self._objects * 100), f, ['name'], concurrent=True, batch=7), 500)
+        self.assertEqual(len(f.getvalue().splitlines()), 500)
+
+    def test_error(self):
+        def objects():
+            yield self._objects[0]
+            raise CTERAException('Connection reset')
+        for concurrent in [False, True]:
+            with self.assertRaises(CTERAException):
+                export(objects(), io.StringIO(), concurrent=concurrent, batch=1)
+        with self.assertRaises(CTERAException):
+            export(self._objects, io.StringIO(), format='xml')
+
+    def test_query_export(self):
+        f = io.StringIO()
+        self.assertEqual(query.export(iter(self._objects), f, ['name'], 'ndjson'), 5)
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow(self):
+        f = io.BytesIO()
+        objects = [device(0, owner=False)] + self._objects[1:]
+        export(objects, f, ['name', 'bytes', 'owner/name'], format='arrow', batch=2)
+        table = pyarrow.ipc.open_stream(f.getvalue()).read_all()
+        self.assertEqual(table.column_names, ['name', 'bytes', 'owner/name'])
+        self.assertEqual(table.column('bytes').to_pylist(), [i * 1024 for i in range(5)])
+        self.assertEqual(table.column('owner/name').to_pylist(), [None] + ['user-%d' % i for i in range(1, 5)])
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow_mixed_types(self):
+        objects = []
+        for value, ratio, size in [(1, 1, None), (2, 2, None), ('v3', 3.5, None), (4, 4, 10)]:
+            o = Object()
+            o.value, o.ratio, o.size = value, ratio, size
+            objects.append(o)
+        f = io.BytesIO()
+        self.assertEqual(export(objects, f, format='arrow', batch=2), 4)
+        table = pyarrow.ipc.open_stream(f.getvalue()).read_all()
+        self.assertEqual([str(field.type) for field in table.schema], ['string', 'double', 'int64'])
+        self.assertEqual(table.column('value').to_pylist(), ['1', '2', 'v3', '4'])
+        self.assertEqual(table.column('ratio').to_pylist(), [1.0, 2.0, 3.5, 4.0])
+        self.assertEqual(table.column('size').to_pylist(), [None, None, None, 10])
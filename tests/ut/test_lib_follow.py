@@ -0,0 +1,87 @@
+from unittest import mock
+
+from cterasdk.common import Object
+from cterasdk.lib import Follower
+from tests.ut import base
+
+
+class Source:
+    """ Objects returned on each poll, at or after the high-water mark """
+
+    def __init__(self, polls):
+        self.polls = list(polls)
+        self.marks = []
+
+    def __call__(self, mark):
+        self.marks.append(mark)
+        objects = self.polls.pop(0) if self.polls else []
+        return [Source.create(key, i) for key, i in objects if mark is None or key >= mark]
+
+    @staticmethod
+    def create(key, i):
+        o = Object()
+        o.id = i
+        o.key = key
+        return o
+
+
+class TestFollower(base.BaseTest):
+
+    @staticmethod
+    def _follow(follower, count):
+        objects = []
+        with mock.patch.object(follower._stopped, 'wait') as wait:  # pylint: disable=protected-access
+            for o in follower:
+                objects.append(o.id)
+                if len(objects) == count:
+                    break
+        return objects, wait
+
+    @staticmethod
+    def _follower(source, **kwargs):
+        return Follower(source, lambda o: o.key, lambda o: o.id, **kwargs)
+
+    def test_follow(self):
+        source = Source([[(2, 'b'), (1, 'a')], [(2, 'b'), (2, 'c'), (3, 'd')], [], [(3, 'd'), (4, 'e')]])
+        follower = self._follower(source)
+        objects, _ = self._follow(follower, 5)
+        self.assertEqual(objects, ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(source.marks, [None, 2, 3, 3])
+        self.assertEqual(follower.mark, 4)
+
+    def test_mark(self):
+        source = Source([[(1, 'a'), (2, 'b'), (3, 'c')]])
+        objects, _ = self._follow(self._follower(source, mark=2), 2)
+        self.assertEqual(objects, ['b', 'c'])
+
+    def test_backoff(self):
+        source = Source([[(1, 'a')], [], [], [], [], [(2, 'b')]])
+        follower = self._follower(source, interval=1, max_interval=6)
+        objects, wait = self._follow(follower, 2)
+        self.assertEqual(objects, ['a', 'b'])
+        self.assertEqual([call[0][0] for call in wait.call_args_list], [1, 2, 4, 6, 6])
+
+    def test_bounded(self):
+        source = Source([[(i, str(i)) for i in range(100)]])
+        follower = self._follower(source)
+        self._follow(follower, 100)
+        self.assertEqual(follower._seen, {'99'})  # pylint: disable=protected-access
+
+    def test_pages(self):
+        consumed = []
+
+        def poll(mark):  # pylint: disable=unused-argument
+            for i in range(6):
+                consumed.append(i)
+                yield Source.create(i // 2 * 2 + 1 - i % 2, str(i))
+
+        follower = self._follower(poll)
+        with mock.patch.object(Follower, 'page', 2):
+            objects, _ = self._follow(follower, 3)
+        self.assertEqual(objects, ['1', '0', '3'])
+        self.assertEqual(consumed, [0, 1, 2, 3])  # the rest of the poll is not read
+
+    def test_close(self):
+        follower = self._follower(Source([]), interval=0)
+        follower.close()
+        self.assertEqual(list(follower), [])
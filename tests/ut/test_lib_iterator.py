@@ -0,0 +1,269 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from cterasdk import config, exception, fromjsonstr, tojsonstr
+from cterasdk.core import query
+from cterasdk.lib import Iterator, ParallelIterator
+from tests.ut import base
+
+
+class Pages:
+
+    def __init__(self, pages, size, latency=0, error=None):
+        self.pages = pages
+        self.size = size
+        self.latency = latency
+        self.error = error
+        self.requests = []
+
+    def __call__(self, param):
+        self.requests.append(param.startFrom)
+        time.sleep(self.latency)
+        page = param.startFrom // self.size
+        if page == self.error:
+            raise ConnectionError('page %d' % page)
+        objects = list(range(param.startFrom, param.startFrom + self.size)) if page < self.pages else []
+        return page < self.pages - 1, objects
+
+
+class TestIterator(base.BaseTest):
+
+    @staticmethod
+    def _param(size):
+        return query.QueryParamBuilder().countLimit(size).build()
+
+    def test_iterate(self):
+        for prefetch in [0, 1, 3]:
+            function = Pages(pages=5, size=10)
+            self.assertEqual(list(Iterator(function, self._param(10), prefetch)), list(range(50)))
+            self.assertEqual(function.requests, [0, 10, 20, 30, 40])
+
+    def test_empty(self):
+        for prefetch in [0, 2]:
+            self.assertEqual(list(Iterator(Pages(pages=0, size=10), self._param(10), prefetch)), [])
+
+    def test_empty_page(self):
+        function = mock.MagicMock(side_effect=[(True, []), (True, None), (False, [1])])
+        self.assertEqual(list(Iterator(function, self._param(10), 0)), [1])
+
+    def test_default_prefetch(self):
+        with mock.patch.dict(config.iterator, {'prefetch': 2}):
+            iterator = Iterator(Pages(pages=1, size=1), self._param(1))
+            self.assertIsNotNone(iterator._prefetcher)  # pylint: disable=protected-access
+            self.assertEqual(list(iterator), [0])
+        self.assertIsNone(Iterator(Pages(pages=1, size=1), self._param(1))._prefetcher)  # pylint: disable=protected-access
+
+    def test_error(self):
+        for prefetch in [0, 1]:
+            iterator = Iterator(Pages(pages=5, size=10, error=2), self._param(10), prefetch)
+            self.assertEqual([next(iterator) for _ in range(20)], list(range(20)))
+            with self.assertRaises(ConnectionError):
+                next(iterator)
+            with self.assertRaises(ConnectionError):
+                next(iterator)  # raised again, rather than waiting for a page that will not be fetched
+
+    def test_depth(self):
+        function = Pages(pages=100, size=1)
+        iterator = Iterator(function, self._param(1), prefetch=3)
+        next(iterator)
+        time.sleep(0.2)
+        self.assertLessEqual(len(function.requests), 5)  # the page consumed, three queued and one waiting to be queued
+        iterator.close()
+
+    def test_close(self):
+        threads = threading.active_count()
+        with Iterator(Pages(pages=100, size=1), self._param(1), prefetch=1) as iterator:
+            next(iterator)
+        time.sleep(0.3)
+        self.assertEqual(threading.active_count(), threads)
+        with self.assertRaises(StopIteration):
+            next(iterator)
+
+    def test_abandoned(self):
+        threads = threading.active_count()
+        iterator = Iterator(Pages(pages=100, size=1), self._param(1), prefetch=1)
+        next(iterator)
+        del iterator
+        time.sleep(0.3)
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_overlap(self):
+        for prefetch in [0, 1]:
+            fetching = [threading.Event() for _ in range(3)]
+
+            def function(param, fetching=fetching):
+                page = param.startFrom // 10
+                fetching[page].set()
+                return page < 2, list(range(param.startFrom, param.startFrom + 10))
+
+            iterator = Iterator(function, self._param(10), prefetch)
+            next(iterator)  # the first object of the first page
+            self.assertEqual(fetching[1].wait(1 if prefetch else 0.1), bool(prefetch))  # the next page is fetched while consuming
+            self.assertEqual(list(iterator), list(range(1, 30)))
+
+
+class TestParallelIterator(base.BaseTest):
+
+    @staticmethod
+    def _param(size):
+        return query.QueryParamBuilder().countLimit(size).build()
+
+    def test_ordered(self):
+        for concurrency in [2, 4, 16]:
+            function = Pages(pages=10, size=10)
+            param = self._param(10)
+            self.assertEqual(list(ParallelIterator(function, param, concurrency)), list(range(100)))
+            self.assertLessEqual(len(function.requests), 10 + concurrency)
+            self.assertEqual(param.startFrom, 0)
+
+    def test_unordered(self):
+        for concurrency in [2, 4, 16]:
+            function = Pages(pages=10, size=10)
+            self.assertEqual(sorted(ParallelIterator(function, self._param(10), concurrency, ordered=False)), list(range(100)))
+
+    def test_empty(self):
+        for ordered in [True, False]:
+            self.assertEqual(list(ParallelIterator(Pages(pages=0, size=10), self._param(10), 4, ordered)), [])
+
+    def test_error(self):
+        for ordered in [True, False]:
+            with self.assertRaises(ConnectionError):
+                list(ParallelIterator(Pages(pages=10, size=10, error=3), self._param(10), 4, ordered))
+
+    def test_collection_grew(self):
+        def function(param):
+            time.sleep(0.05 if param.startFrom == 0 else 0)
+            if param.startFrom == 0:
+                return False, [0]  # the first page reports no more objects
+            return False, [param.startFrom]  # objects added while scanning
+        with self.assertLogs(level='WARNING'):
+            self.assertEqual(list(ParallelIterator(function, self._param(1), 4)), [0])
+        with self.assertLogs(level='WARNING'):
+            self.assertIn(0, list(ParallelIterator(function, self._param(1), 4, ordered=False)))
+
+    def test_collection_shrank(self):
+        def function(param):
+            return param.startFrom < 30, [param.startFrom] if param.startFrom % 20 else list(range(param.startFrom, param.startFrom + 10))
+        with self.assertLogs(level='WARNING'):
+            self.assertEqual(list(ParallelIterator(function, self._param(10), 2)), list(range(10)) + [10, 20] + list(range(21, 30)) + [30])
+
+    def test_close(self):
+        iterator = ParallelIterator(Pages(pages=100, size=1), self._param(1), 4)
+        next(iterator)
+        iterator.close()
+        with self.assertRaises(StopIteration):
+            next(iterator)
+
+    def test_query_iterator(self):
+        portal = mock.MagicMock()
+        self.assertIsInstance(query.iterator(portal, '/users', self._param(10), parallel=4), ParallelIterator)
+        with mock.patch.dict(config.iterator, {'parallel': 4}):
+            self.assertIsInstance(query.iterator(portal, '/users', self._param(10)), ParallelIterator)
+        self.assertIsInstance(query.iterator(portal, '/users', self._param(10)), Iterator)
+
+    def test_concurrency(self):
+        barrier = threading.Barrier(4, timeout=5)
+        lock = threading.Lock()
+        inflight = [0, 0]  # current and maximum number of pages being fetched
+
+        def function(param):
+            with lock:
+                inflight[0] = inflight[0] + 1
+                inflight[1] = max(inflight[1], inflight[0])
+            try:
+                if param.startFrom < 40:
+                    barrier.wait()  # the first four pages are fetched concurrently
+                return param.startFrom < 190, list(range(param.startFrom, param.startFrom + 10))
+            finally:
+                with lock:
+                    inflight[0] = inflight[0] - 1
+
+        self.assertEqual(list(ParallelIterator(function, self._param(10), 4)), list(range(200)))
+        self.assertEqual(inflight[1], 4)
+
+
+class TestIteratorCursor(base.BaseTest):
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._path = os.path.join(self._directory, 'devices.json')
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    @staticmethod
+    def _param(size=10):
+        return query.QueryParamBuilder().countLimit(size).include(['name']).addFilter(query.FilterBuilder('name').like('vGateway')).build()
+
+    def test_cursor(self):
+        iterator = Iterator(Pages(pages=5, size=10), self._param(), 0)
+        self.assertEqual((iterator.cursor.param.startFrom, iterator.cursor.position), (0, 0))
+        for _ in range(25):
+            next(iterator)
+        self.assertEqual((iterator.cursor.param.startFrom, iterator.cursor.position), (20, 5))
+        self.assertEqual(iterator.cursor.param.include, ['name'])
+
+    def test_resume(self):
+        for prefetch in [0, 2]:
+            iterator = Iterator(Pages(pages=5, size=10), self._param(), prefetch)
+            for _ in range(25):
+                next(iterator)
+            cursor = fromjsonstr(tojsonstr(iterator.cursor, no_log=False))
+            function = Pages(pages=5, size=10)
+            self.assertEqual(list(Iterator(function, self._param(), prefetch).resume(cursor)), list(range(25, 50)))
+            self.assertEqual(function.requests, [20, 30, 40])
+
+    def test_resume_page_boundary(self):
+        iterator = Iterator(Pages(pages=3, size=10), self._param(), 0)
+        for _ in range(10):
+            next(iterator)
+        self.assertEqual(list(Iterator(Pages(pages=3, size=10), self._param(), 0).resume(iterator.cursor)), list(range(10, 30)))
+
+    def test_resume_adaptive(self):
+        iterator = Iterator(Pages(pages=5, size=10), self._param(), 0)
+        for _ in range(15):
+            next(iterator)
+        pager = mock.MagicMock(fetch=lambda function, param: function(param))
+        self.assertEqual(list(Iterator(Pages(pages=5, size=10), self._param(), 0, pager).resume(iterator.cursor)), list(range(15, 50)))
+
+    def test_resume_mismatch(self):
+        cursor = Iterator(Pages(pages=5, size=10), self._param(), 0).cursor
+        param = self._param()
+        param.include = ['name', 'portal']
+        with self.assertRaises(exception.CTERAException):
+            Iterator(Pages(pages=5, size=10), param, 0).resume(cursor)
+
+    def test_resume_started(self):
+        iterator = Iterator(Pages(pages=5, size=10), self._param(), 0)
+        next(iterator)
+        with self.assertRaises(exception.CTERAException):
+            iterator.resume(iterator.cursor)
+
+    def test_checkpoint(self):
+        iterator = Iterator(Pages(pages=5, size=10, error=3), self._param(), 0).checkpoint(self._path)
+        objects = []
+        with self.assertRaises(ConnectionError):
+            for o in iterator:
+                objects.append(o)
+        self.assertEqual(objects, list(range(30)))
+        self.assertTrue(os.path.exists(self._path))
+        function = Pages(pages=5, size=10)
+        objects.extend(Iterator(function, self._param(), 0).checkpoint(self._path))
+        self.assertEqual(objects, list(range(50)))
+        self.assertEqual(function.requests[0], 20)  # the last page fetched before the error, already consumed
+        self.assertFalse(os.path.exists(self._path))
+
+    def test_checkpoint_interval(self):
+        iterator = Iterator(Pages(pages=10, size=10), self._param(), 0).checkpoint(self._path, pages=3)
+        for count, expected in [(15, None), (25, 20), (50, 20), (51, 50)]:
+            while iterator.cursor.param.startFrom + iterator.cursor.position < count:
+                next(iterator)
+            if expected is None:
+                self.assertFalse(os.path.exists(self._path))
+            else:
+                with open(self._path, 'r', encoding='utf-8') as f:
+                    self.assertEqual(fromjsonstr(f.read()).param.startFrom, expected)
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+
+from cterasdk.common import Object
+from cterasdk.convert import fromjsonstr, tojsonstr
+from cterasdk.core import query
+from cterasdk.core.logs import Logs
+from cterasdk.lib import Iterator, Keyset
+from tests.ut import base
+
+
+class LogTable:
+    """ Logs ordered by time, filtered by the time filters of the query parameter """
+
+    def __init__(self, times, descending=False):
+        self.descending = descending
+        self.logs = []
+        self.requests = []
+        self.add(times)
+
+    def add(self, times):
+        start = datetime(2024, 1, 1)
+        for seconds in times:
+            log = Object()
+            log.id = len(self.logs)
+            log.time = (start + timedelta(seconds=seconds)).strftime('%Y-%m-%dT%H:%M:%S')
+            self.logs.append(log)
+        self.logs.sort(key=lambda log: (log.time, log.id), reverse=self.descending)
+
+    def __call__(self, param):
+        filters = [f for f in getattr(param, 'filters', []) if f.field == 'time']
+        self.requests.append((param.startFrom, [(f.restriction, f.value) for f in filters]))
+        logs = [log for log in self.logs if all(LogTable._match(log, f) for f in filters)]
+        page = logs[param.startFrom:param.startFrom + param.countLimit]
+        return param.startFrom + param.countLimit < len(logs), page
+
+    @staticmethod
+    def _match(log, f):
+        if f.restriction == query.Restriction.GREATER_EQUALS:
+            return log.time >= f.value
+        return log.time <= f.value
+
+
+class TestKeyset(base.BaseTest):
+
+    @staticmethod
+    def _param(size=3):
+        return query.QueryParamBuilder().countLimit(size).build()
+
+    @staticmethod
+    def _keyset(table, boundary=True):
+        return Keyset(table, Logs._time, Logs._identity, Logs._boundary if boundary else None)  # pylint: disable=protected-access
+
+    def test_ascending(self):
+        table = LogTable([0, 1, 3, 3, 3, 3, 3, 3, 3, 4])
+        ids = [log.id for log in Iterator(self._keyset(table), self._param())]
+        self.assertEqual(ids, [log.id for log in table.logs])
+        self.assertEqual([start for start, _ in table.requests], [0, 1, 4, 7])  # pages of a single time
+        self.assertEqual(table.requests[3], (7, [('ge', '2024-01-01T00:00:03')]))
+
+    def test_descending(self):
+        table = LogTable([0, 1, 2, 3, 4, 5, 6], descending=True)
+        ids = [log.id for log in Iterator(self._keyset(table), self._param())]
+        self.assertEqual(ids, [log.id for log in table.logs])
+        self.assertEqual(table.requests[1], (1, [('le', '2024-01-01T00:00:04')]))
+
+    def test_added_while_iterating(self):
+        table = LogTable([0, 1, 2, 3, 4, 5], descending=True)
+        iterator = Iterator(self._keyset(table, boundary=False), self._param())
+        ids = [next(iterator).id for _ in range(3)]
+        table.add([10, 11])  # shifts the logs returned on the first page to the next page
+        ids.extend(log.id for log in iterator)
+        self.assertEqual(ids, [5, 4, 3, 2, 1, 0])
+
+    def test_added_while_iterating_offset(self):
+        table = LogTable([0, 1, 2, 3, 4, 5], descending=True)
+        iterator = Iterator(table, self._param())
+        ids = [next(iterator).id for _ in range(3)]
+        table.add([10, 11])
+        ids.extend(log.id for log in iterator)
+        self.assertEqual(ids, [5, 4, 3, 4, 3, 2, 1, 0])
+
+    def test_no_key(self):
+        table = LogTable([0, 1, 2, 3, 4])
+        for log in table.logs:
+            log.time = None
+        ids = [log.id for log in Iterator(self._keyset(table), self._param(2))]
+        self.assertEqual(ids, [0, 1, 2, 3, 4])
+        self.assertEqual([start for start, _ in table.requests], [0, 2, 4])
+
+    def test_resume(self):
+        table = LogTable(range(10))
+        iterator = Iterator(self._keyset(table), self._param())
+        ids = [next(iterator).id for _ in range(5)]
+        cursor = fromjsonstr(tojsonstr(iterator.cursor, pretty_print=False, no_log=False))  # as saved to a checkpoint
+        self.assertEqual(cursor.param._keyset.boundary, '2024-01-01T00:00:02')  # pylint: disable=protected-access
+        table.requests.clear()
+        ids.extend(log.id for log in Iterator(self._keyset(table), self._param()).resume(cursor))
+        self.assertEqual(ids, list(range(10)))
+        self.assertEqual(table.requests[0], (1, [('ge', '2024-01-01T00:00:02')]))
@@ -0,0 +1,101 @@
+import time
+from unittest import mock
+
+from cterasdk import config, exception
+from cterasdk.convert import toxmlstr
+from cterasdk.core import query
+from cterasdk.core.files.fetch_resources_param import FetchResourcesParam
+from cterasdk.edge.query import QueryParam
+from cterasdk.lib import Iterator, AdaptivePager
+from tests.ut import base
+
+
+class Collection:
+
+    def __init__(self, total, latency=None, error=None):
+        self.total = total
+        self.latency = latency
+        self.error = error
+        self.requests = []
+
+    def __call__(self, param):
+        self.requests.append((param.startFrom, param.countLimit))
+        error = self.error(param.countLimit) if self.error is not None else None
+        if error is not None:
+            raise error
+        if self.latency is not None:
+            time.sleep(self.latency(param.countLimit))
+        end = min(param.startFrom + param.countLimit, self.total)
+        return end < self.total, list(range(param.startFrom, end))
+
+
+class TestAdaptivePager(base.BaseTest):
+
+    @staticmethod
+    def _param(size=50):
+        return query.QueryParamBuilder().countLimit(size).build()
+
+    def test_grow(self):
+        pager = AdaptivePager(target=1, maximum=400)
+        function = Collection(2000)
+        self.assertEqual(list(Iterator(function, self._param(), 0, pager)), list(range(2000)))
+        self.assertEqual([size for _, size in function.requests[:5]], [50, 100, 200, 400, 400])
+        self.assertEqual(pager.size, 400)
+
+    def test_shrink(self):
+        pager = AdaptivePager(target=0.01, minimum=10, initial=100)
+        function = Collection(300, latency=lambda size: 0.02 if size > 25 else 0)
+        self.assertEqual(list(Iterator(function, self._param(), 0, pager)), list(range(300)))
+        self.assertEqual([size for _, size in function.requests[:3]], [100, 50, 25])
+
+    def test_timeout(self):
+        pager = AdaptivePager(initial=400)
+        function = Collection(500, error=lambda size: exception.ConnectionTimeout('Timed out', 20) if size > 100 else None)
+        self.assertEqual(list(Iterator(function, self._param(), 0, pager)), list(range(500)))
+        self.assertEqual(function.requests[:3], [(0, 400), (0, 200), (0, 100)])
+        self.assertEqual(pager.snapshot().timeouts, 2)
+        self.assertEqual(pager.size, 100)  # does not grow back to a size that timed out
+
+    def test_gateway_timeout(self):
+        gateway_timeout = exception.CTERAClientException()
+        gateway_timeout.response = mock.MagicMock(code=504)
+        pager = AdaptivePager(initial=40, minimum=10)
+        function = mock.MagicMock(side_effect=[gateway_timeout, (False, [1])])
+        self.assertEqual(list(Iterator(function, self._param(), 0, pager)), [1])
+        self.assertEqual(pager.snapshot().timeouts, 1)
+        self.assertEqual(pager.snapshot().latencies[0][0], 20)
+
+    def test_error(self):
+        forbidden = exception.CTERAClientException()
+        forbidden.response = mock.MagicMock(code=403)
+        with self.assertRaises(exception.CTERAClientException):
+            list(Iterator(mock.MagicMock(side_effect=forbidden), self._param(), 0, AdaptivePager()))
+        with self.assertRaises(exception.ConnectionTimeout):
+            timeout = exception.ConnectionTimeout('Timed out', 20)
+            list(Iterator(mock.MagicMock(side_effect=timeout), self._param(), 0, AdaptivePager(initial=10, minimum=10)))
+
+    def test_snapshot(self):
+        pager = AdaptivePager(target=1, maximum=100)
+        list(Iterator(Collection(250), self._param(), 0, pager))
+        snapshot = pager.snapshot()
+        self.assertEqual(snapshot.size, 100)
+        self.assertEqual(snapshot.pages, 3)
+        self.assertEqual([size for size, _ in snapshot.latencies], [50, 100, 100])
+
+    def test_prefetch(self):
+        pager = AdaptivePager(target=1, maximum=400)
+        self.assertEqual(list(Iterator(Collection(2000), self._param(), 2, pager)), list(range(2000)))
+
+    def test_config(self):
+        with mock.patch.dict(config.iterator, {'pager': dict(config.iterator['pager'], enabled=True, maximum=200)}):
+            iterator = Iterator(Collection(10), self._param())
+            self.assertEqual(iterator.pager.maximum, 200)
+        self.assertIsNone(Iterator(Collection(10), self._param()).pager)
+
+    def test_page_size(self):
+        for cls, field in [(query.QueryParams, 'countLimit'), (QueryParam, 'countLimit'), (FetchResourcesParam, 'limit')]:
+            param, expected = cls(), cls()
+            param.page_size = 250
+            setattr(expected, field, 250)
+            self.assertEqual(param.page_size, 250)
+            self.assertEqual(toxmlstr(param), toxmlstr(expected))
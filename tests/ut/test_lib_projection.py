@@ -0,0 +1,54 @@
+from unittest import mock
+
+from cterasdk import config
+from cterasdk.common import Object
+from cterasdk.core import query
+from cterasdk.lib import Projection
+from cterasdk.object import GlobalAdmin
+from tests.ut import base
+
+
+class TestProjection(base.BaseTest):
+
+    def test_fields(self):
+        projection = Projection(['email', 'retentionPolicy/daily', 'retentionPolicy/weekly'], ['name'])
+        self.assertEqual(projection.include, ['email', 'retentionPolicy', 'name'])
+        self.assertEqual(projection.paths, ['/email', '/retentionPolicy/daily', '/retentionPolicy/weekly', '/name'])
+
+    def test_warn(self):
+        user = Object()
+        user.name = 'alice'
+        with mock.patch.dict(config.projection, {'warn': True}):
+            Projection(['name']).enforce([user])
+        with mock.patch('logging.Logger.warning') as warning:
+            self.assertEqual(user.name, 'alice')
+            self.assertFalse(hasattr(user, 'email'))
+            warning.assert_called_once_with('Attribute was not retrieved. %s', {'attribute': 'email'})
+
+    def test_no_warn(self):
+        user = Object()
+        self.assertIs(Projection(['name']).enforce(user), user)
+        self.assertIs(type(user), Object)
+
+    def test_get(self):
+        admin = GlobalAdmin('')
+        admin.get_multi = mock.MagicMock(return_value=Object())
+        admin._ctera_client.get = mock.MagicMock()  # pylint: disable=protected-access
+        with mock.patch.object(GlobalAdmin, '_is_authenticated', return_value=True):
+            admin.get('/users/alice', include=['email', 'name'])
+            admin.get('/users/alice')
+        admin.get_multi.assert_called_once_with('/users/alice', ['/email', '/name'], use_file_url=False)
+        admin._ctera_client.get.assert_called_once()  # pylint: disable=protected-access
+
+    def test_query(self):
+        response = Object()
+        response.hasMore = False
+        response.objects = [Object()]
+        host = mock.MagicMock()
+        host.db.return_value = response
+        param = query.QueryParamBuilder().include(['name']).build()
+        with mock.patch.dict(config.projection, {'warn': True}):
+            _, objects = query.query(host, '/users', param)
+        with mock.patch('logging.Logger.warning') as warning:
+            self.assertFalse(hasattr(objects[0], 'email'))
+            warning.assert_called_once()
@@ -0,0 +1,428 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import requests.exceptions as requests_exceptions
+
+from cterasdk.common import Object
+from cterasdk.exception import CTERAException, CTERAClientException, LocalDirectoryNotFound, LocalFileNotFound
+from cterasdk.lib.filesystem import FileSystem
+from cterasdk.lib.transfer import TreeDownload, TreeUpload, SegmentedDownload, Journal, retry, transient, timestamp
+from tests.ut import base
+
+
+def server_error(code):
+    """ Client exception for an HTTP error response """
+    error = CTERAClientException()
+    error.response = Object()
+    error.response.code = code
+    return error
+
+
+class Stream:
+    """ Streamed response """
+
+    def __init__(self, content, status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i: i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class Remote:
+    """ Remote files, opened by source path """
+
+    def __init__(self, files, errors=None):
+        self.files = files
+        self.errors = errors or {}
+        self.opened = []
+        self.lock = threading.Lock()
+
+    def __call__(self, source):
+        with self.lock:
+            self.opened.append(source)
+        if source in self.errors:
+            raise self.errors[source]
+        return Stream(self.files[source])
+
+
+class TestTreeDownload(base.BaseTest):
+
+    mtime = 'Tue, 15 Nov 1994 08:12:31 GMT'
+
+    def setUp(self):
+        super().setUp()
+        self._destination = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._destination)
+        super().tearDown()
+
+    @staticmethod
+    def _entry(path, folder=False, size=None, lastmodified=None):
+        entry = Object()
+        entry.path = path
+        entry.source = path
+        entry.isFolder = folder
+        entry.size = size
+        entry.lastmodified = lastmodified
+        return entry
+
+    def _entries(self, remote):
+        entries = [self._entry('docs', folder=True), self._entry('docs/empty', folder=True)]
+        for path, content in remote.files.items():
+            entries.append(self._entry(path, size=len(content), lastmodified=TestTreeDownload.mtime))
+        return entries
+
+    def test_download(self):
+        remote = Remote({'a.txt': b'a' * 100000, 'docs/b.txt': b'b' * 10, 'docs/c.txt': b''})
+        report = TreeDownload(remote, self._destination, concurrency=3).run(self._entries(remote))
+        self.assertEqual((report.directories, report.files, report.skipped, report.bytes), (2, 3, 0, 100010))
+        self.assertEqual(report.failed, [])
+        self.assertTrue(os.path.isdir(os.path.join(self._destination, 'docs', 'empty')))
+        for path, content in remote.files.items():
+            target = os.path.join(self._destination, path)
+            with open(target, 'rb') as f:
+                self.assertEqual(f.read(), content)
+            self.assertEqual(os.stat(target).st_mtime, timestamp(TestTreeDownload.mtime))
+        self.assertEqual(sorted(os.listdir(os.path.join(self._destination, 'docs'))), ['b.txt', 'c.txt', 'empty'])
+
+    def test_skip_unchanged(self):
+        remote = Remote({'a.txt': b'aaa', 'docs/b.txt': b'bbb'})
+        TreeDownload(remote, self._destination).run(self._entries(remote))
+        remote.files['docs/b.txt'] = b'bbbb'
+        remote.opened = []
+        report = TreeDownload(remote, self._destination).run(self._entries(remote))
+        self.assertEqual((report.files, report.skipped), (1, 1))
+        self.assertEqual(remote.opened, ['docs/b.txt'])
+
+    def test_failure_isolation(self):
+        remote = Remote({'a.txt': b'aaa', 'docs/b.txt': b'bbb'}, errors={'a.txt': CTERAClientException()})
+        report = TreeDownload(remote, self._destination, concurrency=2).run(self._entries(remote))
+        self.assertEqual(report.files, 1)
+        self.assertEqual([(failure.path, type(failure.error)) for failure in report.failed], [('a.txt', CTERAClientException)])
+        self.assertEqual(os.listdir(self._destination), ['docs'])
+
+    def test_outside_destination(self):
+        remote = Remote({'../escape.txt': b'x'})
+        report = TreeDownload(remote, self._destination).run([self._entry('../escape.txt', size=1)])
+        self.assertEqual(report.files, 0)
+        self.assertEqual(len(report.failed), 1)
+        self.assertEqual(remote.opened, [])
+
+    def test_bandwidth(self):
+        remote = Remote({'a.txt': b'a' * 200000, 'b.txt': b'b' * 200000})
+        start = time.monotonic()
+        TreeDownload(remote, self._destination, concurrency=2, bandwidth=1000000).run(self._entries(remote))
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)  # 400KB at 1MB/s, less an initial burst of 65KB
+
+    def test_timestamp(self):
+        self.assertEqual(timestamp('Tue, 15 Nov 1994 08:12:31 GMT'), 784887151)
+        self.assertEqual(timestamp('1994-11-15T08:12:31'), 784887151)
+        self.assertEqual(timestamp(784887151), 784887151)
+        self.assertIsNone(timestamp('yesterday'))
+        self.assertIsNone(timestamp(None))
+
+
+class Destination:
+    """ Remote directory tree, recording created directories and uploaded files """
+
+    def __init__(self, failures=None, errors=None):
+        self.failures = failures or {}
+        self.errors = errors or {}
+        self.directories = []
+        self.recurse = {}
+        self.resolved = []
+        self.uploaded = []
+        self.lock = threading.Lock()
+
+    def mkdir(self, path, recurse):
+        with self.lock:
+            if path in self.errors:
+                raise self.errors[path]
+            if path != '/' and (path.rpartition('/')[0] or '/') not in self.directories:
+                raise CTERAClientException()  # parent does not exist
+            self.directories.append(path)
+            self.recurse[path] = recurse
+
+    def resolve(self, path):
+        with self.lock:
+            self.resolved.append(path)
+        return 'upload:' + path
+
+    def upload(self, local_file, path, address):
+        with self.lock:
+            name = os.path.basename(local_file)
+            if self.failures.get(name):
+                self.failures[name] = self.failures[name] - 1
+                raise server_error(503)
+            self.uploaded.append((path, name, address))
+
+
+class TestTreeUpload(base.BaseTest):
+
+    tree = {
+        'a.txt': b'a',
+        'docs/b.txt': b'bb',
+        'docs/c.txt': b'ccc',
+        'docs/empty/': None,
+        'docs/more/d.txt': b'dddd',
+        'pics/e.jpg': b'eeeee'
+    }
+
+    def setUp(self):
+        super().setUp()
+        self._source = tempfile.mkdtemp()
+        for path, content in TestTreeUpload.tree.items():
+            target = os.path.join(self._source, *path.split('/'))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if content is not None:
+                with open(target, 'wb') as f:
+                    f.write(content)
+        TreeUpload.delay = 0
+
+    def tearDown(self):
+        TreeUpload.delay = 1
+        shutil.rmtree(self._source)
+        super().tearDown()
+
+    @staticmethod
+    def _upload(destination, concurrency=None, retries=None):
+        return TreeUpload(destination.mkdir, destination.resolve, destination.upload, Root(), concurrency, retries)
+
+    def test_upload(self):
+        destination = Destination()
+        report = self._upload(destination, concurrency=4).run(self._source)
+        self.assertEqual(destination.directories[0], '/')
+        self.assertEqual(sorted(destination.directories), ['/', '/docs', '/docs/empty', '/docs/more', '/pics'])
+        self.assertEqual(sorted(destination.resolved), ['/', '/docs', '/docs/more', '/pics'])
+        self.assertEqual(sorted(destination.uploaded), [
+            ('/', 'a.txt', 'upload:/'), ('/docs', 'b.txt', 'upload:/docs'), ('/docs', 'c.txt', 'upload:/docs'),
+            ('/docs/more', 'd.txt', 'upload:/docs/more'), ('/pics', 'e.jpg', 'upload:/pics')
+        ])
+        self.assertEqual((report.directories, report.files, report.bytes, report.retries), (5, 5, 15, 0))
+        self.assertEqual([path for path, recurse in destination.recurse.items() if recurse], ['/'])
+
+    def test_retry(self):
+        destination = Destination(failures={'b.txt': 2, 'e.jpg': 5})
+        report = self._upload(destination, concurrency=2, retries=3).run(self._source)
+        self.assertEqual(report.files, 4)
+        self.assertEqual(report.retries, 5)
+        self.assertEqual([os.path.basename(failure.path) for failure in report.failed], ['e.jpg'])
+
+    def test_directory_failure(self):
+        destination = Destination(errors={'/docs': CTERAClientException()})
+        report = self._upload(destination, concurrency=2).run(self._source)
+        self.assertEqual(sorted(destination.directories), ['/', '/pics'])
+        self.assertEqual(sorted(name for _, name, _ in destination.uploaded), ['a.txt', 'e.jpg'])
+        self.assertEqual([failure.path for failure in report.failed], ['/docs'])
+
+    def test_source_not_found(self):
+        with self.assertRaises(LocalDirectoryNotFound):
+            self._upload(Destination()).run(os.path.join(self._source, 'missing'))
+
+
+class Root(str):
+    """ Remote root directory path """
+
+    def __new__(cls):
+        return super().__new__(cls, '/')
+
+    @staticmethod
+    def joinpath(path):
+        return '/' + path
+
+
+class Ranges:
+    """ Server honoring HTTP range requests """
+
+    def __init__(self, content, ranges=True, drops=None, etag=None):
+        self.content = content
+        self.ranges = ranges
+        self.drops = drops or {}  # bytes to send before closing the connection, by the start of the range
+        self.etag = etag
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def __call__(self, headers):
+        with self.lock:
+            self.requests.append(headers['Range'])
+        start, _, end = headers['Range'][len('bytes='):].partition('-')
+        start, end = int(start), int(end) if end else len(self.content) - 1
+        if not self.ranges:
+            return self._response(200, self.content, {})
+        content_range = 'bytes %d-%d/%d' % (start, end, len(self.content))
+        content = self.content[start: end + 1]
+        with self.lock:
+            if start in self.drops:
+                content = content[:self.drops.pop(start)]
+        return self._response(206, content, {'Content-Range': content_range, 'ETag': self.etag})
+
+    @staticmethod
+    def _response(status, content, headers):
+        return Stream(content, status, headers)
+
+
+class TestSegmentedDownload(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._directory = tempfile.mkdtemp()
+        self._filepath = os.path.join(self._directory, 'image.vmdk')
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+        super().tearDown()
+
+    def _download(self, server, segments, chunk_size=1024, resume=False):
+        download = SegmentedDownload(server, server(SegmentedDownload.first()), segments, chunk_size, resume)
+        download.write(self._filepath)
+        with open(self._filepath, 'rb') as f:
+            return f.read()
+
+    def test_segments(self):
+        content = os.urandom(100003)
+        server = Ranges(content)
+        self.assertEqual(self._download(server, 4), content)
+        self.assertEqual(sorted(server.requests), ['bytes=0-', 'bytes=25001-50001', 'bytes=50002-75002', 'bytes=75003-100002'])
+
+    def test_short_writes(self):
+        content = os.urandom(100003)
+        pwrite = os.pwrite
+        with mock.patch('cterasdk.lib.transfer.os.pwrite', side_effect=lambda fd, data, offset: pwrite(fd, data[:100], offset)):
+            self.assertEqual(self._download(Ranges(content), 4), content)
+
+    def test_ranges_not_supported(self):
+        content = os.urandom(10000)
+        server = Ranges(content, ranges=False)
+        self.assertEqual(self._download(server, 4), content)
+        self.assertEqual(server.requests, ['bytes=0-'])
+
+    def test_small_file(self):
+        server = Ranges(b'small')
+        self.assertEqual(self._download(server, 4), b'small')
+        self.assertEqual(server.requests, ['bytes=0-'])
+
+    def test_range_not_honored(self):
+        server = Ranges(os.urandom(10000))
+
+        def openfile(headers):
+            server.ranges = headers['Range'] == 'bytes=0-'
+            return server(headers)
+
+        with self.assertRaises(CTERAException):
+            FileSystem.instance().save_with(
+                self._directory, 'image.vmdk', SegmentedDownload(openfile, openfile(SegmentedDownload.first()), 4, 1024).write
+            )
+        self.assertEqual(os.listdir(self._directory), [])
+
+    def test_resume(self):
+        content = os.urandom(100000)
+        server = Ranges(content, drops={0: 10000, 50000: 30000}, etag='"v1"')
+        with self.assertRaises(CTERAException):
+            self._download(server, 2, resume=True)
+        journal = Journal.load(self._filepath, len(content), '"v1"')
+        self.assertEqual(journal.completed, [[0, 9999], [50000, 79999]])
+        server.requests = []
+        self.assertEqual(self._download(server, 2, resume=True), content)
+        self.assertEqual(sorted(server.requests), ['bytes=0-', 'bytes=10000-39999', 'bytes=40000-49999', 'bytes=80000-99999'])
+        self.assertEqual(os.listdir(self._directory), ['image.vmdk'])
+
+    def test_resume_changed(self):
+        content = os.urandom(100000)
+        server = Ranges(content, drops={0: 10000}, etag='"v1"')
+        with self.assertRaises(CTERAException):
+            self._download(server, 1, resume=True)
+        content = os.urandom(100000)
+        server = Ranges(content, etag='"v2"')
+        self.assertEqual(self._download(server, 1, resume=True), content)
+        self.assertEqual(server.requests, ['bytes=0-'])
+
+    def test_no_journal(self):
+        server = Ranges(os.urandom(100000), drops={0: 10000})
+        with self.assertRaises(CTERAException):
+            self._download(server, 2)
+        self.assertEqual(os.listdir(self._directory), ['image.vmdk'])
+
+
+class TestJournal(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._directory = tempfile.mkdtemp()
+        self._filepath = os.path.join(self._directory, 'image.vmdk')
+        with open(self._filepath, 'wb') as f:
+            f.truncate(100)
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+        super().tearDown()
+
+    def test_ranges(self):
+        journal = Journal(self._filepath, 100, None)
+        self.assertEqual(journal.missing(), [(0, 99)])
+        journal.add(10, 19)
+        journal.add(40, 49)
+        journal.add(20, 29)
+        self.assertEqual(journal.completed, [[10, 29], [40, 49]])
+        self.assertEqual(journal.missing(), [(0, 9), (30, 39), (50, 99)])
+        self.assertEqual(journal.written, 30)
+        journal.add(0, 99)
+        self.assertTrue(journal.complete)
+        self.assertEqual(journal.missing(), [])
+
+    def test_load(self):
+        journal = Journal(self._filepath, 100, '"v1"')
+        journal.add(0, 49)
+        fd = os.open(self._filepath, os.O_RDWR)
+        try:
+            journal.save(fd)
+        finally:
+            os.close(fd)
+        self.assertEqual(Journal.load(self._filepath, 100, '"v1"').completed, [[0, 49]])
+        self.assertEqual(Journal.load(self._filepath, 100, '"v2"').completed, [])
+        self.assertEqual(Journal.load(self._filepath, 200, '"v1"').completed, [])
+        journal.remove()
+        self.assertEqual(os.listdir(self._directory), ['image.vmdk'])
+
+
+class TestRetry(base.BaseTest):
+
+    def test_retry(self):
+        function = mock.MagicMock(side_effect=[server_error(503), requests_exceptions.ChunkedEncodingError(), 'done'])
+        callback = mock.MagicMock()
+        with mock.patch('cterasdk.lib.transfer.time.sleep') as sleep:
+            self.assertEqual(retry(function, 3, callback=callback), 'done')
+        self.assertEqual(function.call_count, 3)
+        self.assertEqual(callback.call_count, 2)
+        self.assertEqual([call[0][0] for call in sleep.call_args_list], [1, 2])
+
+    def test_exhausted(self):
+        function = mock.MagicMock(side_effect=server_error(429))
+        with mock.patch('cterasdk.lib.transfer.time.sleep'):
+            with self.assertRaises(CTERAClientException):
+                retry(function, 2)
+        self.assertEqual(function.call_count, 3)
+
+    def test_not_transient(self):
+        for error in [server_error(404), server_error(403), CTERAClientException(), LocalFileNotFound('missing.txt'), OSError()]:
+            function = mock.MagicMock(side_effect=error)
+            with self.assertRaises(type(error)):
+                retry(function, 3)
+            self.assertEqual(function.call_count, 1)
+
+    def test_transient(self):
+        self.assertTrue(transient(server_error(500)))
+        self.assertTrue(transient(requests_exceptions.ConnectionError()))
+        self.assertFalse(transient(server_error(400)))
+        self.assertFalse(transient(ConnectionResetError()))